@@ -55,7 +55,7 @@ import json
 import logging
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import DateTime, Index, String, Text, func, select, text, update
+from sqlalchemy import DateTime, Index, String, Text, bindparam, func, select, text, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -176,6 +176,31 @@ class TenantModel(_Base):
         Index("ix_tenants_status_created_at", "status", "created_at"),
     )
 
+    @classmethod
+    def from_domain(cls, tenant: Tenant) -> TenantModel:
+        """Build an unsaved ORM row from a ``Tenant`` domain object.
+
+        Args:
+            tenant: Fully-populated tenant to persist.
+
+        Returns:
+            A transient ``TenantModel`` ready to be added to a session.
+        """
+        return cls(
+            id=tenant.id,
+            identifier=tenant.identifier,
+            name=tenant.name,
+            status=tenant.status.value,
+            isolation_strategy=(
+                tenant.isolation_strategy.value if tenant.isolation_strategy else None
+            ),
+            database_url=tenant.database_url,
+            schema_name=tenant.schema_name,
+            tenant_metadata=json.dumps(tenant.metadata),
+            created_at=tenant.created_at,
+            updated_at=tenant.updated_at,
+        )
+
     def to_domain(self) -> Tenant:
         """Convert this ORM row to an immutable ``Tenant`` domain object.
 
@@ -221,6 +246,24 @@ class TenantModel(_Base):
         )
 
 
+# Prebuilt statements for the hot point lookups.  Reusing one construct per
+# query shape skips rebuilding the ``select()`` on every call, and its compiled
+# form is served from SQLAlchemy's statement cache; values are bound at
+# execution time.
+_SELECT_BY_ID = select(TenantModel).where(TenantModel.id == bindparam("tenant_id"))
+_SELECT_BY_IDENTIFIER = select(TenantModel).where(TenantModel.identifier == bindparam("identifier"))
+_SELECT_BY_IDS = select(TenantModel).where(
+    TenantModel.id.in_(bindparam("tenant_ids", expanding=True))
+)
+_SELECT_ID = select(TenantModel.id).where(TenantModel.id == bindparam("tenant_id"))
+
+# Upper bound on the IDs bound into one ``IN (...)`` list.  Older SQLite
+# builds cap a statement at 999 host parameters, and very long IN lists plan
+# poorly on every backend, so larger ``get_by_ids`` and
+# ``bulk_update_status`` calls run in chunks.
+_IN_CHUNK_SIZE = 500
+
+
 ########################
 # Store implementation #
 ########################
@@ -321,7 +364,7 @@ class SQLAlchemyTenantStore(TenantStore[Tenant]):
             TenantNotFoundError: When no tenant with *tenant_id* exists.
         """
         async with self._session_factory() as session, session.begin():
-            row = await session.execute(select(TenantModel).where(TenantModel.id == tenant_id))
+            row = await session.execute(_SELECT_BY_ID, {"tenant_id": tenant_id})
             model = row.scalar_one_or_none()
         if model is None:
             raise TenantNotFoundError(identifier=tenant_id)
@@ -340,9 +383,7 @@ class SQLAlchemyTenantStore(TenantStore[Tenant]):
             TenantNotFoundError: When no tenant with *identifier* exists.
         """
         async with self._session_factory() as session, session.begin():
-            row = await session.execute(
-                select(TenantModel).where(TenantModel.identifier == identifier)
-            )
+            row = await session.execute(_SELECT_BY_IDENTIFIER, {"identifier": identifier})
             model = row.scalar_one_or_none()
         if model is None:
             raise TenantNotFoundError(identifier=identifier)
@@ -398,9 +439,7 @@ class SQLAlchemyTenantStore(TenantStore[Tenant]):
             Existence flag.
         """
         async with self._session_factory() as session, session.begin():
-            result = await session.execute(
-                select(TenantModel.id).where(TenantModel.id == tenant_id)
-            )
+            result = await session.execute(_SELECT_ID, {"tenant_id": tenant_id})
             return result.scalar_one_or_none() is not None
 
     ####################
@@ -422,20 +461,7 @@ class SQLAlchemyTenantStore(TenantStore[Tenant]):
         """
         try:
             async with self._session_factory() as session:
-                model = TenantModel(
-                    id=tenant.id,
-                    identifier=tenant.identifier,
-                    name=tenant.name,
-                    status=tenant.status.value,
-                    isolation_strategy=(
-                        tenant.isolation_strategy.value if tenant.isolation_strategy else None
-                    ),
-                    database_url=tenant.database_url,
-                    schema_name=tenant.schema_name,
-                    tenant_metadata=json.dumps(tenant.metadata),
-                    created_at=tenant.created_at,
-                    updated_at=tenant.updated_at,
-                )
+                model = TenantModel.from_domain(tenant)
 
                 try:
                     async with session.begin():
@@ -476,9 +502,7 @@ class SQLAlchemyTenantStore(TenantStore[Tenant]):
         async with self._session_factory() as session:
             try:
                 async with session.begin():
-                    result = await session.execute(
-                        select(TenantModel).where(TenantModel.id == tenant.id)
-                    )
+                    result = await session.execute(_SELECT_BY_ID, {"tenant_id": tenant.id})
                     model = result.scalar_one_or_none()
                     if model is None:
                         raise TenantNotFoundError(identifier=tenant.id)  # noqa: TRY301
@@ -522,9 +546,7 @@ class SQLAlchemyTenantStore(TenantStore[Tenant]):
             async with self._session_factory() as session:
                 try:
                     async with session.begin():
-                        result = await session.execute(
-                            select(TenantModel).where(TenantModel.id == tenant_id)
-                        )
+                        result = await session.execute(_SELECT_BY_ID, {"tenant_id": tenant_id})
                         model = result.scalar_one_or_none()
                         if not model:
                             raise TenantNotFoundError(identifier=tenant_id)  # noqa: TRY301
@@ -557,9 +579,7 @@ class SQLAlchemyTenantStore(TenantStore[Tenant]):
         async with self._session_factory() as session:
             try:
                 async with session.begin():
-                    result = await session.execute(
-                        select(TenantModel).where(TenantModel.id == tenant_id)
-                    )
+                    result = await session.execute(_SELECT_BY_ID, {"tenant_id": tenant_id})
                     model = result.scalar_one_or_none()
                     if model is None:
                         raise TenantNotFoundError(identifier=tenant_id)  # noqa: TRY301
@@ -723,9 +743,7 @@ class SQLAlchemyTenantStore(TenantStore[Tenant]):
                     # Re-fetch the full row inside the same transaction so
                     # to_domain() sees the committed values without an extra
                     # round-trip.
-                    fetch = await session.execute(
-                        select(TenantModel).where(TenantModel.id == updated_id)
-                    )
+                    fetch = await session.execute(_SELECT_BY_ID, {"tenant_id": updated_id})
                     model = fetch.scalar_one_or_none()
 
                 if model is None:  # pragma: no cover — RETURNING guarantees existence
@@ -799,7 +817,7 @@ class SQLAlchemyTenantStore(TenantStore[Tenant]):
             # row, preventing the lost-update race condition.
             # execution_options must be applied before any DML is issued.
             await session.connection(execution_options={"isolation_level": "SERIALIZABLE"})
-            result = await session.execute(select(TenantModel).where(TenantModel.id == tenant_id))
+            result = await session.execute(_SELECT_BY_ID, {"tenant_id": tenant_id})
             model = result.scalar_one_or_none()
             if model is None:
                 raise TenantNotFoundError(identifier=tenant_id)
@@ -816,10 +834,48 @@ class SQLAlchemyTenantStore(TenantStore[Tenant]):
     # Override: DB-level batch operations #
     #######################################
 
+    async def create_many(self, tenants: Any) -> Sequence[Tenant]:
+        """Insert several tenants in a single transaction.
+
+        Overrides the N+1 base implementation.  SQLAlchemy batches the rows
+        into multi-row ``INSERT`` statements, and the whole batch is rolled
+        back if any row violates a uniqueness constraint.
+
+        Args:
+            tenants: Fully-populated tenant objects.
+
+        Returns:
+            The stored tenants, in input order.
+
+        Raises:
+            ValueError: When an ``id`` or ``identifier`` already exists.
+            TenancyError: On unexpected storage failure.
+        """
+        models = [TenantModel.from_domain(tenant) for tenant in tenants]
+        if not models:
+            return []
+        try:
+            async with self._session_factory() as session:
+                try:
+                    async with session.begin():
+                        session.add_all(models)
+                        await session.flush()
+                except IntegrityError:
+                    msg = "One or more tenant ids or identifiers already exist."
+                    raise ValueError(msg) from None
+                logger.info("Created %d tenants", len(models))
+                return [model.to_domain() for model in models]
+        except ValueError:
+            raise
+        except Exception as exc:
+            raise TenancyError(f"Failed to create tenants: {exc}") from exc
+
     async def get_by_ids(self, tenant_ids: Any) -> Sequence[Tenant]:
         """Fetch multiple tenants in a single query using ``IN`` clause.
 
-        Overrides the base implementation to avoid N+1 queries.
+        Overrides the base implementation to avoid N+1 queries.  Duplicate IDs
+        are collapsed, and more than ``_IN_CHUNK_SIZE`` IDs are split across
+        several ``IN`` queries inside one transaction.
 
         Args:
             tenant_ids: Iterable of opaque tenant IDs.
@@ -827,12 +883,16 @@ class SQLAlchemyTenantStore(TenantStore[Tenant]):
         Returns:
             Found tenants (order is not guaranteed).
         """
-        ids = list(tenant_ids)
+        ids = list(dict.fromkeys(tenant_ids))
         if not ids:
             return []
+        found: list[Tenant] = []
         async with self._session_factory() as session, session.begin():
-            result = await session.execute(select(TenantModel).where(TenantModel.id.in_(ids)))
-            return [m.to_domain() for m in result.scalars().all()]
+            for start in range(0, len(ids), _IN_CHUNK_SIZE):
+                chunk = ids[start : start + _IN_CHUNK_SIZE]
+                result = await session.execute(_SELECT_BY_IDS, {"tenant_ids": chunk})
+                found.extend(m.to_domain() for m in result.scalars())
+        return found
 
     async def search(
         self,
@@ -885,7 +945,12 @@ class SQLAlchemyTenantStore(TenantStore[Tenant]):
     ) -> Sequence[Tenant]:
         """Update status for multiple tenants in a single ``UPDATE ... WHERE IN`` query.
 
-        Overrides the N+1 base implementation.
+        Overrides the N+1 base implementation.  On backends that support
+        ``UPDATE … RETURNING`` the updated rows come back from that same
+        statement, so the whole batch costs one round-trip.  Like
+        :meth:`get_by_ids`, more than ``_IN_CHUNK_SIZE`` IDs are split across
+        several statements inside one transaction, all stamped with the same
+        ``updated_at``.
 
         Args:
             tenant_ids: IDs of the tenants to update.
@@ -894,32 +959,36 @@ class SQLAlchemyTenantStore(TenantStore[Tenant]):
         Returns:
             Updated tenants.
         """
-        ids = list(tenant_ids)
+        ids = list(dict.fromkeys(tenant_ids))
         if not ids:
             return []
         now = datetime.now(UTC)
+        updated: list[Tenant] = []
         async with self._session_factory() as session, session.begin():
-            # ``UPDATE … RETURNING`` is only supported on PostgreSQL (and
-            # MariaDB 10.5+).  For other dialects we fall back to a SELECT
-            # after the UPDATE so the method stays dialect-agnostic.
-            # Use self._dialect (stored at __init__) — session.bind is
-            # deprecated in SQLAlchemy 2.0 and returns None with AsyncSession.
-            if self._dialect == DbDialect.POSTGRESQL:
-                result = await session.execute(
+            # ``UPDATE … RETURNING`` is supported by PostgreSQL, SQLite 3.35+
+            # and SQL Server (as ``OUTPUT``); SQLAlchemy reports it per
+            # connected server through ``dialect.update_returning``.  For
+            # other backends (MySQL) we fall back to a SELECT after the
+            # UPDATE so the method stays dialect-agnostic.
+            # Use self._engine — session.bind is deprecated in SQLAlchemy 2.0
+            # and returns None with AsyncSession.
+            returning = self._engine.dialect.update_returning
+            for start in range(0, len(ids), _IN_CHUNK_SIZE):
+                chunk = ids[start : start + _IN_CHUNK_SIZE]
+                stmt = (
                     update(TenantModel)
-                    .where(TenantModel.id.in_(ids))
+                    .where(TenantModel.id.in_(chunk))
                     .values(status=status.value, updated_at=now)
-                    .returning(TenantModel)
                 )
-                return [m.to_domain() for m in result.scalars().all()]
-            # Fallback path: plain UPDATE then SELECT.
-            await session.execute(
-                update(TenantModel)
-                .where(TenantModel.id.in_(ids))
-                .values(status=status.value, updated_at=now)
-            )
-            fetch = await session.execute(select(TenantModel).where(TenantModel.id.in_(ids)))
-            return [m.to_domain() for m in fetch.scalars().all()]
+                if returning:
+                    result = await session.execute(stmt.returning(TenantModel))
+                    updated.extend(m.to_domain() for m in result.scalars())
+                    continue
+                # Fallback path: plain UPDATE then SELECT.
+                await session.execute(stmt)
+                fetch = await session.execute(_SELECT_BY_IDS, {"tenant_ids": chunk})
+                updated.extend(m.to_domain() for m in fetch.scalars())
+        return updated
 
 
 __all__ = ["SQLAlchemyTenantStore", "TenantModel"]
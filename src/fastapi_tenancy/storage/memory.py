@@ -14,20 +14,43 @@ Design notes
   to satisfy the ``TenantStore`` interface.  This keeps tests fast.
 - O(1) lookups: ``_tenants`` (id → Tenant) and ``_identifier_map``
   (identifier → id) are plain dicts — constant-time reads.
-- Sorted list: ``list()`` sorts in-memory by ``created_at`` descending to
-  mirror the SQLAlchemy store's ``ORDER BY created_at DESC`` behaviour.
+- Search keys: ``_search_keys`` (id → lowercased identifier and name) is
+  maintained on every write, so ``search()`` does not lowercase every tenant
+  on every query.
+- Trigram index: ``_trigrams`` maps every three-character substring of those
+  keys to the IDs containing it.  Queries of three or more characters only
+  check the intersection of their trigrams' ID sets instead of every tenant.
+- Sorted list: ``list()`` returns tenants by ``created_at`` descending to
+  mirror the SQLAlchemy store's ``ORDER BY created_at DESC`` behaviour.  The
+  order is kept in ``_order``, a list maintained with :mod:`bisect` on every
+  write, so a page is a reverse walk of ``skip + limit`` entries rather than
+  a sort of the whole store.
+- Status index: ``_status_order`` holds, per status, the same sorted keys as
+  ``_order``.  Every write that adds, removes or re-statuses a tenant keeps
+  it in step, so ``list(status=...)`` walks only that status's tenants and
+  ``count(status=...)`` / ``statistics()`` are ``len()`` calls.
 - Thread / task safety: all mutating methods acquire ``_lock`` before
   touching shared state.  Although asyncio tasks run on a single OS thread,
   the ``anyio`` backend (Trio) is also declared in dev dependencies, and Trio
   does allow true concurrent mutations across ``await`` points.  Using a lock
   is cheap and makes correctness assumptions explicit.
+- Lock-free reads: read methods never take ``_lock``.  Each is a handful of
+  dict lookups with no ``await`` in between, and writers publish a fully-built
+  (frozen) ``Tenant`` with a single dict assignment, so a reader sees either
+  the old or the new record, never a partial one.
 """
 
 from __future__ import annotations
 
 import asyncio
+import bisect
+from collections import defaultdict
 from datetime import UTC, datetime
+import heapq
+import itertools
 import logging
+from operator import itemgetter
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from fastapi_tenancy.core.exceptions import TenantNotFoundError
@@ -35,21 +58,37 @@ from fastapi_tenancy.core.types import Tenant, TenantStatus
 from fastapi_tenancy.storage.tenant_store import TenantStore
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Mapping, Sequence
 
 logger = logging.getLogger(__name__)
 
 
+def _trigrams_of(*keys: str) -> set[str]:
+    """Return every three-character substring of *keys*."""
+    return {key[i : i + 3] for key in keys for i in range(len(key) - 2)}
+
+
+def _utcnow() -> datetime:
+    """Return the current UTC time; the store's single clock, patchable in tests."""
+    return datetime.now(UTC)
+
+
 class InMemoryTenantStore(TenantStore[Tenant]):
     """In-memory tenant store for testing and local development.
 
-    All state lives in two Python dictionaries:
+    ``_tenants`` (``tenant_id → Tenant``) holds the records; every mutating
+    method keeps these indices in sync with it:
 
-    - ``_tenants`` — maps ``tenant_id → Tenant``
-    - ``_identifier_map`` — maps ``identifier → tenant_id``
+    - ``_identifier_map`` — ``identifier → tenant_id``
+    - ``_search_keys`` — ``tenant_id → (identifier, name)``, lowercased
+    - ``_trigrams`` — trigram of a search key → IDs containing it
+    - ``_order`` — ``(created_at, -insertion_seq, tenant_id)`` keys, sorted
+    - ``_order_keys`` — ``tenant_id →`` its key in ``_order``
+    - ``_status_order`` — status → the sorted keys of tenants with it
 
-    Both indices are kept in sync by every mutating method so that
-    ``get_by_id`` and ``get_by_identifier`` are always O(1).
+    ``get_by_id`` and ``get_by_identifier`` are O(1); a ``list()`` page walks
+    ``skip + limit`` keys; ``count()`` and ``statistics()`` are ``len()``
+    calls; ``search()`` scans only the IDs sharing the query's trigrams.
 
     Example — pytest fixture::
 
@@ -76,6 +115,19 @@ class InMemoryTenantStore(TenantStore[Tenant]):
         """Initialise an empty in-memory store."""
         self._tenants: dict[str, Tenant] = {}
         self._identifier_map: dict[str, str] = {}  # identifier → tenant_id
+        # tenant_id → (identifier.lower(), name.lower()) for search().
+        self._search_keys: dict[str, tuple[str, str]] = {}
+        # trigram → IDs whose search keys contain it; see _trigrams_of().
+        self._trigrams: defaultdict[str, set[str]] = defaultdict(set)
+        # Ascending (created_at, -insertion_seq, tenant_id) keys; list() walks
+        # it backwards, giving newest first with ties in insertion order.
+        self._order: list[tuple[datetime, int, str]] = []
+        self._order_keys: dict[str, tuple[datetime, int, str]] = {}
+        self._insertion_seq = itertools.count()
+        # status → the subset of _order with that status, in the same order.
+        self._status_order: defaultdict[TenantStatus, list[tuple[datetime, int, str]]] = (
+            defaultdict(list)
+        )
         # Protects all mutating operations.  Read-only methods (get_by_id,
         # list, count, etc.) do not acquire the lock — they are pure dict
         # reads, which are already atomic in CPython.  Under Trio or any
@@ -139,11 +191,10 @@ class InMemoryTenantStore(TenantStore[Tenant]):
         Returns:
             Filtered and paginated list of tenants.
         """
-        tenants = list(self._tenants.values())
-        if status is not None:
-            tenants = [t for t in tenants if t.status == status]
-        tenants.sort(key=lambda t: t.created_at, reverse=True)
-        return tenants[skip : skip + limit]
+        keys = self._order if status is None else self._status_order.get(status, [])
+        tenants = self._tenants
+        ordered = (tenants[tid] for _, _, tid in reversed(keys))
+        return list(itertools.islice(ordered, skip, skip + limit))
 
     async def count(self, status: TenantStatus | None = None) -> int:
         """Return the number of stored tenants, optionally filtered by status.
@@ -156,7 +207,7 @@ class InMemoryTenantStore(TenantStore[Tenant]):
         """
         if status is None:
             return len(self._tenants)
-        return sum(1 for t in self._tenants.values() if t.status == status)
+        return len(self._status_order.get(status, ()))
 
     async def exists(self, tenant_id: str) -> bool:
         """Return ``True`` when a tenant with *tenant_id* exists.
@@ -180,7 +231,8 @@ class InMemoryTenantStore(TenantStore[Tenant]):
         Returns:
             Found tenants in the order their IDs appeared.
         """
-        return [self._tenants[tid] for tid in tenant_ids if tid in self._tenants]
+        tenants = self._tenants
+        return [t for tid in tenant_ids if (t := tenants.get(tid)) is not None]
 
     ####################
     # Write operations #
@@ -199,18 +251,93 @@ class InMemoryTenantStore(TenantStore[Tenant]):
             ValueError: When ``id`` or ``identifier`` already exists.
         """
         async with self._lock:
-            if tenant.id in self._tenants:
-                msg = f"Tenant id={tenant.id!r} already exists."
-                raise ValueError(msg)
-            if tenant.identifier in self._identifier_map:
-                msg = f"Tenant identifier={tenant.identifier!r} already exists."
-                raise ValueError(msg)
-
-            self._tenants[tenant.id] = tenant
-            self._identifier_map[tenant.identifier] = tenant.id
+            self._insert(tenant)
         logger.debug("Created tenant id=%s identifier=%s", tenant.id, tenant.identifier)
         return tenant
 
+    async def create_many(self, tenants: Iterable[Tenant]) -> Sequence[Tenant]:
+        """Persist several new tenants under a single lock acquisition.
+
+        Args:
+            tenants: Fully-populated tenant objects.
+
+        Returns:
+            The stored tenants, in input order.
+
+        Raises:
+            ValueError: When an ``id`` or ``identifier`` already exists.
+                Tenants inserted before the duplicate remain in the store.
+        """
+        created: list[Tenant] = []
+        async with self._lock:
+            for tenant in tenants:
+                self._insert(tenant)
+                created.append(tenant)
+        logger.debug("Created %d tenants", len(created))
+        return created
+
+    def _insert(self, tenant: Tenant) -> None:
+        """Add *tenant* to both indices after checking uniqueness.
+
+        Contains no ``await``, so it cannot interleave with other tasks;
+        async callers still hold ``_lock`` around it for their wider
+        read-check-mutate sequence.
+
+        Raises:
+            ValueError: When ``id`` or ``identifier`` already exists.
+        """
+        if tenant.id in self._tenants:
+            msg = f"Tenant id={tenant.id!r} already exists."
+            raise ValueError(msg)
+        if tenant.identifier in self._identifier_map:
+            msg = f"Tenant identifier={tenant.identifier!r} already exists."
+            raise ValueError(msg)
+
+        self._tenants[tenant.id] = tenant
+        self._identifier_map[tenant.identifier] = tenant.id
+        self._index_search(tenant)
+        self._reorder((tenant.created_at, -next(self._insertion_seq), tenant.id), tenant.status)
+
+    def _index_search(self, tenant: Tenant) -> None:
+        """Record *tenant*'s lowercased search keys and their trigrams."""
+        keys = (tenant.identifier.lower(), tenant.name.lower())
+        self._search_keys[tenant.id] = keys
+        for gram in _trigrams_of(*keys):
+            self._trigrams[gram].add(tenant.id)
+
+    def _unindex_search(self, tenant_id: str) -> None:
+        """Drop *tenant_id* from ``_search_keys`` and ``_trigrams``."""
+        keys = self._search_keys.pop(tenant_id, None)
+        if keys is None:
+            return
+        for gram in _trigrams_of(*keys):
+            ids = self._trigrams[gram]
+            ids.discard(tenant_id)
+            if not ids:
+                del self._trigrams[gram]
+
+    def _reorder(self, key: tuple[datetime, int, str], status: TenantStatus) -> None:
+        """Insert sort *key* into ``_order`` and the *status* bucket."""
+        bisect.insort(self._order, key)
+        bisect.insort(self._status_order[status], key)
+        self._order_keys[key[2]] = key
+
+    def _unorder(self, tenant_id: str, status: TenantStatus) -> tuple[datetime, int, str]:
+        """Remove *tenant_id* from ``_order`` and its *status* bucket; return its key."""
+        key = self._order_keys.pop(tenant_id)
+        del self._order[bisect.bisect_left(self._order, key)]
+        bucket = self._status_order[status]
+        del bucket[bisect.bisect_left(bucket, key)]
+        return key
+
+    def _restatus(self, tenant_id: str, old: TenantStatus, new: TenantStatus) -> None:
+        """Move *tenant_id*'s key from the *old* status bucket to *new*."""
+        if old != new:
+            key = self._order_keys[tenant_id]
+            bucket = self._status_order[old]
+            del bucket[bisect.bisect_left(bucket, key)]
+            bisect.insort(self._status_order[new], key)
+
     async def update(self, tenant: Tenant) -> Tenant:
         """Replace all mutable fields of an existing tenant.
 
@@ -235,8 +362,16 @@ class InMemoryTenantStore(TenantStore[Tenant]):
                 del self._identifier_map[old.identifier]
                 self._identifier_map[tenant.identifier] = tenant.id
 
-            updated = tenant.model_copy(update={"updated_at": datetime.now(UTC)})
+            updated = tenant.model_copy(update={"updated_at": _utcnow()})
             self._tenants[tenant.id] = updated
+            if (old.identifier, old.name) != (tenant.identifier, tenant.name):
+                self._unindex_search(tenant.id)
+                self._index_search(tenant)
+            if old.created_at != tenant.created_at:
+                _, seq, _ = self._unorder(tenant.id, old.status)
+                self._reorder((tenant.created_at, seq, tenant.id), tenant.status)
+            else:
+                self._restatus(tenant.id, old.status, tenant.status)
         logger.debug("Updated tenant id=%s", tenant.id)
         return updated
 
@@ -256,6 +391,8 @@ class InMemoryTenantStore(TenantStore[Tenant]):
 
             del self._identifier_map[tenant.identifier]
             del self._tenants[tenant_id]
+            self._unindex_search(tenant_id)
+            self._unorder(tenant_id, tenant.status)
         logger.debug("Deleted tenant id=%s", tenant_id)
 
     async def set_status(self, tenant_id: str, status: TenantStatus) -> Tenant:
@@ -275,8 +412,9 @@ class InMemoryTenantStore(TenantStore[Tenant]):
             tenant = self._tenants.get(tenant_id)
             if tenant is None:
                 raise TenantNotFoundError(identifier=tenant_id)
-            updated = tenant.model_copy(update={"status": status, "updated_at": datetime.now(UTC)})
+            updated = tenant.model_copy(update={"status": status, "updated_at": _utcnow()})
             self._tenants[tenant_id] = updated
+            self._restatus(tenant_id, tenant.status, status)
         logger.debug("Set tenant %s status → %s", tenant_id, status.value)
         return updated
 
@@ -304,7 +442,7 @@ class InMemoryTenantStore(TenantStore[Tenant]):
             updated = tenant.model_copy(
                 update={
                     "metadata": {**tenant.metadata, **metadata},
-                    "updated_at": datetime.now(UTC),
+                    "updated_at": _utcnow(),
                 }
             )
             self._tenants[tenant_id] = updated
@@ -328,7 +466,7 @@ class InMemoryTenantStore(TenantStore[Tenant]):
         Returns:
             Updated tenants in the order their IDs appeared.
         """
-        timestamp = datetime.now(UTC)
+        timestamp = _utcnow()
         updated: list[Tenant] = []
         async with self._lock:
             for tid in tenant_ids:
@@ -336,6 +474,7 @@ class InMemoryTenantStore(TenantStore[Tenant]):
                 if tenant is not None:
                     result = tenant.model_copy(update={"status": status, "updated_at": timestamp})
                     self._tenants[tid] = result
+                    self._restatus(tid, tenant.status, status)
                     updated.append(result)
         logger.debug("Bulk updated %d tenants → %s", len(updated), status.value)
         return updated
@@ -357,29 +496,67 @@ class InMemoryTenantStore(TenantStore[Tenant]):
         Args:
             query: Case-insensitive search string.
             limit: Maximum number of results to return.
-            _scan_limit: Accepted for interface compatibility; all records scanned.
+            _scan_limit: Accepted for interface compatibility; ignored.
 
         Returns:
             Matching tenants sorted by relevance, up to *limit* results.
+            Ties keep insertion order.
         """
         q = query.lower()
-        matches = [
-            t for t in self._tenants.values() if q in t.identifier.lower() or q in t.name.lower()
-        ]
-        matches.sort(
-            key=lambda t: (
-                t.identifier.lower() == q,
-                t.identifier.lower().startswith(q),
-                q in t.name.lower(),
-            ),
-            reverse=True,
-        )
-        return matches[:limit]
+        order_keys = self._order_keys
+        scored: list[tuple[tuple[bool, bool, bool, int], str]] = []
+        for tid in self._search_candidates(q):
+            identifier, name = self._search_keys[tid]
+            in_name = q in name
+            if in_name or q in identifier:
+                # order_keys[tid][1] is the negated insertion sequence, so
+                # among equal scores the earliest-inserted tenant ranks first.
+                rank = (identifier == q, identifier.startswith(q), in_name, order_keys[tid][1])
+                scored.append((rank, tid))
+        top = heapq.nlargest(limit, scored, key=itemgetter(0))
+        return [self._tenants[tid] for _, tid in top]
+
+    def _search_candidates(self, q: str) -> Iterable[str]:
+        """Return the IDs whose search keys may contain *q*.
+
+        Queries shorter than a trigram fall back to every tenant; longer ones
+        intersect the ID sets of their trigrams, smallest first.  Candidates
+        are a superset of the matches — :meth:`search` still checks each one.
+        """
+        grams = _trigrams_of(q)
+        if not grams:
+            return self._search_keys.keys()
+        sets = sorted((self._trigrams.get(gram, set()) for gram in grams), key=len)
+        return sets[0].intersection(*sets[1:])
 
     ########################
     # Test / debug helpers #
     ########################
 
+    def populate(self, tenants: Iterable[Tenant]) -> None:
+        """Synchronously seed the store with *tenants*.
+
+        Applies the same uniqueness checks as :meth:`create` but skips the
+        coroutine and lock round-trip, so fixtures can build a seeded store
+        without an event loop::
+
+            @pytest.fixture
+            def store():
+                store = InMemoryTenantStore()
+                store.populate([acme, globex])
+                return store
+
+        Args:
+            tenants: Fully-populated tenant objects.
+
+        Raises:
+            ValueError: When an ``id`` or ``identifier`` already exists.
+                Tenants inserted before the duplicate remain in the store.
+        """
+        for tenant in tenants:
+            self._insert(tenant)
+        logger.debug("Populated InMemoryTenantStore; total=%d", len(self._tenants))
+
     def clear(self) -> None:
         """Remove all tenants from both internal indices.
 
@@ -394,16 +571,23 @@ class InMemoryTenantStore(TenantStore[Tenant]):
         """
         self._tenants.clear()
         self._identifier_map.clear()
+        self._search_keys.clear()
+        self._trigrams.clear()
+        self._order.clear()
+        self._order_keys.clear()
+        self._status_order.clear()
         logger.debug("InMemoryTenantStore cleared")
 
-    def get_all(self) -> dict[str, Tenant]:
-        """Return a shallow-copy snapshot of all stored tenants keyed by ID.
+    def get_all(self) -> Mapping[str, Tenant]:
+        """Return a read-only view of all stored tenants keyed by ID.
+
+        The view is live and costs O(1) regardless of store size; wrap it in
+        ``dict(...)`` for a point-in-time snapshot.
 
         Returns:
-            ``{tenant_id: Tenant}`` dict.  Mutating it does not affect
-            the store.
+            ``{tenant_id: Tenant}`` mapping proxy.  It cannot be mutated.
         """
-        return dict(self._tenants)
+        return MappingProxyType(self._tenants)
 
     def statistics(self) -> dict[str, Any]:
         """Return a summary of current store state for monitoring and debugging.
@@ -414,13 +598,9 @@ class InMemoryTenantStore(TenantStore[Tenant]):
                 - ``by_status``: count per status value.
                 - ``identifier_index_size``: should always equal ``total``.
         """
-        by_status: dict[str, int] = {}
-        for tenant in self._tenants.values():
-            by_status[tenant.status.value] = by_status.get(tenant.status.value, 0) + 1
-
         return {
             "total": len(self._tenants),
-            "by_status": by_status,
+            "by_status": {s.value: len(keys) for s, keys in self._status_order.items() if keys},
             "identifier_index_size": len(self._identifier_map),
         }
 
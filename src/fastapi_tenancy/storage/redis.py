@@ -46,7 +46,9 @@ Pydantic-managed types round-trip without loss.
 Cache invalidation
 ------------------
 Bulk invalidation uses ``SCAN`` with a count hint rather than ``KEYS`` to
-avoid blocking the Redis event loop on large keyspaces.
+avoid blocking the Redis event loop on large keyspaces, and removes matched
+keys with ``UNLINK`` in fixed-size batches so memory is reclaimed in a
+background thread on the server.
 
 Optimisation for ``update()``
 ------------------------------
@@ -75,6 +77,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: Keys requested per ``SCAN`` step and removed per ``UNLINK`` call in
+#: :meth:`RedisTenantStore.invalidate_all`.
+_INVALIDATE_BATCH_SIZE = 500
+
 
 def _require_redis() -> Any:
     """Import ``redis.asyncio`` and raise ``ImportError`` with an actionable message on miss."""
@@ -215,6 +221,31 @@ class RedisTenantStore(TenantStore[Tenant]):
                 exc,
             )
 
+    async def _cache_set_many(self, tenants: Sequence[Tenant]) -> None:
+        """Write both cache keys for every tenant in one Redis pipeline.
+
+        Failures are logged and swallowed, exactly as in :meth:`_cache_set`.
+
+        Args:
+            tenants: The tenants to cache.
+        """
+        if not tenants:
+            return
+        try:
+            pipe = self._redis.pipeline()
+            for tenant in tenants:
+                serialised = self._serialize(tenant)
+                pipe.setex(self._id_key(tenant.id), self._ttl, serialised)
+                pipe.setex(self._slug_key(tenant.identifier), self._ttl, serialised)
+            await pipe.execute()
+            logger.debug("Cached %d tenants ttl=%ds", len(tenants), self._ttl)
+        except Exception as exc:
+            logger.warning(
+                "Cache write failed for %d tenants: %s — operating without cache",
+                len(tenants),
+                exc,
+            )
+
     async def _cache_invalidate(self, tenant_id: str, identifier: str) -> None:
         """Delete both cache keys for a tenant in a single ``DEL`` command.
 
@@ -468,7 +499,8 @@ class RedisTenantStore(TenantStore[Tenant]):
     async def get_by_ids(self, tenant_ids: Iterable[str]) -> Sequence[Tenant]:
         """Fetch multiple tenants — cache hits served first; misses delegated.
 
-        Uses a Redis pipeline to batch all cache lookups into one round-trip.
+        Uses a Redis pipeline to batch all cache lookups into one round-trip,
+        and a second one to write back any tenants fetched from the primary.
         The returned list preserves the **same order as** *tenant_ids*: IDs
         that are not found in the cache or primary store are silently omitted.
 
@@ -503,19 +535,38 @@ class RedisTenantStore(TenantStore[Tenant]):
 
         if miss_ids:
             fetched = await self._primary.get_by_ids(miss_ids)
+            await self._cache_set_many(fetched)
             for tenant in fetched:
-                await self._cache_set(tenant)
                 tenant_map[tenant.id] = tenant
 
         # Return in original input order, skipping IDs not found anywhere.
         return [tenant_map[tid] for tid in ids if tid in tenant_map]
 
+    async def create_many(self, tenants: Iterable[Tenant]) -> Sequence[Tenant]:
+        """Create several tenants in primary, then cache them in one pipeline.
+
+        Args:
+            tenants: Fully-populated tenant objects.
+
+        Returns:
+            Stored tenants, in input order.
+
+        Raises:
+            ValueError: When an ``id`` or ``identifier`` already exists.
+        """
+        created = await self._primary.create_many(tenants)
+        await self._cache_set_many(created)
+        logger.info("Created and cached %d tenants", len(created))
+        return created
+
     async def bulk_update_status(
         self,
         tenant_ids: Iterable[str],
         status: TenantStatus,
     ) -> Sequence[Tenant]:
-        """Update status for multiple tenants and invalidate their cache entries.
+        """Update status for multiple tenants and refresh their cache entries.
+
+        The refreshed entries are written back in a single pipeline.
 
         Args:
             tenant_ids: IDs of tenants to update.
@@ -528,8 +579,7 @@ class RedisTenantStore(TenantStore[Tenant]):
         if not ids:
             return []
         updated = await self._primary.bulk_update_status(ids, status)
-        for tenant in updated:
-            await self._cache_set(tenant)
+        await self._cache_set_many(updated)
         return updated
 
     ####################
@@ -540,20 +590,27 @@ class RedisTenantStore(TenantStore[Tenant]):
         """Delete every cache key owned by this store.
 
         Uses ``SCAN`` with a count hint rather than ``KEYS`` to avoid
-        blocking the Redis event loop on large keyspaces.
+        blocking the Redis event loop on large keyspaces.  Matched keys are
+        removed with ``UNLINK`` (non-blocking ``DEL``) every
+        ``_INVALIDATE_BATCH_SIZE`` keys, so neither the client-side key list
+        nor a single command grows with the keyspace.
 
         Returns:
             Number of Redis keys deleted.
         """
         pattern = f"{self._prefix}:*"
-        keys: list[bytes] = []
-        async for key in self._redis.scan_iter(match=pattern, count=100):
-            keys.append(key)
-        if keys:
-            deleted: int = await self._redis.delete(*keys)
+        deleted = 0
+        batch: list[bytes] = []
+        async for key in self._redis.scan_iter(match=pattern, count=_INVALIDATE_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= _INVALIDATE_BATCH_SIZE:
+                deleted += await self._redis.unlink(*batch)
+                batch.clear()
+        if batch:
+            deleted += await self._redis.unlink(*batch)
+        if deleted:
             logger.info("Invalidated %d cache entries (pattern=%s)", deleted, pattern)
-            return deleted
-        return 0
+        return deleted
 
     async def cache_stats(self) -> dict[str, Any]:
         """Return lightweight cache statistics.
@@ -20,9 +20,9 @@ subclass while still satisfying the base interface::
 Extending
 ---------
 Subclass ``TenantStore[Tenant]`` (or your own domain model) and implement
-every ``@abstractmethod``.  The batch operations (``get_by_ids``, ``search``,
-``bulk_update_status``) have base implementations but are worth overriding
-for production backends to avoid N+1 queries::
+every ``@abstractmethod``.  The batch operations (``create_many``,
+``get_by_ids``, ``search``, ``bulk_update_status``) have base implementations
+but are worth overriding for production backends to avoid N+1 queries::
 
     class MyStore(TenantStore[Tenant]):
         async def get_by_id(self, tenant_id: str) -> Tenant: ...
@@ -32,6 +32,7 @@ for production backends to avoid N+1 queries::
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any, Generic
 
@@ -45,6 +46,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: Most ``get_by_id`` calls the base ``get_by_ids`` keeps in flight at once,
+#: so a large ID list cannot drain a pooled backend's connections.
+_GET_BY_IDS_BATCH_SIZE = 10
+
 
 class TenantStore(ABC, Generic[TenantT]):
     """Abstract base class for tenant metadata storage backends.
@@ -255,26 +260,61 @@ class TenantStore(ABC, Generic[TenantT]):
                 await self._engine.dispose()
         """
 
+    async def create_many(self, tenants: Iterable[TenantT]) -> Sequence[TenantT]:
+        """Persist several new tenants in one logical call.
+
+        The base implementation calls ``create`` once per tenant and is not
+        atomic: tenants created before a failure remain stored.
+        **Override for production backends** to insert the batch in a single
+        statement.
+
+        Args:
+            tenants: Fully-populated ``TenantT`` instances with unique ``id``
+                and ``identifier`` values.
+
+        Returns:
+            The stored tenants, in input order.
+
+        Raises:
+            ValueError: When an ``id`` or ``identifier`` already exists.
+            TenancyError: On unexpected storage failure.
+        """
+        return [await self.create(tenant) for tenant in tenants]
+
     async def get_by_ids(self, tenant_ids: Iterable[str]) -> Sequence[TenantT]:
         """Fetch multiple tenants by their IDs in one logical call.
 
-        The base implementation issues one ``get_by_id`` call per ID.
-        **Override this for production backends** to issue a single query.
+        The base implementation runs one ``get_by_id`` call per ID, awaiting
+        them concurrently in batches of ``_GET_BY_IDS_BATCH_SIZE`` with
+        :func:`asyncio.gather`, so ``get_by_id`` must be safe to await
+        concurrently.  **Override this for production backends** to issue a
+        single query.
 
         Args:
             tenant_ids: Iterable of opaque tenant IDs.
 
         Returns:
-            Tenants that were found; IDs with no matching tenant are silently
-            skipped.
+            Tenants that were found, in input order; IDs with no matching
+            tenant are silently skipped.
+
+        Raises:
+            Exception: The first error other than ``TenantNotFoundError``
+                raised by ``get_by_id``.  Later batches are not started.
         """
-        result: list[TenantT] = []
-        for tid in tenant_ids:
-            try:
-                result.append(await self.get_by_id(tid))
-            except TenantNotFoundError:
-                continue
-        return result
+        ids = list(tenant_ids)
+        found: list[TenantT] = []
+        for start in range(0, len(ids), _GET_BY_IDS_BATCH_SIZE):
+            results = await asyncio.gather(
+                *(self.get_by_id(tid) for tid in ids[start : start + _GET_BY_IDS_BATCH_SIZE]),
+                return_exceptions=True,
+            )
+            for r in results:
+                if isinstance(r, TenantNotFoundError):
+                    continue
+                if isinstance(r, BaseException):
+                    raise r
+                found.append(r)
+        return found
 
     async def search(
         self,
@@ -22,11 +22,17 @@ API.  Do not import it from application code.
 
 from __future__ import annotations
 
+from functools import lru_cache
 import re
 
 __all__ = ["core_sanitize_identifier"]
 
+# Any run of characters outside ``[a-z0-9]`` — hyphens, dots, underscores and
+# everything else — collapses to a single underscore in one pass.
+_NON_IDENT_RUN_RE = re.compile(r"[^a-z0-9]+")
 
+
+@lru_cache(maxsize=4096)
 def core_sanitize_identifier(identifier: str) -> str:
     """Convert an arbitrary string to a safe, lowercase PostgreSQL identifier.
 
@@ -41,6 +47,9 @@ def core_sanitize_identifier(identifier: str) -> str:
         7. Truncate to 63 characters (PostgreSQL identifier limit).
         8. Fall back to ``"tenant"`` for empty results.
 
+    The function is pure, so results are memoised per identifier: a tenant
+    seen on every request pays for the regex pass only once.
+
     Args:
         identifier: Raw input string (e.g. a tenant slug or UUID).
 
@@ -53,9 +62,7 @@ def core_sanitize_identifier(identifier: str) -> str:
         core_sanitize_identifier("2fast")       # "t_2fast"
         core_sanitize_identifier("A B C")       # "a_b_c"
     """
-    s = identifier.lower().replace("-", "_").replace(".", "_")
-    s = re.sub(r"[^a-z0-9_]", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
+    s = _NON_IDENT_RUN_RE.sub("_", identifier.lower()).strip("_")
     if s and not s[0].isalpha():
         s = f"t_{s}"
     return (s or "tenant")[:63]
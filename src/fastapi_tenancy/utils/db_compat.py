@@ -31,7 +31,7 @@ can import without creating circular dependency chains.
 from __future__ import annotations
 
 from enum import StrEnum
-import re
+from functools import lru_cache
 
 from fastapi_tenancy.utils._sanitize import (
     core_sanitize_identifier as _sanitize_identifier,
@@ -78,8 +78,6 @@ _DIALECT_MAP: dict[str, DbDialect] = {
     "mssql+aioodbc": DbDialect.MSSQL,
 }
 
-_SCHEME_RE = re.compile(r"^([a-z][a-z0-9+]*?)://", re.IGNORECASE)
-
 
 def detect_dialect(database_url: str) -> DbDialect:
     """Infer the ``DbDialect`` from a SQLAlchemy connection URL.
@@ -101,16 +99,29 @@ def detect_dialect(database_url: str) -> DbDialect:
         detect_dialect("sqlite+aiosqlite:///./test.db")
         # → DbDialect.SQLITE
     """
-    match = _SCHEME_RE.match(database_url.lower().strip())
-    if not match:
+    # Lowercase only the scheme, not the whole URL with its credentials.
+    scheme, sep, _ = database_url.lstrip().partition("://")
+    if not sep:
         return DbDialect.UNKNOWN
-    return _DIALECT_MAP.get(match.group(1), DbDialect.UNKNOWN)
+    return _DIALECT_MAP.get(scheme.lower(), DbDialect.UNKNOWN)
 
 
 #########################
 # Capability predicates #
 #########################
 
+# Capability sets and per-dialect SQL, resolved with a single hash lookup.
+_NATIVE_SCHEMA_DIALECTS: frozenset[DbDialect] = frozenset({DbDialect.POSTGRESQL, DbDialect.MSSQL})
+_NATIVE_RLS_DIALECTS: frozenset[DbDialect] = frozenset({DbDialect.POSTGRESQL})
+_STATIC_POOL_DIALECTS: frozenset[DbDialect] = frozenset({DbDialect.SQLITE})
+
+_SET_TENANT_SQL: dict[DbDialect, str] = {
+    DbDialect.POSTGRESQL: "SET LOCAL app.current_tenant = :tenant_id",
+}
+_SCHEMA_SET_SQL: dict[DbDialect, str] = {
+    DbDialect.POSTGRESQL: "SET LOCAL search_path TO {schema}, public",
+}
+
 
 def supports_native_schemas(dialect: DbDialect) -> bool:
     """Return ``True`` if *dialect* supports ``CREATE SCHEMA`` + search path.
@@ -129,7 +140,7 @@ def supports_native_schemas(dialect: DbDialect) -> bool:
         supports_native_schemas(DbDialect.POSTGRESQL)  # True
         supports_native_schemas(DbDialect.SQLITE)      # False
     """
-    return dialect in (DbDialect.POSTGRESQL, DbDialect.MSSQL)
+    return dialect in _NATIVE_SCHEMA_DIALECTS
 
 
 def supports_native_rls(dialect: DbDialect) -> bool:
@@ -144,7 +155,7 @@ def supports_native_rls(dialect: DbDialect) -> bool:
     Returns:
         ``True`` only for ``POSTGRESQL``.
     """
-    return dialect == DbDialect.POSTGRESQL
+    return dialect in _NATIVE_RLS_DIALECTS
 
 
 def requires_static_pool(dialect: DbDialect) -> bool:
@@ -161,7 +172,7 @@ def requires_static_pool(dialect: DbDialect) -> bool:
     Returns:
         ``True`` only for ``SQLITE``.
     """
-    return dialect == DbDialect.SQLITE
+    return dialect in _STATIC_POOL_DIALECTS
 
 
 def get_set_tenant_sql(dialect: DbDialect) -> str | None:
@@ -184,9 +195,7 @@ def get_set_tenant_sql(dialect: DbDialect) -> str | None:
           RLS policies referencing ``current_setting('app.current_tenant')``.
         - **MySQL / MSSQL / SQLite** — no equivalent; use explicit WHERE.
     """
-    if dialect == DbDialect.POSTGRESQL:
-        return "SET LOCAL app.current_tenant = :tenant_id"
-    return None
+    return _SET_TENANT_SQL.get(dialect)
 
 
 def get_schema_set_sql(dialect: DbDialect) -> str | None:
@@ -205,9 +214,7 @@ def get_schema_set_sql(dialect: DbDialect) -> str | None:
         the SQL protocol.  Callers must validate the schema name with
         ``assert_safe_schema_name`` before interpolating it as a literal.
     """
-    if dialect == DbDialect.POSTGRESQL:
-        return "SET LOCAL search_path TO {schema}, public"
-    return None
+    return _SCHEMA_SET_SQL.get(dialect)
 
 
 ######################
@@ -219,12 +226,15 @@ def get_schema_set_sql(dialect: DbDialect) -> str | None:
 # that previously existed between this module and utils.validation.
 
 
+@lru_cache(maxsize=4096)
 def make_table_prefix(tenant_identifier: str) -> str:
     """Build a safe table-name prefix for dialects without native schema support.
 
     Used by ``SchemaIsolationProvider`` in prefix mode (SQLite, unknown dialects).
     The prefix is kept short so that ``prefix + table_name`` fits within the
-    63-character identifier limit common to most SQL databases.
+    63-character identifier limit common to most SQL databases.  Results are
+    memoised per identifier, since the isolation provider asks for the same
+    prefix on every request for a tenant.
 
     Args:
         tenant_identifier: The tenant's slug (e.g. ``"acme-corp"``).
@@ -30,11 +30,35 @@ Public API
 
 from __future__ import annotations
 
+from functools import lru_cache
 import hashlib
+import hmac
+import re
 import secrets
 import string
 from typing import Any
 
+_API_KEY_ALPHABET = string.ascii_letters + string.digits
+# Largest multiple of the alphabet size that fits in a byte; bytes at or above
+# it are rejected so ``byte % 62`` stays uniform.
+_API_KEY_BYTE_LIMIT = 256 - 256 % len(_API_KEY_ALPHABET)
+
+# Keyword substrings that mark a dictionary key as sensitive by default.
+_DEFAULT_SENSITIVE_KEYS: tuple[str, ...] = (
+    "password",
+    "secret",
+    "token",
+    "api_key",
+    "apikey",
+    "database_url",
+    "connection_string",
+    "private_key",
+    "access_token",
+    "refresh_token",
+    "encryption_key",
+    "jwt_secret",
+)
+
 
 def generate_tenant_id(prefix: str = "tenant") -> str:
     """Generate a cryptographically secure, URL-safe opaque tenant ID.
@@ -64,6 +88,8 @@ def generate_api_key(length: int = 32) -> str:
 
     The output alphabet is ``[A-Za-z0-9]`` with 62 characters, giving
     approximately ``log2(62^32) ≈ 190`` bits of entropy for the default length.
+    Random bytes are drawn in bulk and mapped onto the alphabet by rejection
+    sampling, so every character stays uniformly distributed.
 
     Args:
         length: Number of characters in the key.  Minimum recommended: 32.
@@ -76,8 +102,17 @@ def generate_api_key(length: int = 32) -> str:
         generate_api_key()    # "Xy3mPq7nRt2kLs9..."  (32 chars)
         generate_api_key(64)  # 64-character key
     """
-    alphabet = string.ascii_letters + string.digits
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    chars: list[str] = []
+    while len(chars) < length:
+        # One CSPRNG read per round, oversized so the ~3% of rejected bytes
+        # almost never force a second round.
+        missing = length - len(chars)
+        chars.extend(
+            _API_KEY_ALPHABET[b % len(_API_KEY_ALPHABET)]
+            for b in secrets.token_bytes(missing + missing // 8 + 8)
+            if b < _API_KEY_BYTE_LIMIT
+        )
+    return "".join(chars[:length])
 
 
 def generate_secret_key(byte_length: int = 64) -> str:
@@ -119,21 +154,28 @@ def generate_verification_token(byte_length: int = 32) -> str:
     return secrets.token_urlsafe(byte_length)
 
 
-def constant_time_compare(value1: str, value2: str) -> bool:
+def constant_time_compare(value1: str | bytes, value2: str | bytes) -> bool:
     """Compare two strings in constant time to prevent timing attacks.
 
     This is the correct primitive for comparing API keys, HMAC digests, and
     other secrets.  A naive ``==`` comparison short-circuits on the first
     differing byte, leaking information about partial matches.
 
+    ``str`` arguments are UTF-8 encoded first: ``hmac.compare_digest`` only
+    accepts ASCII-only strings and raises ``TypeError`` on anything else.
+
     Args:
-        value1: First string.
-        value2: Second string.
+        value1: First string or bytes value.
+        value2: Second string or bytes value.
 
     Returns:
-        ``True`` when both strings are identical.
+        ``True`` when both values are identical.
     """
-    return secrets.compare_digest(value1, value2)
+    if isinstance(value1, str):
+        value1 = value1.encode("utf-8")
+    if isinstance(value2, str):
+        value2 = value2.encode("utf-8")
+    return hmac.compare_digest(value1, value2)
 
 
 def hash_value(value: str, salt: str | None = None) -> str:
@@ -151,8 +193,11 @@ def hash_value(value: str, salt: str | None = None) -> str:
         hash_value("my-api-key")
         hash_value("my-api-key", salt="random-salt-string")
     """
-    payload = f"{salt}{value}" if salt else value
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    digest = hashlib.sha256()
+    if salt:
+        digest.update(salt.encode("utf-8"))
+    digest.update(value.encode("utf-8"))
+    return digest.hexdigest()
 
 
 def mask_sensitive_data(
@@ -181,30 +226,23 @@ def mask_sensitive_data(
         mask_sensitive_data({"username": "alice", "password": "s3cr3t"})
         # → {"username": "alice", "password": "***MASKED***"}
     """
-    if sensitive_keys is None:
-        sensitive_keys = [
-            "password",
-            "secret",
-            "token",
-            "api_key",
-            "apikey",
-            "database_url",
-            "connection_string",
-            "private_key",
-            "access_token",
-            "refresh_token",
-            "encryption_key",
-            "jwt_secret",
-        ]
-
+    keywords = _DEFAULT_SENSITIVE_KEYS if sensitive_keys is None else tuple(sensitive_keys)
     result = dict(data)
+    if not keywords:
+        return result
+    pattern = _sensitive_key_pattern(keywords)
     for key in result:
-        key_lower = key.lower()
-        if any(sensitive in key_lower for sensitive in sensitive_keys):
+        if pattern.search(key.lower()):
             result[key] = mask
     return result
 
 
+@lru_cache(maxsize=32)
+def _sensitive_key_pattern(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile *keywords* into one substring-alternation pattern, cached per set."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
 __all__ = [
     "constant_time_compare",
     "generate_api_key",
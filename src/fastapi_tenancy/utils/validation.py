@@ -7,9 +7,12 @@ defence against SQL injection via tenant slugs and schema names.
 
 Security model
 --------------
-- Input length is capped *before* the regex runs to prevent ReDoS attacks
-  on pathologically long strings.
-- All patterns are compiled once at module load time.
+- Input length is capped *before* any backtracking-prone regex runs to
+  prevent ReDoS attacks on pathologically long strings.  Slugs and
+  identifiers are gated on their exact length bounds, and e-mail addresses on
+  the RFC 5321 path limit, so out-of-range input never reaches the regex engine.
+- All patterns are compiled once at module load time and applied with
+  ``fullmatch`` — a trailing newline can never slip past a ``$`` anchor.
 - ``assert_safe_schema_name`` and ``assert_safe_database_name`` raise
   immediately on invalid input — never silently truncate or sanitise.
   Callers that *want* sanitisation should use ``sanitize_identifier``.
@@ -17,7 +20,6 @@ Security model
 
 from __future__ import annotations
 
-import json
 import re
 from typing import Any
 
@@ -29,20 +31,28 @@ from fastapi_tenancy.utils._sanitize import core_sanitize_identifier
 
 # Tenant slug: lowercase letter → 1-61 letters/digits/hyphens → alphanumeric.
 # Total length: 3-63 characters.
-_TENANT_ID_RE = re.compile(r"^[a-z][a-z0-9\-]{1,61}[a-z0-9]$")
+_TENANT_ID_RE = re.compile(r"[a-z][a-z0-9\-]{1,61}[a-z0-9]", re.ASCII)
+_TENANT_ID_MIN_LEN: int = 3
+_TENANT_ID_MAX_LEN: int = 63
 
 # PostgreSQL/SQLite/MySQL identifier: lowercase letter or underscore,
 # then up to 62 letters/digits/underscores — max 63 characters.
-_PG_IDENT_RE = re.compile(r"^[a-z_][a-z0-9_]{0,62}$")
+_PG_IDENT_RE = re.compile(r"[a-z_][a-z0-9_]{0,62}", re.ASCII)
+_PG_IDENT_MAX_LEN: int = 63
 
 # Simple e-mail pattern (not RFC 5321 complete — intentionally conservative).
-_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$")
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}", re.ASCII)
 
 # HTTP/HTTPS URL.
-_URL_RE = re.compile(r"^https?://[a-zA-Z0-9.\-]+(:[0-9]{1,5})?(/.*)?$")
+_URL_RE = re.compile(r"https?://[a-zA-Z0-9.\-]+(:[0-9]{1,5})?(/.*)?", re.ASCII)
 
-# Hard cap applied before any regex to prevent ReDoS.
-_MAX_INPUT_LEN: int = 512
+# RFC 5321 path limit (256 octets less the enclosing angle brackets).  Applied
+# before ``_EMAIL_RE``, whose domain part can backtrack on long input.
+_EMAIL_MAX_LEN: int = 254
+
+# Leaf types (and dict key types) the stdlib ``json`` encoder accepts;
+# ``bool`` is covered by ``int``.
+_JSON_SCALARS = (str, int, float, type(None))
 
 
 ##########################
@@ -60,8 +70,8 @@ def validate_tenant_identifier(identifier: str) -> bool:
         - Ends with a lowercase ASCII letter or digit.
         - Contains only lowercase letters, digits, and hyphens in between.
 
-    The length is checked *before* the regular expression to prevent ReDoS
-    on adversarially crafted inputs.
+    The length bounds are checked *before* the regular expression, so
+    adversarially long inputs never reach the regex engine.
 
     Args:
         identifier: The value to validate.
@@ -76,11 +86,11 @@ def validate_tenant_identifier(identifier: str) -> bool:
         validate_tenant_identifier("a")           # False  (too short)
         validate_tenant_identifier("-bad")        # False  (starts with hyphen)
     """
-    if not identifier or not isinstance(identifier, str):
+    if not isinstance(identifier, str):
         return False
-    if len(identifier) > _MAX_INPUT_LEN:
+    if not _TENANT_ID_MIN_LEN <= len(identifier) <= _TENANT_ID_MAX_LEN:
         return False
-    return bool(_TENANT_ID_RE.match(identifier))
+    return _TENANT_ID_RE.fullmatch(identifier) is not None
 
 
 #####################################
@@ -105,9 +115,9 @@ def validate_schema_name(schema_name: str) -> bool:
     """
     if not schema_name or not isinstance(schema_name, str):
         return False
-    if len(schema_name) > _MAX_INPUT_LEN:
+    if len(schema_name) > _PG_IDENT_MAX_LEN:
         return False
-    return bool(_PG_IDENT_RE.match(schema_name))
+    return _PG_IDENT_RE.fullmatch(schema_name) is not None
 
 
 def validate_database_name(database_name: str) -> bool:
@@ -225,6 +235,9 @@ def sanitize_identifier(identifier: str) -> str:
 def validate_email(email: str) -> bool:
     """Return ``True`` if *email* matches a basic e-mail pattern.
 
+    Addresses longer than 254 characters (the RFC 5321 limit) are rejected
+    before the pattern runs.
+
     Args:
         email: The string to validate.
 
@@ -233,7 +246,14 @@ def validate_email(email: str) -> bool:
     """
     if not email or not isinstance(email, str):
         return False
-    return bool(_EMAIL_RE.match(email))
+    if len(email) > _EMAIL_MAX_LEN:
+        return False
+    # Cheap pre-filter: the pattern needs a non-empty local part before the
+    # "@" and a dot somewhere after it.
+    at = email.find("@", 1)
+    if at < 0 or "." not in email[at + 1 :]:
+        return False
+    return _EMAIL_RE.fullmatch(email) is not None
 
 
 def validate_url(url: str) -> bool:
@@ -247,24 +267,50 @@ def validate_url(url: str) -> bool:
     """
     if not url or not isinstance(url, str):
         return False
-    return bool(_URL_RE.match(url))
+    if not url.startswith(("http://", "https://")):
+        return False
+    return _URL_RE.fullmatch(url) is not None
 
 
 def validate_json_serializable(value: Any) -> bool:
     """Return ``True`` if *value* can be serialised to JSON without error.
 
+    Walks the value and checks types instead of calling ``json.dumps``, so no
+    JSON text is built and the walk stops at the first unsupported leaf.
+
     Args:
         value: Any Python value.
 
     Returns:
-        ``True`` when ``json.dumps`` succeeds without error.
+        ``True`` when ``json.dumps`` would succeed without error.
     """
-    try:
-        json.dumps(value)
-    except (TypeError, ValueError):
-        return False
-    else:
+    return _is_json_value(value, set())
+
+
+def _is_json_value(value: Any, active: set[int]) -> bool:
+    """Type-check *value* the way the default ``json`` encoder would.
+
+    *active* holds the ids of the containers on the current path; meeting one
+    again is a circular reference, which ``json.dumps`` rejects.
+    """
+    if isinstance(value, _JSON_SCALARS):
         return True
+    if isinstance(value, dict):
+        if not all(isinstance(key, _JSON_SCALARS) for key in value):
+            return False
+        items: Any = value.values()
+    elif isinstance(value, (list, tuple)):
+        items = value
+    else:
+        return False
+    marker = id(value)
+    if marker in active:
+        return False
+    active.add(marker)
+    try:
+        return all(_is_json_value(item, active) for item in items)
+    finally:
+        active.discard(marker)
 
 
 __all__ = [
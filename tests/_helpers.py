@@ -0,0 +1,8 @@
+"""Constants shared across the fastapi-tenancy test packages."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+#: Default timestamp for test-built tenants; fixed so builds skip the clock.
+NOW: datetime = datetime(2024, 1, 1, tzinfo=UTC)
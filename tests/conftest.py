@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import asyncio
 from typing import TYPE_CHECKING, Any
-import uuid
 
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
@@ -18,11 +17,27 @@ from fastapi_tenancy.manager import TenancyManager
 from fastapi_tenancy.middleware.tenancy import TenancyMiddleware
 from fastapi_tenancy.storage.database import SQLAlchemyTenantStore
 from fastapi_tenancy.storage.memory import InMemoryTenantStore
+from tests._helpers import NOW
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Callable
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the async suite on uvloop when it is installed.
+
+    uvloop is not available on Windows, so the default policy is kept there
+    and whenever the import fails.
+    """
+    try:
+        import uvloop  # noqa: PLC0415
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    policy: asyncio.AbstractEventLoopPolicy = uvloop.EventLoopPolicy()
+    return policy
+
+
 @pytest.fixture
 def tenant_factory() -> Callable[..., Any]:
     """Return a factory that produces unique Tenant objects."""
@@ -39,16 +54,15 @@ def tenant_factory() -> Callable[..., Any]:
     ) -> Tenant:
         counter[0] += 1
         n = counter[0]
-        ts = datetime.now(UTC)
-        return Tenant(
-            id=tenant_id or f"t-{uuid.uuid4().hex[:16]}",
+        return Tenant.model_construct(
+            id=tenant_id or f"t-{n:016d}",
             identifier=identifier or f"tenant-{n:04d}",
             name=name or f"Test Tenant {n}",
             status=status,
             isolation_strategy=isolation_strategy,
             metadata=metadata or {},
-            created_at=ts,
-            updated_at=ts,
+            created_at=NOW,
+            updated_at=NOW,
         )
 
     return _make
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import functools
 import os
 import socket
 from typing import TYPE_CHECKING, Any
@@ -17,6 +17,7 @@ from fastapi_tenancy.core.types import IsolationStrategy, Tenant, TenantStatus
 from fastapi_tenancy.isolation.database import DatabaseIsolationProvider
 from fastapi_tenancy.isolation.hybrid import HybridIsolationProvider
 from fastapi_tenancy.isolation.schema import SchemaIsolationProvider
+from tests._helpers import NOW
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Callable
@@ -30,6 +31,7 @@ _PG_URL = os.getenv(
 _SQLITE_MEM = "sqlite+aiosqlite:///:memory:"
 
 
+@functools.cache
 def _tcp_ok(host: str, port: int, *, timeout: float = 1.0) -> bool:
     try:
         with socket.create_connection((host, port), timeout=timeout):
@@ -60,8 +62,7 @@ def make_tenant() -> Callable[..., Tenant]:
     ) -> Tenant:
         counter[0] += 1
         n = counter[0]
-        now = datetime.now(UTC)
-        return Tenant(
+        return Tenant.model_construct(
             id=tenant_id or f"t-iso-{n:05d}",
             identifier=identifier or f"iso-tenant-{n:05d}",
             name=name or f"Isolation Tenant {n}",
@@ -70,8 +71,8 @@ def make_tenant() -> Callable[..., Tenant]:
             metadata=metadata or {},
             schema_name=schema_name,
             database_url=database_url,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
         )
 
     return _factory
@@ -5,7 +5,6 @@ the :class:`~fastapi_tenancy.isolation.database._LRUEngineCache`.
 from __future__ import annotations
 
 import asyncio
-from datetime import UTC, datetime
 import gc
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -20,6 +19,7 @@ from fastapi_tenancy.core.exceptions import IsolationError
 from fastapi_tenancy.core.types import IsolationStrategy, Tenant, TenantStatus
 from fastapi_tenancy.isolation.database import DatabaseIsolationProvider, _LRUEngineCache
 from fastapi_tenancy.utils.db_compat import DbDialect
+from tests._helpers import NOW
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -51,18 +51,17 @@ def _make_tenant(
     identifier: str = "fix-tenant",
     status: TenantStatus = TenantStatus.ACTIVE,
 ) -> Tenant:
-    now = datetime.now(UTC)
-    return Tenant(
+    return Tenant.model_construct(
         id=tenant_id,
         identifier=identifier,
         name=identifier.title(),
         status=status,
-        created_at=now,
-        updated_at=now,
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
-async def _make_engine() -> AsyncEngine:
+def _make_engine() -> AsyncEngine:
     return create_async_engine("sqlite+aiosqlite:///:memory:")
 
 
@@ -74,16 +73,16 @@ class TestLRUEngineCache:
 
     async def test_put_and_get(self) -> None:
         cache = _LRUEngineCache(max_size=5)
-        engine = await _make_engine()
+        engine = _make_engine()
         await cache.put("k1", engine)
         assert await cache.get("k1") is engine
         await engine.dispose()
 
     async def test_get_promotes_to_mru(self) -> None:
         cache = _LRUEngineCache(max_size=2)
-        e1 = await _make_engine()
-        e2 = await _make_engine()
-        e3 = await _make_engine()
+        e1 = _make_engine()
+        e2 = _make_engine()
+        e3 = _make_engine()
         await cache.put("k1", e1)
         await cache.put("k2", e2)
         # Access k1 to promote it to MRU
@@ -99,9 +98,9 @@ class TestLRUEngineCache:
 
     async def test_put_evicts_lru_when_full(self) -> None:
         cache = _LRUEngineCache(max_size=2)
-        e1 = await _make_engine()
-        e2 = await _make_engine()
-        e3 = await _make_engine()
+        e1 = _make_engine()
+        e2 = _make_engine()
+        e3 = _make_engine()
         await cache.put("k1", e1)
         await cache.put("k2", e2)
         evicted = await cache.put("k3", e3)
@@ -113,7 +112,7 @@ class TestLRUEngineCache:
 
     async def test_put_existing_key_no_eviction(self) -> None:
         cache = _LRUEngineCache(max_size=2)
-        e1 = await _make_engine()
+        e1 = _make_engine()
         await cache.put("k1", e1)
         # Re-inserting same key should not evict anything
         evicted = await cache.put("k1", e1)
@@ -123,7 +122,7 @@ class TestLRUEngineCache:
 
     async def test_remove_existing(self) -> None:
         cache = _LRUEngineCache(max_size=5)
-        e1 = await _make_engine()
+        e1 = _make_engine()
         await cache.put("k1", e1)
         removed = await cache.remove("k1")
         assert removed is e1
@@ -136,8 +135,8 @@ class TestLRUEngineCache:
 
     async def test_dispose_all_clears_cache(self) -> None:
         cache = _LRUEngineCache(max_size=5)
-        e1 = await _make_engine()
-        e2 = await _make_engine()
+        e1 = _make_engine()
+        e2 = _make_engine()
         await cache.put("k1", e1)
         await cache.put("k2", e2)
         count = await cache.dispose_all()
@@ -156,7 +155,7 @@ class TestLRUEngineCache:
     async def test_size_property(self) -> None:
         cache = _LRUEngineCache(max_size=5)
         assert cache.size == 0
-        e1 = await _make_engine()
+        e1 = _make_engine()
         await cache.put("k1", e1)
         assert cache.size == 1
         await e1.dispose()
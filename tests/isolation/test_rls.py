@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 import pytest
@@ -12,6 +11,7 @@ from fastapi_tenancy.core.config import TenancyConfig
 from fastapi_tenancy.core.exceptions import ConfigurationError, IsolationError
 from fastapi_tenancy.core.types import IsolationStrategy, Tenant, TenantStatus
 from fastapi_tenancy.isolation.rls import _RLS_GUC, _TENANT_COLUMN, RLSIsolationProvider
+from tests._helpers import NOW
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -52,14 +52,13 @@ def _make_tenant(
     identifier: str = "fix-tenant",
     status: TenantStatus = TenantStatus.ACTIVE,
 ) -> Tenant:
-    now = datetime.now(UTC)
-    return Tenant(
+    return Tenant.model_construct(
         id=tenant_id,
         identifier=identifier,
         name=identifier.title(),
         status=status,
-        created_at=now,
-        updated_at=now,
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
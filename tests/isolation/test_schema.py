@@ -4,12 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-from datetime import UTC, datetime
 import os
+import secrets
 import socket
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock
-import uuid
 
 import pytest
 import sqlalchemy as sa
@@ -20,6 +19,7 @@ from fastapi_tenancy.core.exceptions import IsolationError
 from fastapi_tenancy.core.types import IsolationStrategy, Tenant, TenantStatus
 from fastapi_tenancy.isolation.schema import SchemaIsolationProvider
 from fastapi_tenancy.utils.db_compat import DbDialect
+from tests._helpers import NOW
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -34,14 +34,13 @@ def _make_tenant(
     identifier: str = "fix-tenant",
     status: TenantStatus = TenantStatus.ACTIVE,
 ) -> Tenant:
-    now = datetime.now(UTC)
-    return Tenant(
+    return Tenant.model_construct(
         id=tenant_id,
         identifier=identifier,
         name=identifier.title(),
         status=status,
-        created_at=now,
-        updated_at=now,
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
@@ -534,7 +533,7 @@ class TestSearchPathBeginEventListener:
             pytest.skip("PostgreSQL not reachable")
 
         provider = SchemaIsolationProvider(_sqla_cfg(pg_url))
-        tenant = make_tenant(identifier=f"sp-tenant-{uuid.uuid4().hex[:8]}")
+        tenant = make_tenant(identifier=f"sp-tenant-{secrets.token_hex(4)}")
         try:
             await provider.initialize_tenant(tenant, metadata=simple_metadata)
             async with provider._schema_session(tenant) as session:
@@ -571,7 +570,7 @@ class TestSearchPathBeginEventListener:
             pytest.skip("PostgreSQL not reachable")
 
         provider = SchemaIsolationProvider(_sqla_cfg(pg_url))
-        uid = uuid.uuid4().hex[:8]
+        uid = secrets.token_hex(4)
         tenant_a = make_tenant(identifier=f"iso-a-{uid}")
         tenant_b = make_tenant(identifier=f"iso-b-{uid}")
         try:
@@ -617,7 +616,7 @@ class TestPostgresSchemaLifecycle:
             pytest.skip("PostgreSQL not reachable")
 
         provider = SchemaIsolationProvider(_sqla_cfg(pg_url))
-        tenant = make_tenant(identifier=f"lifecycle-{uuid.uuid4().hex[:8]}")
+        tenant = make_tenant(identifier=f"lifecycle-{secrets.token_hex(4)}")
         try:
             await provider.initialize_tenant(tenant, metadata=simple_metadata)
             assert await provider.verify_isolation(tenant)
@@ -657,7 +656,7 @@ class TestPostgresSchemaLifecycle:
             pytest.skip("PostgreSQL not reachable")
 
         provider = SchemaIsolationProvider(_sqla_cfg(pg_url))
-        tenant = make_tenant(identifier=f"idempotent-{uuid.uuid4().hex[:8]}")
+        tenant = make_tenant(identifier=f"idempotent-{secrets.token_hex(4)}")
         try:
             await provider.initialize_tenant(tenant, metadata=simple_metadata)
             await provider.initialize_tenant(tenant, metadata=simple_metadata)
@@ -692,7 +691,7 @@ class TestMSSQLSchemaIsolation:
             pytest.skip("SQL Server not reachable on localhost:1433")
 
         provider = SchemaIsolationProvider(_sqla_cfg(mssql_url))
-        tenant = make_tenant(identifier=f"mssql-{uuid.uuid4().hex[:6]}")
+        tenant = make_tenant(identifier=f"mssql-{secrets.token_hex(3)}")
         try:
             await provider.initialize_tenant(tenant, metadata=simple_metadata)
             assert await provider.verify_isolation(tenant)
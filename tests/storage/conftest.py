@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import functools
 import os
 import socket
 from typing import TYPE_CHECKING, Any
@@ -16,13 +16,25 @@ from fastapi_tenancy.core.types import IsolationStrategy, Tenant, TenantStatus
 from fastapi_tenancy.storage.database import SQLAlchemyTenantStore
 from fastapi_tenancy.storage.memory import InMemoryTenantStore
 from fastapi_tenancy.storage.redis import RedisTenantStore
+from tests._helpers import NOW
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Callable
+    from datetime import datetime
 
 
+# A private (non shared-cache) in-memory database: SQLAlchemyTenantStore pins
+# it to one connection via StaticPool, so a single aiosqlite worker thread
+# serves the whole session.  ``file::memory:?cache=shared`` would instead let
+# two stores in one process see each other's rows.
 _SQLITE_MEM: str = "sqlite+aiosqlite:///:memory:"
 
+# Connection PRAGMAs for the shared test database.  ``:memory:`` already keeps
+# its rollback journal in RAM and never syncs to disk, so ``journal_mode=WAL``
+# and ``synchronous`` have nothing to act on; the remaining win is holding the
+# database lock for the connection's lifetime instead of per transaction.
+_SQLITE_PRAGMAS: tuple[str, ...] = ("temp_store=MEMORY", "locking_mode=EXCLUSIVE")
+
 _PG_URL: str = (
     os.getenv("POSTGRES_URL")
     or os.getenv("TENANCY_DATABASE_URL")
@@ -39,8 +51,13 @@ _MSSQL_URL: str = os.getenv(
 )
 
 
+@functools.cache
 def _tcp_ok(host: str, port: int, *, timeout: float = 1.0) -> bool:
-    """Return True when a TCP connection to *host*:*port* succeeds within *timeout* s."""
+    """Return True when a TCP connection to *host*:*port* succeeds within *timeout* s.
+
+    Cached for the life of the process, so each backend is probed once per
+    session (or per xdist worker) rather than once per test.
+    """
     try:
         with socket.create_connection((host, port), timeout=timeout):
             return True
@@ -66,6 +83,8 @@ def make_tenant() -> Callable[..., Tenant]:
 
     Each call increments an internal counter used to generate unique IDs and
     identifiers, preventing PK / unique-constraint collisions between tests.
+    Tenants are built with ``Tenant.model_construct`` (the inputs are always
+    valid here) and default to a fixed ``created_at`` / ``updated_at``.
 
     Example::
 
@@ -90,8 +109,7 @@ def make_tenant() -> Callable[..., Tenant]:
     ) -> Tenant:
         counter[0] += 1
         n = counter[0]
-        now = datetime.now(UTC)
-        return Tenant(
+        return Tenant.model_construct(
             id=tenant_id or f"t-store-{n:06d}",
             identifier=identifier or f"store-tenant-{n:06d}",
             name=name or f"Store Tenant {n}",
@@ -100,22 +118,31 @@ def make_tenant() -> Callable[..., Tenant]:
             metadata=metadata if metadata is not None else {},
             schema_name=schema_name,
             database_url=database_url,
-            created_at=created_at or now,
-            updated_at=updated_at or now,
+            created_at=created_at or NOW,
+            updated_at=updated_at or NOW,
         )
 
     return _factory
 
 
-@pytest_asyncio.fixture
-async def sqlite_store() -> AsyncIterator[SQLAlchemyTenantStore]:
-    """Yield an initialised :class:`SQLAlchemyTenantStore` backed by in-memory SQLite.
+def _apply_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Issue :data:`_SQLITE_PRAGMAS` on every new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
 
-    Uses ``StaticPool`` so the same connection is reused across the session
-    (required for ``:memory:`` SQLite).  The store is closed and the pool
-    disposed in the finally block.
+
+@pytest_asyncio.fixture(scope="session")
+async def _sqlite_session_store() -> AsyncIterator[SQLAlchemyTenantStore]:
+    """Yield one initialised in-memory SQLite store shared by the whole session.
+
+    Engine creation and the ``CREATE TABLE`` DDL run once per session (or once
+    per xdist worker) instead of once per test; the function-scoped fixtures
+    below empty the table between tests via :func:`_reset_sqlite`.
     """
     store = SQLAlchemyTenantStore(_SQLITE_MEM)
+    sa.event.listen(store._engine.sync_engine, "connect", _apply_sqlite_pragmas)
     await store.initialize()
     try:
         yield store
@@ -123,6 +150,36 @@ async def sqlite_store() -> AsyncIterator[SQLAlchemyTenantStore]:
         await store.close()
 
 
+async def _reset_sqlite(store: SQLAlchemyTenantStore) -> None:
+    """Delete every row from the shared SQLite store's ``tenants`` table.
+
+    A test that called ``close()`` disposes the ``StaticPool`` connection, and
+    with it the ``:memory:`` database; the next connection sees an empty
+    database, so the table is recreated instead.
+    """
+    try:
+        async with store._engine.begin() as conn:
+            await conn.execute(sa.text("DELETE FROM tenants"))
+    except sa.exc.OperationalError:
+        await store.initialize()
+
+
+@pytest_asyncio.fixture
+async def sqlite_store(
+    _sqlite_session_store: SQLAlchemyTenantStore,
+) -> AsyncIterator[SQLAlchemyTenantStore]:
+    """Yield the session's in-memory SQLite :class:`SQLAlchemyTenantStore`.
+
+    Uses ``StaticPool`` so the same connection is reused across the session
+    (required for ``:memory:`` SQLite).  The ``tenants`` table is emptied in
+    teardown so every test starts from a clean store.
+    """
+    try:
+        yield _sqlite_session_store
+    finally:
+        await _reset_sqlite(_sqlite_session_store)
+
+
 @pytest_asyncio.fixture
 async def postgres_store() -> AsyncIterator[SQLAlchemyTenantStore]:
     """Yield a PostgreSQL :class:`SQLAlchemyTenantStore`; skip when PG is down.
@@ -218,24 +275,25 @@ async def mssql_store() -> AsyncIterator[SQLAlchemyTenantStore]:
 )
 async def any_sqla_store(  # noqa: PLR0912, PLR0915
     request: pytest.FixtureRequest,
+    _sqlite_session_store: SQLAlchemyTenantStore,
 ) -> AsyncIterator[SQLAlchemyTenantStore]:
     """Parametrised fixture that yields each available SQLAlchemy store.
 
     ``test_sqla_contract.py`` depends on this fixture to run the shared
     contract suite against *every* reachable database backend.
 
-    SQLite is always available.  PostgreSQL, MySQL, and MSSQL are skipped
-    automatically when their respective servers are not reachable.
+    SQLite is always available and reuses the session-wide store, emptied
+    after each test.  PostgreSQL, MySQL, and MSSQL are skipped automatically
+    when their respective servers are not reachable.
     """
     backend: str = request.param
 
     if backend == "sqlite":
-        store = SQLAlchemyTenantStore(_SQLITE_MEM)
-        await store.initialize()
+        store = _sqlite_session_store
         try:
             yield store
         finally:
-            await store.close()
+            await _reset_sqlite(store)
 
     elif backend == "postgres":
         if not _pg_up():
@@ -290,7 +348,7 @@ class FakeRedis:
     """Minimal in-memory Redis mock covering the API surface used by RedisTenantStore.
 
     Implements:
-        - ``get`` / ``set`` / ``setex`` / ``delete`` / ``exists``
+        - ``get`` / ``set`` / ``setex`` / ``delete`` / ``unlink`` / ``exists``
         - ``pipeline()`` (returns a :class:`FakePipeline` that batches setex/get)
         - ``scan_iter(match, count)`` — async generator that yields matching keys
         - ``aclose()`` — no-op coroutine
@@ -331,6 +389,10 @@ class FakeRedis:
                 deleted += 1
         return deleted
 
+    async def unlink(self, *keys: str | bytes) -> int:
+        """Non-blocking ``DEL`` on a real server; identical to :meth:`delete` here."""
+        return await self.delete(*keys)
+
     async def exists(self, *keys: str | bytes) -> int:
         return sum(1 for k in keys if self._key(k) in self._store)
 
@@ -422,16 +484,16 @@ def _build_redis_store_with_fake(
     and then calls ``aioredis.from_url()``.  We bypass that entirely by:
     1. Temporarily monkey-patching ``_require_redis`` to return a mock module
        whose ``from_url`` returns our :class:`FakeRedis` instance.
-    2. Building the store inside the patched consa.text.
+    2. Building the store inside the patched context.
     3. Restoring the original module state.
+
+    No connection is opened and no reachability probe runs, so a Redis server
+    is never needed.
     """
 
     fake_aioredis = MagicMock()
     fake_aioredis.from_url = MagicMock(return_value=fake)
 
-    fake_redis_module = MagicMock()
-    fake_redis_module.asyncio = fake_aioredis
-
     with patch("fastapi_tenancy.storage.redis._require_redis", return_value=fake_aioredis):
         store = RedisTenantStore(
             redis_url="redis://localhost:6379/0",
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -10,7 +10,8 @@ import pytest
 
 from fastapi_tenancy.core.exceptions import TenantNotFoundError
 from fastapi_tenancy.core.types import Tenant, TenantStatus
-from fastapi_tenancy.storage.tenant_store import TenantStore
+from fastapi_tenancy.storage.tenant_store import _GET_BY_IDS_BATCH_SIZE, TenantStore
+from tests._helpers import NOW
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -91,24 +92,44 @@ def _make(
     name_prefix: str = "Tenant",
     status: TenantStatus = TenantStatus.ACTIVE,
 ) -> Tenant:
-    now = datetime.now(UTC)
-    return Tenant(
+    return Tenant.model_construct(
         id=f"t-{n:04d}",
         identifier=f"tenant-{n:04d}",
         name=f"{name_prefix} {n}",
         status=status,
         metadata={},
-        created_at=now,
-        updated_at=now,
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
+@pytest.mark.unit
+class TestBaseCreateMany:
+    async def test_all_created_in_order(self) -> None:
+        store = DummyStore()
+        result = await store.create_many([_make(2), _make(1)])
+        assert [t.id for t in result] == ["t-0002", "t-0001"]
+        assert await store.count() == 2
+
+    async def test_empty_input_returns_empty(self) -> None:
+        store = DummyStore()
+        assert await store.create_many([]) == []
+
+    async def test_duplicate_keeps_earlier_tenants(self) -> None:
+        """The base implementation is not atomic across the batch."""
+        store = DummyStore()
+        await store.create(_make(2))
+        with pytest.raises(ValueError, match="Duplicate"):
+            await store.create_many([_make(1), _make(2), _make(3)])
+        assert await store.exists("t-0001")
+        assert not await store.exists("t-0003")
+
+
 @pytest.mark.unit
 class TestBaseGetByIds:
     async def test_all_found(self) -> None:
         store = DummyStore()
-        t1 = await store.create(_make(1))
-        t2 = await store.create(_make(2))
+        t1, t2 = await store.create_many([_make(1), _make(2)])
         result = await store.get_by_ids([t1.id, t2.id])
         assert {r.id for r in result} == {t1.id, t2.id}
 
@@ -130,9 +151,7 @@ class TestBaseGetByIds:
 
     async def test_order_preserved(self) -> None:
         store = DummyStore()
-        t1 = await store.create(_make(1))
-        t2 = await store.create(_make(2))
-        t3 = await store.create(_make(3))
+        t1, t2, t3 = await store.create_many([_make(1), _make(2), _make(3)])
         result = await store.get_by_ids([t3.id, t1.id, t2.id])
         assert [r.id for r in result] == [t3.id, t1.id, t2.id]
 
@@ -143,6 +162,66 @@ class TestBaseGetByIds:
         result = await store.get_by_ids(i for i in [t.id])
         assert len(result) == 1
 
+    async def test_lookups_run_concurrently(self) -> None:
+        store = DummyStore()
+        await store.create_many([_make(1), _make(2), _make(3)])
+        in_flight = peak = 0
+        original = store.get_by_id
+
+        async def _slow_get(tenant_id: str) -> Tenant:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return await original(tenant_id)
+
+        store.get_by_id = _slow_get  # type: ignore[method-assign]
+        result = await store.get_by_ids(["t-0001", "t-0002", "t-0003"])
+        assert len(result) == 3
+        assert peak == 3
+
+    async def test_other_errors_propagate(self) -> None:
+        store = DummyStore()
+
+        async def _broken_get(tenant_id: str) -> Tenant:
+            raise RuntimeError("backend down")
+
+        store.get_by_id = _broken_get  # type: ignore[method-assign]
+        with pytest.raises(RuntimeError, match="backend down"):
+            await store.get_by_ids(["t-0001"])
+
+    async def test_lookups_are_bounded_per_batch(self) -> None:
+        store = DummyStore()
+        ids = [f"t-{i:04d}" for i in range(_GET_BY_IDS_BATCH_SIZE * 2 + 1)]
+        in_flight = peak = 0
+
+        async def _slow_get(tenant_id: str) -> Tenant:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            raise TenantNotFoundError(identifier=tenant_id)
+
+        store.get_by_id = _slow_get  # type: ignore[method-assign]
+        assert await store.get_by_ids(ids) == []
+        assert peak == _GET_BY_IDS_BATCH_SIZE
+
+    async def test_error_stops_later_batches(self) -> None:
+        store = DummyStore()
+        ids = [f"t-{i:04d}" for i in range(_GET_BY_IDS_BATCH_SIZE * 3)]
+        calls: list[str] = []
+
+        async def _broken_get(tenant_id: str) -> Tenant:
+            calls.append(tenant_id)
+            raise RuntimeError("backend down")
+
+        store.get_by_id = _broken_get  # type: ignore[method-assign]
+        with pytest.raises(RuntimeError, match="backend down"):
+            await store.get_by_ids(ids)
+        assert calls == ids[:_GET_BY_IDS_BATCH_SIZE]
+
 
 @pytest.mark.unit
 class TestBaseSearch:
@@ -160,8 +239,8 @@ class TestBaseSearch:
                 id="name-t",
                 identifier="umbrella-org",
                 name="Umbrella Corporation",
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
+                created_at=NOW,
+                updated_at=NOW,
             )
         )
         result = await store.search("umbrella")
@@ -180,16 +259,16 @@ class TestBaseSearch:
 
     async def test_limit_respected(self) -> None:
         store = DummyStore()
-        for i in range(10):
-            await store.create(_make(i + 100))
+        await store.create_many(_make(i + 100) for i in range(10))
         result = await store.search("tenant", limit=3)
         assert len(result) == 3
 
     async def test_status_filter_via_list(self) -> None:
         """Base search() filters via list(); status param is respected."""
         store = DummyStore()
-        await store.create(_make(1, status=TenantStatus.ACTIVE))
-        await store.create(_make(2, status=TenantStatus.SUSPENDED))
+        await store.create_many(
+            [_make(1, status=TenantStatus.ACTIVE), _make(2, status=TenantStatus.SUSPENDED)]
+        )
         # The base search calls list() which filters by status
         all_results = await store.search("tenant", limit=10)
         # Both are returned (no status filter on search itself)
@@ -201,8 +280,7 @@ class TestBaseSearch:
         """When both scan_limit and result_limit are saturated, a warning is emitted."""
         store = DummyStore()
         # Create exactly _scan_limit=5 tenants, all matching
-        for i in range(5):
-            await store.create(_make(i + 200))
+        await store.create_many(_make(i + 200) for i in range(5))
         caplog.set_level(logging.WARNING)
         result = await store.search("tenant", limit=5, _scan_limit=5)
         assert len(result) == 5
@@ -212,8 +290,7 @@ class TestBaseSearch:
         self, caplog: pytest.LogCaptureFixture
     ) -> None:
         store = DummyStore()
-        for i in range(3):
-            await store.create(_make(i + 300))
+        await store.create_many(_make(i + 300) for i in range(3))
         caplog.set_level(logging.WARNING)
         await store.search("tenant", limit=10, _scan_limit=100)
         assert "scan limit" not in caplog.text.lower()
@@ -227,11 +304,10 @@ class TestBaseSearch:
 class TestBaseBulkUpdateStatus:
     async def test_all_found_and_updated(self) -> None:
         store = DummyStore()
-        t1 = await store.create(_make(1))
-        t2 = await store.create(_make(2))
+        t1, t2 = await store.create_many([_make(1), _make(2)])
         result = await store.bulk_update_status([t1.id, t2.id], TenantStatus.SUSPENDED)
         assert len(result) == 2
-        assert all(t.status == TenantStatus.SUSPENDED for t in result)
+        assert all(t.status is TenantStatus.SUSPENDED for t in result)
 
     async def test_missing_ids_skipped(self) -> None:
         store = DummyStore()
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
@@ -13,13 +15,32 @@ from fastapi_tenancy.core.types import Tenant, TenantStatus
 from fastapi_tenancy.storage.memory import InMemoryTenantStore
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
+
+#: Value the patched store clock returns in ``updated_at`` tests.
+_LATER = datetime(2030, 1, 1, tzinfo=UTC)
 
 
 def _ts(offset_seconds: int = 0) -> datetime:
     return datetime.now(UTC) + timedelta(seconds=offset_seconds)
 
 
+#: Statuses seeded by the status-filter tests, and the expected match counts.
+_STATUS_MIX = (TenantStatus.ACTIVE, TenantStatus.ACTIVE, TenantStatus.SUSPENDED)
+_STATUS_EXPECTED = [
+    (TenantStatus.ACTIVE, 2),
+    (TenantStatus.SUSPENDED, 1),
+    (TenantStatus.DELETED, 0),
+]
+
+
+@contextlib.contextmanager
+def _frozen_clock(at: datetime = _LATER) -> Iterator[None]:
+    """Pin the in-memory store's clock so ``updated_at`` is deterministic."""
+    with patch("fastapi_tenancy.storage.memory._utcnow", return_value=at):
+        yield
+
+
 @pytest.mark.unit
 class TestCreate:
     async def test_returns_stored_tenant(self, make_tenant: Callable[..., Tenant]) -> None:
@@ -68,6 +89,23 @@ class TestCreate:
         assert stored.database_url == "postgresql+asyncpg://u:p@h/db"
         assert stored.schema_name == "tenant_acme"
 
+    async def test_create_many_indexes_every_tenant(
+        self, make_tenant: Callable[..., Tenant]
+    ) -> None:
+        store = InMemoryTenantStore()
+        tenants = [make_tenant() for _ in range(3)]
+        result = await store.create_many(tenants)
+        assert list(result) == tenants
+        assert all(store._identifier_map[t.identifier] == t.id for t in tenants)
+
+    async def test_create_many_duplicate_raises_value_error(
+        self, make_tenant: Callable[..., Tenant]
+    ) -> None:
+        store = InMemoryTenantStore()
+        t = make_tenant()
+        with pytest.raises(ValueError, match="already exists"):
+            await store.create_many([t, t])
+
 
 @pytest.mark.unit
 class TestReads:
@@ -101,8 +139,7 @@ class TestReads:
 
     async def test_get_by_ids_all_found(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
-        t1 = await store.create(make_tenant())
-        t2 = await store.create(make_tenant())
+        t1, t2 = await store.create_many([make_tenant(), make_tenant()])
         results = await store.get_by_ids([t1.id, t2.id])
         assert {r.id for r in results} == {t1.id, t2.id}
 
@@ -117,15 +154,13 @@ class TestReads:
         self, make_tenant: Callable[..., Tenant]
     ) -> None:
         store = InMemoryTenantStore()
-        t1 = await store.create(make_tenant())
-        t2 = await store.create(make_tenant())
-        t3 = await store.create(make_tenant())
+        t1, t2, t3 = await store.create_many([make_tenant(), make_tenant(), make_tenant()])
         results = await store.get_by_ids([t3.id, t1.id, t2.id])
         assert [r.id for r in results] == [t3.id, t1.id, t2.id]
 
     async def test_get_by_ids_empty_input(self) -> None:
         store = InMemoryTenantStore()
-        assert await store.get_by_ids([]) == []
+        assert not await store.get_by_ids([])
 
     async def test_get_by_ids_all_missing(self) -> None:
         store = InMemoryTenantStore()
@@ -143,9 +178,10 @@ class TestUpdate:
 
     async def test_update_refreshes_updated_at(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
-        t = await store.create(make_tenant(created_at=datetime.now(UTC) - timedelta(hours=1)))
-        result = await store.update(t.model_copy(update={"name": "New"}))
-        assert result.updated_at > t.updated_at
+        t = await store.create(make_tenant())
+        with _frozen_clock():
+            result = await store.update(t.model_copy(update={"name": "New"}))
+        assert result.updated_at == _LATER
 
     async def test_update_identifier_moves_index(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
@@ -208,8 +244,7 @@ class TestDelete:
         self, make_tenant: Callable[..., Tenant]
     ) -> None:
         store = InMemoryTenantStore()
-        t1 = await store.create(make_tenant())
-        t2 = await store.create(make_tenant())
+        t1, t2 = await store.create_many([make_tenant(), make_tenant()])
         await store.delete(t1.id)
         result = await store.get_by_id(t2.id)
         assert result.id == t2.id
@@ -235,18 +270,29 @@ class TestExistsCount:
 
     async def test_count_all(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
-        for _ in range(5):
-            await store.create(make_tenant())
+        await store.create_many(make_tenant() for _ in range(5))
         assert await store.count() == 5
 
-    async def test_count_by_status(self, make_tenant: Callable[..., Tenant]) -> None:
+    @pytest.mark.parametrize(("status", "expected"), _STATUS_EXPECTED)
+    async def test_count_by_status(
+        self, make_tenant: Callable[..., Tenant], status: TenantStatus, expected: int
+    ) -> None:
+        store = InMemoryTenantStore()
+        await store.create_many(make_tenant(status=s) for s in _STATUS_MIX)
+        assert await store.count(status=status) == expected
+
+    async def test_count_by_status_tracks_writes(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
-        await store.create(make_tenant(status=TenantStatus.ACTIVE))
-        await store.create(make_tenant(status=TenantStatus.ACTIVE))
-        await store.create(make_tenant(status=TenantStatus.SUSPENDED))
-        assert await store.count(status=TenantStatus.ACTIVE) == 2
-        assert await store.count(status=TenantStatus.SUSPENDED) == 1
+        t1, t2, t3 = await store.create_many(make_tenant() for _ in range(3))
+        await store.set_status(t1.id, TenantStatus.SUSPENDED)
+        await store.update(t2.model_copy(update={"status": TenantStatus.DELETED}))
+        await store.bulk_update_status([t2.id, t3.id], TenantStatus.SUSPENDED)
+        assert await store.count(status=TenantStatus.SUSPENDED) == 3
+        await store.delete(t1.id)
+        assert await store.count(status=TenantStatus.SUSPENDED) == 2
+        assert await store.count(status=TenantStatus.ACTIVE) == 0
         assert await store.count(status=TenantStatus.DELETED) == 0
+        assert store.statistics()["by_status"] == {"suspended": 2}
 
 
 @pytest.mark.unit
@@ -257,31 +303,35 @@ class TestList:
 
     async def test_sorted_newest_first(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
-        t1 = await store.create(make_tenant(created_at=_ts(-2)))
-        t2 = await store.create(make_tenant(created_at=_ts(-1)))
-        t3 = await store.create(make_tenant(created_at=_ts(0)))
+        t1, t2, t3 = await store.create_many(
+            [
+                make_tenant(created_at=_ts(-2)),
+                make_tenant(created_at=_ts(-1)),
+                make_tenant(created_at=_ts(0)),
+            ]
+        )
         results = await store.list()
         assert [r.id for r in results] == [t3.id, t2.id, t1.id]
 
-    async def test_status_filter(self, make_tenant: Callable[..., Tenant]) -> None:
+    @pytest.mark.parametrize(("status", "expected"), _STATUS_EXPECTED)
+    async def test_status_filter(
+        self, make_tenant: Callable[..., Tenant], status: TenantStatus, expected: int
+    ) -> None:
         store = InMemoryTenantStore()
-        await store.create(make_tenant(status=TenantStatus.ACTIVE))
-        await store.create(make_tenant(status=TenantStatus.SUSPENDED))
-        active = await store.list(status=TenantStatus.ACTIVE)
-        assert all(t.status == TenantStatus.ACTIVE for t in active)
-        assert len(active) == 1
+        await store.create_many(make_tenant(status=s) for s in _STATUS_MIX)
+        page = await store.list(status=status)
+        assert all(t.status is status for t in page)
+        assert len(page) == expected
 
     async def test_pagination_skip(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
-        for i in range(5):
-            await store.create(make_tenant(created_at=_ts(i)))
+        await store.create_many(make_tenant(created_at=_ts(i)) for i in range(5))
         page = await store.list(skip=2, limit=2)
         assert len(page) == 2
 
     async def test_pagination_limit(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
-        for _ in range(10):
-            await store.create(make_tenant())
+        await store.create_many(make_tenant() for _ in range(10))
         page = await store.list(limit=3)
         assert len(page) == 3
 
@@ -292,6 +342,52 @@ class TestList:
         await store.create(make_tenant())
         assert await store.list(skip=100) == []
 
+    async def test_page_contents_follow_order(self, make_tenant: Callable[..., Tenant]) -> None:
+        store = InMemoryTenantStore()
+        created = await store.create_many(make_tenant(created_at=_ts(i)) for i in range(5))
+        page = await store.list(skip=1, limit=2)
+        assert [t.id for t in page] == [created[3].id, created[2].id]
+
+    async def test_equal_timestamps_keep_insertion_order(
+        self, make_tenant: Callable[..., Tenant]
+    ) -> None:
+        store = InMemoryTenantStore()
+        ts = _ts()
+        created = await store.create_many(make_tenant(created_at=ts) for _ in range(3))
+        assert [t.id for t in await store.list()] == [t.id for t in created]
+
+    async def test_deleted_tenant_dropped_from_order(
+        self, make_tenant: Callable[..., Tenant]
+    ) -> None:
+        store = InMemoryTenantStore()
+        t1, t2 = await store.create_many(
+            [make_tenant(created_at=_ts(0)), make_tenant(created_at=_ts(1))]
+        )
+        await store.delete(t2.id)
+        assert [t.id for t in await store.list()] == [t1.id]
+        assert len(store._order) == 1
+
+    async def test_update_created_at_repositions(self, make_tenant: Callable[..., Tenant]) -> None:
+        store = InMemoryTenantStore()
+        t1, t2 = await store.create_many(
+            [make_tenant(created_at=_ts(0)), make_tenant(created_at=_ts(1))]
+        )
+        await store.update(t1.model_copy(update={"created_at": _ts(2)}))
+        assert [t.id for t in await store.list()] == [t1.id, t2.id]
+
+    async def test_status_page_follows_order_across_writes(
+        self, make_tenant: Callable[..., Tenant]
+    ) -> None:
+        store = InMemoryTenantStore()
+        t1, t2, t3 = await store.create_many(make_tenant(created_at=_ts(i)) for i in range(3))
+        s1, _ = await store.bulk_update_status([t1.id, t3.id], TenantStatus.SUSPENDED)
+        await store.update(s1.model_copy(update={"created_at": _ts(5)}))
+        suspended = await store.list(status=TenantStatus.SUSPENDED)
+        assert [t.id for t in suspended] == [t1.id, t3.id]
+        assert [t.id for t in await store.list(status=TenantStatus.ACTIVE)] == [t2.id]
+        await store.set_status(t1.id, TenantStatus.ACTIVE)
+        assert [t.id for t in await store.list(status=TenantStatus.ACTIVE)] == [t1.id, t2.id]
+
 
 @pytest.mark.unit
 class TestSetStatus:
@@ -305,9 +401,10 @@ class TestSetStatus:
         self, make_tenant: Callable[..., Tenant]
     ) -> None:
         store = InMemoryTenantStore()
-        t = await store.create(make_tenant(created_at=_ts(-60)))
-        result = await store.set_status(t.id, TenantStatus.SUSPENDED)
-        assert result.updated_at > t.updated_at
+        t = await store.create(make_tenant())
+        with _frozen_clock():
+            result = await store.set_status(t.id, TenantStatus.SUSPENDED)
+        assert result.updated_at == _LATER
 
     async def test_set_status_persisted(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
@@ -353,9 +450,10 @@ class TestUpdateMetadata:
 
     async def test_refreshes_updated_at(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
-        t = await store.create(make_tenant(created_at=_ts(-60)))
-        result = await store.update_metadata(t.id, {"x": 1})
-        assert result.updated_at > t.updated_at
+        t = await store.create(make_tenant())
+        with _frozen_clock():
+            result = await store.update_metadata(t.id, {"x": 1})
+        assert result.updated_at == _LATER
 
     async def test_empty_metadata_patch_is_noop(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
@@ -373,11 +471,10 @@ class TestUpdateMetadata:
 class TestBulkUpdateStatus:
     async def test_updates_all_matched_tenants(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
-        t1 = await store.create(make_tenant())
-        t2 = await store.create(make_tenant())
+        t1, t2 = await store.create_many([make_tenant(), make_tenant()])
         result = await store.bulk_update_status([t1.id, t2.id], TenantStatus.SUSPENDED)
         assert len(result) == 2
-        assert all(t.status == TenantStatus.SUSPENDED for t in result)
+        assert all(t.status is TenantStatus.SUSPENDED for t in result)
 
     async def test_skips_missing_ids(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
@@ -399,11 +496,12 @@ class TestBulkUpdateStatus:
 
     async def test_shared_timestamp_across_batch(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
-        t1 = await store.create(make_tenant())
-        t2 = await store.create(make_tenant())
-        result = await store.bulk_update_status([t1.id, t2.id], TenantStatus.SUSPENDED)
-        # All updated_at values should be identical (single timestamp assigned)
-        assert result[0].updated_at == result[1].updated_at
+        t1, t2 = await store.create_many([make_tenant(), make_tenant()])
+        # A one-shot clock: a second read would raise StopIteration.
+        with patch("fastapi_tenancy.storage.memory._utcnow", side_effect=[_LATER]) as clock:
+            result = await store.bulk_update_status([t1.id, t2.id], TenantStatus.SUSPENDED)
+        clock.assert_called_once()
+        assert [t.updated_at for t in result] == [_LATER, _LATER]
 
     async def test_changes_persisted_in_store(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
@@ -417,8 +515,12 @@ class TestBulkUpdateStatus:
 class TestSearch:
     async def test_match_by_identifier(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
-        await store.create(make_tenant(identifier="acme-corp", name="Acme Corp"))
-        await store.create(make_tenant(identifier="globex-inc", name="Globex Inc"))
+        await store.create_many(
+            [
+                make_tenant(identifier="acme-corp", name="Acme Corp"),
+                make_tenant(identifier="globex-inc", name="Globex Inc"),
+            ]
+        )
         results = await store.search("acme")
         assert len(results) == 1
         assert results[0].identifier == "acme-corp"
@@ -437,8 +539,9 @@ class TestSearch:
 
     async def test_limit_respected(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
-        for i in range(10):
-            await store.create(make_tenant(identifier=f"tenant-{i:02d}", name=f"Tenant {i}"))
+        await store.create_many(
+            make_tenant(identifier=f"tenant-{i:02d}", name=f"Tenant {i}") for i in range(10)
+        )
         results = await store.search("tenant", limit=3)
         assert len(results) == 3
 
@@ -450,9 +553,13 @@ class TestSearch:
     async def test_relevance_exact_match_first(self, make_tenant: Callable[..., Tenant]) -> None:
         """Exact identifier match must rank above prefix and substring matches."""
         store = InMemoryTenantStore()
-        await store.create(make_tenant(identifier="acme-corp", name="Acme Full"))
-        await store.create(make_tenant(identifier="acme", name="Exact Acme"))  # exact
-        await store.create(make_tenant(identifier="big-acme", name="Big Acme"))
+        await store.create_many(
+            [
+                make_tenant(identifier="acme-corp", name="Acme Full"),
+                make_tenant(identifier="acme", name="Exact Acme"),  # exact
+                make_tenant(identifier="big-acme", name="Big Acme"),
+            ]
+        )
         results = await store.search("acme", limit=10)
         # Exact identifier match should be first
         assert results[0].identifier == "acme"
@@ -461,6 +568,53 @@ class TestSearch:
         store = InMemoryTenantStore()
         assert await store.search("anything") == []
 
+    async def test_rename_reindexed(self, make_tenant: Callable[..., Tenant]) -> None:
+        store = InMemoryTenantStore()
+        t = await store.create(make_tenant(identifier="old-slug", name="Old Name"))
+        await store.update(t.model_copy(update={"identifier": "new-slug", "name": "New Name"}))
+        assert await store.search("old") == []
+        assert [r.id for r in await store.search("new")] == [t.id]
+
+    async def test_deleted_tenant_not_found(self, make_tenant: Callable[..., Tenant]) -> None:
+        store = InMemoryTenantStore()
+        t = await store.create(make_tenant(identifier="gone-corp"))
+        await store.delete(t.id)
+        assert await store.search("gone") == []
+        assert store._search_keys == {}
+
+    async def test_ties_keep_insertion_order(self, make_tenant: Callable[..., Tenant]) -> None:
+        store = InMemoryTenantStore()
+        created = await store.create_many(
+            make_tenant(identifier=f"x-tenant-{i}", name=f"X {i}") for i in range(5)
+        )
+        results = await store.search("tenant", limit=3)
+        assert [r.id for r in results] == [t.id for t in created[:3]]
+
+    @pytest.mark.parametrize("query", ["ac", "acme", "me-c", "corporation", "ACME-CORP", "zzz"])
+    async def test_trigram_index_matches_linear_scan(
+        self, make_tenant: Callable[..., Tenant], query: str
+    ) -> None:
+        store = InMemoryTenantStore()
+        created = await store.create_many(
+            [
+                make_tenant(identifier="acme-corp", name="Acme Corporation"),
+                make_tenant(identifier="globex", name="Globex Acme Partners"),
+                make_tenant(identifier="initech", name="Initech"),
+            ]
+        )
+        q = query.lower()
+        expected = {t.id for t in created if q in t.identifier or q in t.name.lower()}
+        assert {r.id for r in await store.search(query, limit=10)} == expected
+
+    async def test_trigram_index_tracks_writes(self, make_tenant: Callable[..., Tenant]) -> None:
+        store = InMemoryTenantStore()
+        t = await store.create(make_tenant(identifier="old-slug", name="Old"))
+        await store.update(t.model_copy(update={"identifier": "new-slug", "name": "New"}))
+        assert "old" not in store._trigrams
+        assert t.id in store._trigrams["new"]
+        await store.delete(t.id)
+        assert store._trigrams == {}
+
 
 @pytest.mark.unit
 class TestDebugHelpers:
@@ -470,21 +624,41 @@ class TestDebugHelpers:
         store.clear()
         assert store._tenants == {}
         assert store._identifier_map == {}
+        assert store._search_keys == {}
 
-    async def test_get_all_returns_snapshot(self, make_tenant: Callable[..., Tenant]) -> None:
+    async def test_get_all_returns_read_only_view(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
         t = await store.create(make_tenant())
-        snapshot = store.get_all()
-        assert t.id in snapshot
-        # Mutating snapshot does not affect store
-        del snapshot[t.id]
-        assert t.id in store._tenants
+        view = store.get_all()
+        assert t.id in view
+        with pytest.raises(TypeError):
+            view["injected"] = make_tenant(tenant_id="injected")  # type: ignore[index]
+        assert "injected" not in store._tenants
+
+    async def test_populate_seeds_both_indices(self, make_tenant: Callable[..., Tenant]) -> None:
+        store = InMemoryTenantStore()
+        t1, t2 = make_tenant(identifier="acme-corp"), make_tenant(identifier="globex-inc")
+        store.populate([t1, t2])
+        assert await store.count() == 2
+        assert (await store.get_by_identifier("globex-inc")).id == t2.id
+
+    def test_populate_duplicate_identifier_raises(self, make_tenant: Callable[..., Tenant]) -> None:
+        store = InMemoryTenantStore()
+        t1 = make_tenant(identifier="shared-slug")
+        t2 = make_tenant(identifier="shared-slug")
+        with pytest.raises(ValueError, match="already exists"):
+            store.populate([t1, t2])
+        assert store._identifier_map == {"shared-slug": t1.id}
 
     async def test_statistics_totals(self, make_tenant: Callable[..., Tenant]) -> None:
         store = InMemoryTenantStore()
-        await store.create(make_tenant(status=TenantStatus.ACTIVE))
-        await store.create(make_tenant(status=TenantStatus.ACTIVE))
-        await store.create(make_tenant(status=TenantStatus.SUSPENDED))
+        await store.create_many(
+            [
+                make_tenant(status=TenantStatus.ACTIVE),
+                make_tenant(status=TenantStatus.ACTIVE),
+                make_tenant(status=TenantStatus.SUSPENDED),
+            ]
+        )
         stats = store.statistics()
         assert stats["total"] == 3
         assert stats["identifier_index_size"] == 3
@@ -513,8 +687,9 @@ class TestConcurrency:
     async def test_concurrent_creates_all_succeed(self, make_tenant: Callable[..., Tenant]) -> None:
         """50 concurrent creates must not corrupt the identifier index."""
         store = InMemoryTenantStore()
-        tenants = [make_tenant() for _ in range(50)]
-        await asyncio.gather(*(store.create(t) for t in tenants))
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(50):
+                tg.create_task(store.create(make_tenant()))
         assert await store.count() == 50
         assert len(store._identifier_map) == 50
 
@@ -522,8 +697,10 @@ class TestConcurrency:
         self, make_tenant: Callable[..., Tenant]
     ) -> None:
         store = InMemoryTenantStore()
-        tenants = [await store.create(make_tenant()) for _ in range(20)]
-        await asyncio.gather(*(store.set_status(t.id, TenantStatus.SUSPENDED) for t in tenants))
+        tenants = await store.create_many(make_tenant() for _ in range(20))
+        async with asyncio.TaskGroup() as tg:
+            for t in tenants:
+                tg.create_task(store.set_status(t.id, TenantStatus.SUSPENDED))
         results = await store.list(status=TenantStatus.SUSPENDED)
         assert len(results) == 20
 
@@ -533,8 +710,22 @@ class TestConcurrency:
         """Concurrent metadata patches to the *same* tenant must not lose data."""
         store = InMemoryTenantStore()
         t = await store.create(make_tenant())
-        patches: list[dict[str, Any]] = [{f"key_{i}": i} for i in range(20)]
-        await asyncio.gather(*(store.update_metadata(t.id, p) for p in patches))
+        async with asyncio.TaskGroup() as tg:
+            for i in range(20):
+                tg.create_task(store.update_metadata(t.id, {f"key_{i}": i}))
         final = await store.get_by_id(t.id)
         # Every key must be present — no patch must have been silently dropped
         assert len(final.metadata) == 20
+
+    async def test_reads_do_not_wait_for_writer_lock(
+        self, make_tenant: Callable[..., Tenant]
+    ) -> None:
+        """Read paths are lock-free; they must complete while a writer holds the lock."""
+        store = InMemoryTenantStore()
+        t = await store.create(make_tenant())
+        async with store._lock:
+            assert await store.get_by_id(t.id) is t
+            assert await store.get_by_identifier(t.identifier) is t
+            assert await store.get_by_ids([t.id, "ghost"]) == [t]
+            assert await store.exists(t.id)
+            assert await store.count() == 1
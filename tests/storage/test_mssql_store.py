@@ -80,11 +80,10 @@ class TestMSSQLBulkUpdate:
         mssql_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        t1 = await mssql_store.create(make_tenant())
-        t2 = await mssql_store.create(make_tenant())
+        t1, t2 = await mssql_store.create_many([make_tenant(), make_tenant()])
         result = await mssql_store.bulk_update_status([t1.id, t2.id], TenantStatus.SUSPENDED)
         assert len(result) == 2
-        assert all(t.status == TenantStatus.SUSPENDED for t in result)
+        assert all(t.status is TenantStatus.SUSPENDED for t in result)
 
     async def test_bulk_empty(self, mssql_store: SQLAlchemyTenantStore) -> None:
         assert await mssql_store.bulk_update_status([], TenantStatus.ACTIVE) == []
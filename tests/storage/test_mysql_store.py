@@ -95,8 +95,7 @@ class TestMySQLBulkUpdate:
         mysql_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        t1 = await mysql_store.create(make_tenant())
-        t2 = await mysql_store.create(make_tenant())
+        t1, t2 = await mysql_store.create_many([make_tenant(), make_tenant()])
         result = await mysql_store.bulk_update_status([t1.id, t2.id], TenantStatus.SUSPENDED)
         assert len(result) == 2
 
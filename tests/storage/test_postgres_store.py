@@ -72,18 +72,17 @@ class TestPostgreSQLAtomicMetadataMerge:
 
 @pytest.mark.e2e
 class TestPostgreSQLBulkUpdateReturning:
-    """Covers the ``UPDATE … RETURNING`` path used only on PostgreSQL."""
+    """Covers the ``UPDATE … RETURNING`` path against a live PostgreSQL server."""
 
     async def test_bulk_update_uses_returning(
         self,
         postgres_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        t1 = await postgres_store.create(make_tenant())
-        t2 = await postgres_store.create(make_tenant())
+        t1, t2 = await postgres_store.create_many([make_tenant(), make_tenant()])
         result = await postgres_store.bulk_update_status([t1.id, t2.id], TenantStatus.SUSPENDED)
         assert len(result) == 2
-        assert all(t.status == TenantStatus.SUSPENDED for t in result)
+        assert all(t.status is TenantStatus.SUSPENDED for t in result)
 
     async def test_bulk_empty_returns_empty(self, postgres_store: SQLAlchemyTenantStore) -> None:
         assert await postgres_store.bulk_update_status([], TenantStatus.ACTIVE) == []
@@ -117,8 +116,12 @@ class TestPostgreSQLSearch:
         postgres_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        await postgres_store.create(make_tenant(identifier="pg-zz", name="ZZ Corp"))
-        await postgres_store.create(make_tenant(identifier="pg-aa", name="AA Corp"))
+        await postgres_store.create_many(
+            [
+                make_tenant(identifier="pg-zz", name="ZZ Corp"),
+                make_tenant(identifier="pg-aa", name="AA Corp"),
+            ]
+        )
         results = await postgres_store.search("pg-")
         ids = [r.identifier for r in results]
         assert ids == sorted(ids)
@@ -56,10 +56,10 @@ class TestGetById:
         redis_store: RedisTenantStore,
         make_tenant: Callable[..., Tenant],
         fake_redis: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        t = await redis_store.create(make_tenant())
-        # Corrupt the cached entry
-        fake_redis._store[redis_store._id_key(t.id)] = b"INVALID_JSON"
+        t = await redis_store._primary.create(make_tenant())
+        monkeypatch.setattr(fake_redis, "get", AsyncMock(return_value=b"not-json{{{"))
         # Should fall back to primary without raising
         result = await redis_store.get_by_id(t.id)
         assert result.id == t.id
@@ -115,6 +115,28 @@ class TestCreate:
         with pytest.raises(ValueError):
             await redis_store.create(t)
 
+    async def test_create_many_caches_every_tenant(
+        self,
+        redis_store: RedisTenantStore,
+        make_tenant: Callable[..., Tenant],
+        fake_redis: MagicMock,
+    ) -> None:
+        created = await redis_store.create_many([make_tenant(), make_tenant()])
+        assert await redis_store._primary.count() == 2
+        for t in created:
+            assert fake_redis._store.get(redis_store._id_key(t.id)) is not None
+            assert fake_redis._store.get(redis_store._slug_key(t.identifier)) is not None
+
+    async def test_create_many_cache_failure_does_not_propagate(
+        self,
+        redis_store: RedisTenantStore,
+        make_tenant: Callable[..., Tenant],
+        fake_redis: MagicMock,
+    ) -> None:
+        fake_redis.pipeline = MagicMock(side_effect=RuntimeError("Redis down"))
+        created = await redis_store.create_many([make_tenant()])
+        assert len(created) == 1
+
     async def test_cache_write_failure_does_not_propagate(
         self,
         redis_store: RedisTenantStore,
@@ -170,6 +192,15 @@ class TestUpdate:
         result = await redis_store.update(t.model_copy(update={"name": "Updated"}))
         assert result.name == "Updated"
 
+    async def test_get_old_tenant_corrupt_returns_none(
+        self,
+        redis_store: RedisTenantStore,
+        fake_redis: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(fake_redis, "get", AsyncMock(return_value=b"not-json{{{"))
+        assert await redis_store._get_old_tenant("any-id") is None
+
 
 class TestDelete:
     async def test_delete_removes_cache_keys(
@@ -248,8 +279,7 @@ class TestGetByIds:
         redis_store: RedisTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        t1 = await redis_store.create(make_tenant())
-        t2 = await redis_store.create(make_tenant())
+        t1, t2 = await redis_store.create_many([make_tenant(), make_tenant()])
         primary_batch = AsyncMock(wraps=redis_store._primary.get_by_ids)
         redis_store._primary.get_by_ids = primary_batch  # type: ignore[method-assign]
         results = await redis_store.get_by_ids([t1.id, t2.id])
@@ -266,7 +296,7 @@ class TestGetByIds:
         assert len(results) == 1
 
     async def test_empty_input_returns_empty(self, redis_store: RedisTenantStore) -> None:
-        assert await redis_store.get_by_ids([]) == []
+        assert not await redis_store.get_by_ids([])
 
     async def test_all_missing_returns_empty(self, redis_store: RedisTenantStore) -> None:
         assert await redis_store.get_by_ids(["x", "y"]) == []
@@ -276,9 +306,7 @@ class TestGetByIds:
         redis_store: RedisTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        t1 = await redis_store.create(make_tenant())
-        t2 = await redis_store.create(make_tenant())
-        t3 = await redis_store.create(make_tenant())
+        t1, t2, t3 = await redis_store.create_many([make_tenant(), make_tenant(), make_tenant()])
         results = await redis_store.get_by_ids([t3.id, t1.id, t2.id])
         assert [r.id for r in results] == [t3.id, t1.id, t2.id]
 
@@ -296,6 +324,19 @@ class TestGetByIds:
         assert len(results) == 1
         assert results[0].id == t.id
 
+    async def test_misses_written_back_in_one_pipeline(
+        self,
+        redis_store: RedisTenantStore,
+        make_tenant: Callable[..., Tenant],
+        fake_redis: MagicMock,
+    ) -> None:
+        created = await redis_store._primary.create_many(make_tenant() for _ in range(3))
+        with patch.object(fake_redis, "pipeline", wraps=fake_redis.pipeline) as pipeline:
+            results = await redis_store.get_by_ids([t.id for t in created])
+        assert len(results) == 3
+        assert pipeline.call_count == 2  # one lookup + one write-back
+        assert len(fake_redis._store) == 6
+
 
 class TestBulkUpdateStatus:
     async def test_updates_primary_and_refreshes_cache(
@@ -303,11 +344,23 @@ class TestBulkUpdateStatus:
         redis_store: RedisTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        t1 = await redis_store.create(make_tenant())
-        t2 = await redis_store.create(make_tenant())
+        t1, t2 = await redis_store.create_many([make_tenant(), make_tenant()])
         result = await redis_store.bulk_update_status([t1.id, t2.id], TenantStatus.SUSPENDED)
         assert len(result) == 2
-        assert all(t.status == TenantStatus.SUSPENDED for t in result)
+        assert all(t.status is TenantStatus.SUSPENDED for t in result)
+
+    async def test_cache_refreshed_in_one_pipeline(
+        self,
+        redis_store: RedisTenantStore,
+        make_tenant: Callable[..., Tenant],
+        fake_redis: MagicMock,
+    ) -> None:
+        created = await redis_store.create_many(make_tenant() for _ in range(3))
+        with patch.object(fake_redis, "pipeline", wraps=fake_redis.pipeline) as pipeline:
+            await redis_store.bulk_update_status([t.id for t in created], TenantStatus.SUSPENDED)
+        pipeline.assert_called_once()
+        cached = await redis_store.get_by_id(created[0].id)
+        assert cached.status == TenantStatus.SUSPENDED
 
     async def test_empty_input(self, redis_store: RedisTenantStore) -> None:
         assert await redis_store.bulk_update_status([], TenantStatus.ACTIVE) == []
@@ -328,18 +381,18 @@ class TestListCount:
         redis_store: RedisTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        await redis_store.create(make_tenant(status=TenantStatus.ACTIVE))
-        await redis_store.create(make_tenant(status=TenantStatus.SUSPENDED))
+        await redis_store.create_many(
+            [make_tenant(status=TenantStatus.ACTIVE), make_tenant(status=TenantStatus.SUSPENDED)]
+        )
         active = await redis_store.list(status=TenantStatus.ACTIVE)
-        assert all(t.status == TenantStatus.ACTIVE for t in active)
+        assert all(t.status is TenantStatus.ACTIVE for t in active)
 
     async def test_count_delegates_to_primary(
         self,
         redis_store: RedisTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        await redis_store.create(make_tenant())
-        await redis_store.create(make_tenant())
+        await redis_store.create_many([make_tenant(), make_tenant()])
         assert await redis_store.count() == 2
 
     async def test_count_by_status(
@@ -347,8 +400,9 @@ class TestListCount:
         redis_store: RedisTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        await redis_store.create(make_tenant(status=TenantStatus.ACTIVE))
-        await redis_store.create(make_tenant(status=TenantStatus.SUSPENDED))
+        await redis_store.create_many(
+            [make_tenant(status=TenantStatus.ACTIVE), make_tenant(status=TenantStatus.SUSPENDED)]
+        )
         assert await redis_store.count(status=TenantStatus.ACTIVE) == 1
 
 
@@ -382,11 +436,24 @@ class TestCacheManagement:
         redis_store: RedisTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        await redis_store.create(make_tenant())
-        await redis_store.create(make_tenant())
+        await redis_store.create_many([make_tenant(), make_tenant()])
         deleted = await redis_store.invalidate_all()
         assert deleted == 4  # 2 tenants x 2 keys each
 
+    async def test_invalidate_all_unlinks_in_batches(
+        self,
+        redis_store: RedisTenantStore,
+        make_tenant: Callable[..., Tenant],
+        fake_redis: MagicMock,
+    ) -> None:
+        await redis_store.create_many(make_tenant() for _ in range(3))
+        with (
+            patch("fastapi_tenancy.storage.redis._INVALIDATE_BATCH_SIZE", 4),
+            patch.object(fake_redis, "unlink", wraps=fake_redis.unlink) as unlink,
+        ):
+            assert await redis_store.invalidate_all() == 6
+        assert [len(c.args) for c in unlink.call_args_list] == [4, 2]
+
     async def test_invalidate_all_empty_store_returns_zero(
         self, redis_store: RedisTenantStore
     ) -> None:
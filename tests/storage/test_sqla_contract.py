@@ -12,7 +12,7 @@ from fastapi_tenancy.core.exceptions import TenancyError, TenantNotFoundError
 from fastapi_tenancy.core.types import IsolationStrategy, Tenant, TenantStatus
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
 
     from fastapi_tenancy.storage.database import SQLAlchemyTenantStore
 
@@ -48,18 +48,6 @@ class TestSQLACreateRead:
         fetched = await any_sqla_store.get_by_identifier("sqla-slug")
         assert fetched.id == t.id
 
-    async def test_get_by_id_missing_raises_not_found(
-        self, any_sqla_store: SQLAlchemyTenantStore
-    ) -> None:
-        with pytest.raises(TenantNotFoundError):
-            await any_sqla_store.get_by_id("does-not-exist")
-
-    async def test_get_by_identifier_missing_raises_not_found(
-        self, any_sqla_store: SQLAlchemyTenantStore
-    ) -> None:
-        with pytest.raises(TenantNotFoundError):
-            await any_sqla_store.get_by_identifier("ghost-slug")
-
     async def test_metadata_roundtrip(
         self,
         any_sqla_store: SQLAlchemyTenantStore,
@@ -103,6 +91,30 @@ class TestSQLACreateRead:
         assert fetched.updated_at.tzinfo is not None
 
 
+#: Every single-tenant operation, applied to a tenant that was never stored.
+_MISSING_TENANT_CALLS = [
+    pytest.param(lambda s, ghost: s.get_by_id(ghost.id), id="get_by_id"),
+    pytest.param(lambda s, ghost: s.get_by_identifier(ghost.identifier), id="get_by_identifier"),
+    pytest.param(lambda s, ghost: s.update(ghost), id="update"),
+    pytest.param(lambda s, ghost: s.delete(ghost.id), id="delete"),
+    pytest.param(lambda s, ghost: s.set_status(ghost.id, TenantStatus.ACTIVE), id="set_status"),
+    pytest.param(lambda s, ghost: s.update_metadata(ghost.id, {"k": "v"}), id="update_metadata"),
+]
+
+
+@pytest.mark.integration
+class TestSQLANotFound:
+    @pytest.mark.parametrize("call", _MISSING_TENANT_CALLS)
+    async def test_missing_tenant_raises_not_found(
+        self,
+        any_sqla_store: SQLAlchemyTenantStore,
+        make_tenant: Callable[..., Tenant],
+        call: Callable[[SQLAlchemyTenantStore, Tenant], Awaitable[Tenant | None]],
+    ) -> None:
+        with pytest.raises(TenantNotFoundError):
+            await call(any_sqla_store, make_tenant())
+
+
 @pytest.mark.integration
 class TestSQLAConstraints:
     async def test_duplicate_id_raises_value_error(
@@ -146,6 +158,32 @@ class TestSQLAConstraints:
             await any_sqla_store.create(make_tenant())
 
 
+@pytest.mark.integration
+class TestSQLACreateMany:
+    async def test_returns_tenants_in_input_order(
+        self,
+        any_sqla_store: SQLAlchemyTenantStore,
+        make_tenant: Callable[..., Tenant],
+    ) -> None:
+        tenants = [make_tenant() for _ in range(3)]
+        created = await any_sqla_store.create_many(tenants)
+        assert [t.id for t in created] == [t.id for t in tenants]
+        assert await any_sqla_store.count() == 3
+
+    async def test_empty_input_returns_empty(self, any_sqla_store: SQLAlchemyTenantStore) -> None:
+        assert await any_sqla_store.create_many([]) == []
+
+    async def test_duplicate_rolls_back_whole_batch(
+        self,
+        any_sqla_store: SQLAlchemyTenantStore,
+        make_tenant: Callable[..., Tenant],
+    ) -> None:
+        existing = await any_sqla_store.create(make_tenant(identifier="taken"))
+        with pytest.raises(ValueError, match="already exist"):
+            await any_sqla_store.create_many([make_tenant(), make_tenant(identifier="taken")])
+        assert [t.id for t in await any_sqla_store.list()] == [existing.id]
+
+
 @pytest.mark.integration
 class TestSQLAUpdate:
     async def test_update_name(
@@ -178,22 +216,14 @@ class TestSQLAUpdate:
         result = await any_sqla_store.update(t.model_copy(update={"name": "New"}))
         assert result.updated_at >= t.updated_at
 
-    async def test_update_missing_raises_not_found(
-        self,
-        any_sqla_store: SQLAlchemyTenantStore,
-        make_tenant: Callable[..., Tenant],
-    ) -> None:
-        ghost = make_tenant()
-        with pytest.raises(TenantNotFoundError):
-            await any_sqla_store.update(ghost)
-
     async def test_update_identifier_conflict_raises_value_error(
         self,
         any_sqla_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        await any_sqla_store.create(make_tenant(identifier="slug-1"))
-        t2 = await any_sqla_store.create(make_tenant(identifier="slug-2"))
+        _, t2 = await any_sqla_store.create_many(
+            [make_tenant(identifier="slug-1"), make_tenant(identifier="slug-2")]
+        )
         with pytest.raises(ValueError):
             # Try to rename t2 to t1's identifier
             await any_sqla_store.update(t2.model_copy(update={"identifier": "slug-1"}))
@@ -231,12 +261,6 @@ class TestSQLADelete:
         with pytest.raises(TenantNotFoundError):
             await any_sqla_store.get_by_id(t.id)
 
-    async def test_delete_missing_raises_not_found(
-        self, any_sqla_store: SQLAlchemyTenantStore
-    ) -> None:
-        with pytest.raises(TenantNotFoundError):
-            await any_sqla_store.delete("ghost-id")
-
     async def test_delete_twice_raises(
         self,
         any_sqla_store: SQLAlchemyTenantStore,
@@ -277,30 +301,30 @@ class TestSQLAListCountExists:
         any_sqla_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        t1 = await any_sqla_store.create(make_tenant(created_at=_ts(-3)))
-        t2 = await any_sqla_store.create(make_tenant(created_at=_ts(-2)))
-        t3 = await any_sqla_store.create(make_tenant(created_at=_ts(-1)))
+        t1, t2, t3 = await any_sqla_store.create_many(
+            make_tenant(created_at=_ts(offset)) for offset in (-3, -2, -1)
+        )
         results = await any_sqla_store.list()
-        ids = [r.id for r in results]
-        assert ids.index(t3.id) < ids.index(t2.id) < ids.index(t1.id)
+        pos = {r.id: i for i, r in enumerate(results)}
+        assert pos[t3.id] < pos[t2.id] < pos[t1.id]
 
     async def test_list_filter_by_status(
         self,
         any_sqla_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        await any_sqla_store.create(make_tenant(status=TenantStatus.ACTIVE))
-        await any_sqla_store.create(make_tenant(status=TenantStatus.SUSPENDED))
+        await any_sqla_store.create_many(
+            [make_tenant(status=TenantStatus.ACTIVE), make_tenant(status=TenantStatus.SUSPENDED)]
+        )
         active = await any_sqla_store.list(status=TenantStatus.ACTIVE)
-        assert all(t.status == TenantStatus.ACTIVE for t in active)
+        assert all(t.status is TenantStatus.ACTIVE for t in active)
 
     async def test_list_pagination(
         self,
         any_sqla_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        for _ in range(5):
-            await any_sqla_store.create(make_tenant())
+        await any_sqla_store.create_many(make_tenant() for _ in range(5))
         page = await any_sqla_store.list(skip=2, limit=2)
         assert len(page) == 2
 
@@ -309,8 +333,7 @@ class TestSQLAListCountExists:
         any_sqla_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        await any_sqla_store.create(make_tenant())
-        await any_sqla_store.create(make_tenant())
+        await any_sqla_store.create_many([make_tenant(), make_tenant()])
         assert await any_sqla_store.count() == 2
 
     async def test_count_by_status(
@@ -318,8 +341,9 @@ class TestSQLAListCountExists:
         any_sqla_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        await any_sqla_store.create(make_tenant(status=TenantStatus.ACTIVE))
-        await any_sqla_store.create(make_tenant(status=TenantStatus.SUSPENDED))
+        await any_sqla_store.create_many(
+            [make_tenant(status=TenantStatus.ACTIVE), make_tenant(status=TenantStatus.SUSPENDED)]
+        )
         assert await any_sqla_store.count(status=TenantStatus.ACTIVE) == 1
         assert await any_sqla_store.count(status=TenantStatus.SUSPENDED) == 1
         assert await any_sqla_store.count(status=TenantStatus.DELETED) == 0
@@ -349,12 +373,6 @@ class TestSQLASetStatus:
         assert result.status == TenantStatus.SUSPENDED
         assert (await any_sqla_store.get_by_id(t.id)).status == TenantStatus.SUSPENDED
 
-    async def test_set_status_missing_raises_not_found(
-        self, any_sqla_store: SQLAlchemyTenantStore
-    ) -> None:
-        with pytest.raises(TenantNotFoundError):
-            await any_sqla_store.set_status("ghost", TenantStatus.ACTIVE)
-
     async def test_set_status_all_values(
         self,
         any_sqla_store: SQLAlchemyTenantStore,
@@ -396,10 +414,6 @@ class TestSQLAUpdateMetadata:
         result = await any_sqla_store.update_metadata(t.id, {"b": 2})
         assert result.metadata == {"a": 1, "b": 2}
 
-    async def test_missing_raises_not_found(self, any_sqla_store: SQLAlchemyTenantStore) -> None:
-        with pytest.raises(TenantNotFoundError):
-            await any_sqla_store.update_metadata("ghost", {"k": "v"})
-
     async def test_corrupted_metadata_gracefully_replaced(
         self,
         any_sqla_store: SQLAlchemyTenantStore,
@@ -423,8 +437,7 @@ class TestSQLAGetByIds:
         any_sqla_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        t1 = await any_sqla_store.create(make_tenant())
-        t2 = await any_sqla_store.create(make_tenant())
+        t1, t2 = await any_sqla_store.create_many([make_tenant(), make_tenant()])
         results = await any_sqla_store.get_by_ids([t1.id, t2.id])
         assert {r.id for r in results} == {t1.id, t2.id}
 
@@ -438,7 +451,7 @@ class TestSQLAGetByIds:
         assert len(results) == 1
 
     async def test_empty_input_returns_empty(self, any_sqla_store: SQLAlchemyTenantStore) -> None:
-        assert await any_sqla_store.get_by_ids([]) == []
+        assert not await any_sqla_store.get_by_ids([])
 
     async def test_all_missing_returns_empty(self, any_sqla_store: SQLAlchemyTenantStore) -> None:
         assert await any_sqla_store.get_by_ids(["a", "b"]) == []
@@ -451,8 +464,12 @@ class TestSQLASearch:
         any_sqla_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        await any_sqla_store.create(make_tenant(identifier="search-acme", name="Acme Corp"))
-        await any_sqla_store.create(make_tenant(identifier="search-globex", name="Globex"))
+        await any_sqla_store.create_many(
+            [
+                make_tenant(identifier="search-acme", name="Acme Corp"),
+                make_tenant(identifier="search-globex", name="Globex"),
+            ]
+        )
         results = await any_sqla_store.search("acme")
         assert len(results) == 1
         assert results[0].identifier == "search-acme"
@@ -471,8 +488,9 @@ class TestSQLASearch:
         any_sqla_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        for i in range(10):
-            await any_sqla_store.create(make_tenant(identifier=f"match-{i:02d}", name=f"Match {i}"))
+        await any_sqla_store.create_many(
+            make_tenant(identifier=f"match-{i:02d}", name=f"Match {i}") for i in range(10)
+        )
         results = await any_sqla_store.search("match", limit=3)
         assert len(results) == 3
 
@@ -496,11 +514,10 @@ class TestSQLABulkUpdateStatus:
         any_sqla_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        t1 = await any_sqla_store.create(make_tenant())
-        t2 = await any_sqla_store.create(make_tenant())
+        t1, t2 = await any_sqla_store.create_many([make_tenant(), make_tenant()])
         result = await any_sqla_store.bulk_update_status([t1.id, t2.id], TenantStatus.SUSPENDED)
         assert len(result) == 2
-        assert all(t.status == TenantStatus.SUSPENDED for t in result)
+        assert all(t.status is TenantStatus.SUSPENDED for t in result)
 
     async def test_empty_input_returns_empty(self, any_sqla_store: SQLAlchemyTenantStore) -> None:
         assert await any_sqla_store.bulk_update_status([], TenantStatus.ACTIVE) == []
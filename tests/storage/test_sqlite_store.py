@@ -2,24 +2,27 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import functools
 import os
+import secrets
 import socket
-from typing import TYPE_CHECKING
-import uuid
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 
 import pytest
-from sqlalchemy import text
+from sqlalchemy import event, text
 
 from fastapi_tenancy.core.exceptions import TenancyError, TenantNotFoundError
 from fastapi_tenancy.core.types import Tenant, TenantStatus
 from fastapi_tenancy.storage.database import SQLAlchemyTenantStore
 from fastapi_tenancy.utils.db_compat import DbDialect
+from tests._helpers import NOW
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
 
+@functools.cache
 def _pg_up() -> bool:
     try:
         with socket.create_connection(("localhost", 5432), timeout=1.0):
@@ -39,6 +42,21 @@ class TestSQLiteDialect:
         pool = sqlite_store._engine.pool
         assert isinstance(pool, StaticPool)
 
+    async def test_single_connection_reused(self, sqlite_store: SQLAlchemyTenantStore) -> None:
+        """Every checkout returns the same aiosqlite connection (one worker thread)."""
+        async with sqlite_store._engine.connect() as c1:
+            first = (await c1.get_raw_connection()).driver_connection
+        async with sqlite_store._engine.connect() as c2:
+            second = (await c2.get_raw_connection()).driver_connection
+        assert first is second
+
+    async def test_connection_pragmas_applied(self, sqlite_store: SQLAlchemyTenantStore) -> None:
+        async with sqlite_store._engine.connect() as conn:
+            mode = (await conn.execute(text("PRAGMA locking_mode"))).scalar()
+            temp_store = (await conn.execute(text("PRAGMA temp_store"))).scalar()
+        assert mode == "exclusive"
+        assert temp_store == 2  # MEMORY
+
     async def test_two_separate_stores_isolated(self) -> None:
         """Two in-memory SQLite stores must not share the same database."""
         s1 = SQLAlchemyTenantStore("sqlite+aiosqlite:///:memory:")
@@ -50,8 +68,8 @@ class TestSQLiteDialect:
                 id="iso-t1",
                 identifier="iso-slug",
                 name="Isolated",
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
+                created_at=NOW,
+                updated_at=NOW,
             )
             await s1.create(t)
             # s2 must not see t
@@ -98,19 +116,22 @@ class TestSQLiteGenericMetadataMerge:
 
 
 @pytest.mark.integration
-class TestSQLiteBulkUpdateFallback:
-    """Covers the non-RETURNING bulk_update_status path on SQLite."""
+class TestSQLiteBulkUpdateStatus:
+    """Covers bulk_update_status on SQLite, which takes the ``UPDATE … RETURNING`` path.
+
+    The UPDATE-then-SELECT fallback for dialects without RETURNING is covered
+    by ``test_bulk_update_status_without_returning_selects_after``.
+    """
 
     async def test_bulk_status_update_all(
         self,
         sqlite_store: SQLAlchemyTenantStore,
         make_tenant: Callable[..., Tenant],
     ) -> None:
-        t1 = await sqlite_store.create(make_tenant())
-        t2 = await sqlite_store.create(make_tenant())
+        t1, t2 = await sqlite_store.create_many([make_tenant(), make_tenant()])
         result = await sqlite_store.bulk_update_status([t1.id, t2.id], TenantStatus.SUSPENDED)
         assert len(result) == 2
-        assert all(t.status == TenantStatus.SUSPENDED for t in result)
+        assert all(t.status is TenantStatus.SUSPENDED for t in result)
 
     async def test_bulk_status_empty(self, sqlite_store: SQLAlchemyTenantStore) -> None:
         assert await sqlite_store.bulk_update_status([], TenantStatus.ACTIVE) == []
@@ -172,6 +193,137 @@ class TestSQLiteNaiveDatetimeCoercion:
         assert fetched.updated_at.tzinfo is not None
 
 
+@pytest.fixture
+def statements(sqlite_store: SQLAlchemyTenantStore) -> Iterator[list[str]]:
+    """Record every SQL statement *sqlite_store* sends to its DBAPI cursor."""
+    seen: list[str] = []
+
+    def _record(*args: Any) -> None:
+        seen.append(args[2])  # (conn, cursor, statement, parameters, context, executemany)
+
+    engine = sqlite_store._engine.sync_engine
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield seen
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+@pytest.mark.integration
+class TestSQLiteQueryPlans:
+    async def test_filtered_list_walks_status_created_at_index(
+        self,
+        sqlite_store: SQLAlchemyTenantStore,
+        statements: list[str],
+    ) -> None:
+        """``WHERE status = ? ORDER BY created_at DESC`` must not sort in a temp B-tree."""
+        await sqlite_store.list(status=TenantStatus.ACTIVE, limit=10)
+        (query,) = statements
+        async with sqlite_store._engine.connect() as conn:
+            plan = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {query}", ("active", 10, 0))
+            details = [row._mapping["detail"] for row in plan]
+        assert any("ix_tenants_status_created_at" in d for d in details), details
+        assert not any("TEMP B-TREE" in d for d in details), details
+
+
+@pytest.mark.integration
+class TestSQLiteRoundTrips:
+    """Batch reads and writes must cost one statement, not one per row."""
+
+    async def test_list_is_single_select(
+        self,
+        sqlite_store: SQLAlchemyTenantStore,
+        make_tenant: Callable[..., Tenant],
+        statements: list[str],
+    ) -> None:
+        await sqlite_store.create_many(make_tenant() for _ in range(5))
+        statements.clear()
+        assert len(await sqlite_store.list()) == 5
+        assert len(statements) == 1
+
+    async def test_get_by_ids_is_single_select(
+        self,
+        sqlite_store: SQLAlchemyTenantStore,
+        make_tenant: Callable[..., Tenant],
+        statements: list[str],
+    ) -> None:
+        created = await sqlite_store.create_many(make_tenant() for _ in range(5))
+        statements.clear()
+        assert len(await sqlite_store.get_by_ids(t.id for t in created)) == 5
+        assert len(statements) == 1
+
+    async def test_get_by_ids_chunks_long_id_lists(
+        self,
+        sqlite_store: SQLAlchemyTenantStore,
+        make_tenant: Callable[..., Tenant],
+        statements: list[str],
+    ) -> None:
+        created = await sqlite_store.create_many(make_tenant() for _ in range(5))
+        ids = [t.id for t in created]
+        statements.clear()
+        with patch("fastapi_tenancy.storage.database._IN_CHUNK_SIZE", 2):
+            found = await sqlite_store.get_by_ids([*ids, ids[0]])
+        assert sorted(t.id for t in found) == sorted(ids)
+        assert len(statements) == 3
+
+    async def test_create_many_is_single_insert(
+        self,
+        sqlite_store: SQLAlchemyTenantStore,
+        make_tenant: Callable[..., Tenant],
+        statements: list[str],
+    ) -> None:
+        await sqlite_store.create_many(make_tenant() for _ in range(5))
+        assert len(statements) == 1
+        assert statements[0].lstrip().upper().startswith("INSERT")
+
+    async def test_bulk_update_status_is_single_update(
+        self,
+        sqlite_store: SQLAlchemyTenantStore,
+        make_tenant: Callable[..., Tenant],
+        statements: list[str],
+    ) -> None:
+        created = await sqlite_store.create_many(make_tenant() for _ in range(5))
+        statements.clear()
+        updated = await sqlite_store.bulk_update_status(
+            [t.id for t in created], TenantStatus.SUSPENDED
+        )
+        assert all(t.status is TenantStatus.SUSPENDED for t in updated)
+        assert len(updated) == 5
+        assert len(statements) == 1
+        assert "RETURNING" in statements[0].upper()
+
+    async def test_bulk_update_status_without_returning_selects_after(
+        self,
+        sqlite_store: SQLAlchemyTenantStore,
+        make_tenant: Callable[..., Tenant],
+        statements: list[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(sqlite_store._engine.dialect, "update_returning", False)
+        created = await sqlite_store.create_many(make_tenant() for _ in range(3))
+        statements.clear()
+        updated = await sqlite_store.bulk_update_status(
+            [t.id for t in created], TenantStatus.SUSPENDED
+        )
+        assert all(t.status is TenantStatus.SUSPENDED for t in updated)
+        assert [s.lstrip().split()[0].upper() for s in statements] == ["UPDATE", "SELECT"]
+
+    async def test_bulk_update_status_chunks_long_id_lists(
+        self,
+        sqlite_store: SQLAlchemyTenantStore,
+        make_tenant: Callable[..., Tenant],
+        statements: list[str],
+    ) -> None:
+        created = await sqlite_store.create_many(make_tenant() for _ in range(5))
+        ids = [t.id for t in created]
+        statements.clear()
+        with patch("fastapi_tenancy.storage.database._IN_CHUNK_SIZE", 2):
+            updated = await sqlite_store.bulk_update_status([*ids, ids[0]], TenantStatus.SUSPENDED)
+        assert sorted(t.id for t in updated) == sorted(ids)
+        assert len({t.updated_at for t in updated}) == 1
+        assert len(statements) == 3
+
+
 @pytest.mark.integration
 class TestSearchDialect:
     """FIX: search() must work on SQLite (LIKE) and PostgreSQL (ILIKE)."""
@@ -180,9 +332,13 @@ class TestSearchDialect:
         store = SQLAlchemyTenantStore("sqlite+aiosqlite:///:memory:")
         await store.initialize()
         try:
-            await store.create(make_tenant(identifier="alpha-corp", name="Alpha Corporation"))
-            await store.create(make_tenant(identifier="beta-inc", name="Beta Incorporated"))
-            await store.create(make_tenant(identifier="gamma-llc", name="Gamma LLC"))
+            await store.create_many(
+                [
+                    make_tenant(identifier="alpha-corp", name="Alpha Corporation"),
+                    make_tenant(identifier="beta-inc", name="Beta Incorporated"),
+                    make_tenant(identifier="gamma-llc", name="Gamma LLC"),
+                ]
+            )
             results = await store.search("alpha")
             ids = [r.identifier for r in results]
             assert "alpha-corp" in ids
@@ -194,9 +350,13 @@ class TestSearchDialect:
         store = SQLAlchemyTenantStore("sqlite+aiosqlite:///:memory:")
         await store.initialize()
         try:
-            await store.create(make_tenant(identifier="acme-widgets", name="Acme Widget Co"))
-            await store.create(make_tenant(identifier="acme-anvils", name="Acme Anvil Co"))
-            await store.create(make_tenant(identifier="staple-inc", name="Staple Inc"))
+            await store.create_many(
+                [
+                    make_tenant(identifier="acme-widgets", name="Acme Widget Co"),
+                    make_tenant(identifier="acme-anvils", name="Acme Anvil Co"),
+                    make_tenant(identifier="staple-inc", name="Staple Inc"),
+                ]
+            )
             results = await store.search("acme")
             ids = {r.identifier for r in results}
             assert "acme-widgets" in ids
@@ -210,8 +370,7 @@ class TestSearchDialect:
         store = SQLAlchemyTenantStore("sqlite+aiosqlite:///:memory:")
         await store.initialize()
         try:
-            for i in range(5):
-                await store.create(make_tenant(identifier=f"safe-tenant-{i}"))
+            await store.create_many(make_tenant(identifier=f"safe-tenant-{i}") for i in range(5))
             results = await store.search("%")
             assert len(results) == 0
         finally:
@@ -228,11 +387,10 @@ class TestSearchDialect:
         store = SQLAlchemyTenantStore(pg_url, pool_size=2, max_overflow=2)
         await store.initialize()
         try:
-            uid = uuid.uuid4().hex[:6]
+            uid = secrets.token_hex(3)
             t1 = make_tenant(identifier=f"pg-search-{uid}-alpha")
             t2 = make_tenant(identifier=f"pg-search-{uid}-beta")
-            await store.create(t1)
-            await store.create(t2)
+            await store.create_many([t1, t2])
             results = await store.search(f"pg-search-{uid}")
             ids = {r.identifier for r in results}
             assert t1.identifier in ids
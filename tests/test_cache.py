@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from datetime import UTC, datetime
 import time
 from unittest.mock import patch
 
@@ -14,20 +13,24 @@ from fastapi_tenancy.core.config import TenancyConfig
 from fastapi_tenancy.core.types import IsolationStrategy, ResolutionStrategy, Tenant, TenantStatus
 from fastapi_tenancy.manager import TenancyManager, _CachingStoreProxy
 from fastapi_tenancy.storage.memory import InMemoryTenantStore
+from tests._helpers import NOW
 
 
 def _t(tid: str, identifier: str) -> Tenant:
-    ts = datetime.now(UTC)
-    return Tenant(
+    return Tenant.model_construct(
         id=tid,
         identifier=identifier,
         name=f"T{tid}",
         status=TenantStatus.ACTIVE,
-        created_at=ts,
-        updated_at=ts,
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
+#: ``t0`` … ``t19`` with identifiers ``ten-000`` …, built once for the bulk-fill tests.
+_NUMBERED: tuple[Tenant, ...] = tuple(_t(f"t{i}", f"ten-{i:03d}") for i in range(20))
+
+
 class TestInit:
     def test_default_params(self) -> None:
         c = TenantCache()
@@ -143,8 +146,8 @@ class TestLRUEviction:
 
     def test_size_never_exceeds_max(self) -> None:
         c = TenantCache(max_size=5, ttl=3600)
-        for i in range(20):
-            c.set(_t(f"t{i}", f"ten-{i:03d}"))
+        for t in _NUMBERED:
+            c.set(t)
         assert c.size() <= 5
 
     def test_evict_lru_on_empty_cache_does_nothing(self) -> None:
@@ -184,8 +187,8 @@ class TestInvalidation:
 
     def test_clear_returns_count(self) -> None:
         c = TenantCache(ttl=3600)
-        for i in range(5):
-            c.set(_t(f"t{i}", f"ten-{i:03d}"))
+        for t in _NUMBERED[:5]:
+            c.set(t)
         count = c.clear()
         assert count == 5
         assert c.size() == 0
@@ -224,8 +227,8 @@ class TestStats:
 class TestPurgeExpired:
     def test_purge_removes_stale_entries(self) -> None:
         c = TenantCache(ttl=1)
-        for i in range(5):
-            c.set(_t(f"t{i}", f"ten-{i:03d}"))
+        for t in _NUMBERED[:5]:
+            c.set(t)
         with patch("fastapi_tenancy.cache.tenant_cache.time") as mock_time:
             mock_time.monotonic.return_value = time.monotonic() + 100
             evicted = c.purge_expired()
@@ -411,8 +414,7 @@ class TestCacheLockSafety:
 
         backing = InMemoryTenantStore()
         l1 = TenantCache(max_size=100, ttl=60)
-        for i in range(10):
-            await backing.create(_t(f"t{i}", f"concurrent-{i:03d}"))
+        await backing.create_many(_t(f"t{i}", f"concurrent-{i:03d}") for i in range(10))
 
         proxy = _CachingStoreProxy(backing, l1)
         # Resolve all tenants concurrently — would race without the lock.
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from typing import Any
+from unittest.mock import patch
 import warnings
 
 from pydantic import ValidationError
@@ -24,6 +25,17 @@ def _clear_tenancy_env(monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.delenv(var, raising=False)
 
 
+def env_config(**env: str) -> TenancyConfig:
+    """Build a config from ``TENANCY_<NAME>`` variables set for this call only.
+
+    One ``patch.dict`` applies and restores the whole set at once, instead of
+    a ``monkeypatch.setenv`` (and its undo entry) per variable.
+    """
+    overrides = {f"TENANCY_{name.upper()}": value for name, value in env.items()}
+    with patch.dict(os.environ, overrides):
+        return TenancyConfig()
+
+
 def make_config(**kwargs: Any) -> TenancyConfig:
     return TenancyConfig(database_url=SQLITE_URL, **kwargs)
 
@@ -76,6 +88,21 @@ class TestTenancyConfigDefaults:
         assert c.max_tenants is None
 
 
+class TestEnvOverride:
+    def test_env_prefix_tenancy(self) -> None:
+        c = env_config(database_url=SQLITE_URL, schema_prefix="env_")
+        assert c.database_url == SQLITE_URL
+        assert c.schema_prefix == "env_"
+
+    def test_env_resolution_strategy(self) -> None:
+        c = env_config(database_url=SQLITE_URL, resolution_strategy="path")
+        assert c.resolution_strategy == ResolutionStrategy.PATH
+
+    def test_env_is_restored(self) -> None:
+        env_config(database_url=SQLITE_URL)
+        assert "TENANCY_DATABASE_URL" not in os.environ
+
+
 class TestDatabaseUrlValidation:
     def test_valid_async_url(self) -> None:
         c = make_config()
@@ -94,7 +121,7 @@ class TestDatabaseUrlValidation:
 
 class TestJwtSecretValidation:
     def test_jwt_required_when_strategy_jwt(self) -> None:
-        with pytest.raises(Exception, match="jwt_secret"):
+        with pytest.raises(ValidationError, match="jwt_secret"):
             TenancyConfig(
                 database_url=SQLITE_URL,
                 resolution_strategy=ResolutionStrategy.JWT,
@@ -102,7 +129,7 @@ class TestJwtSecretValidation:
             )
 
     def test_jwt_secret_too_short(self) -> None:
-        with pytest.raises(Exception, match="32 characters"):
+        with pytest.raises(ValidationError, match="32 characters"):
             TenancyConfig(
                 database_url=SQLITE_URL,
                 resolution_strategy=ResolutionStrategy.JWT,
@@ -124,7 +151,7 @@ class TestJwtSecretValidation:
 
 class TestDomainSuffixValidation:
     def test_domain_suffix_required_for_subdomain(self) -> None:
-        with pytest.raises(Exception, match="domain_suffix"):
+        with pytest.raises(ValidationError, match="domain_suffix"):
             TenancyConfig(
                 database_url=SQLITE_URL,
                 resolution_strategy=ResolutionStrategy.SUBDOMAIN,
@@ -141,11 +168,11 @@ class TestDomainSuffixValidation:
 
 class TestEncryptionKeyValidation:
     def test_key_required_when_encryption_enabled(self) -> None:
-        with pytest.raises(Exception, match="encryption_key"):
+        with pytest.raises(ValidationError, match="encryption_key"):
             TenancyConfig(database_url=SQLITE_URL, enable_encryption=True)
 
     def test_key_too_short(self) -> None:
-        with pytest.raises(Exception, match="32 characters"):
+        with pytest.raises(ValidationError, match="32 characters"):
             TenancyConfig(
                 database_url=SQLITE_URL,
                 enable_encryption=True,
@@ -239,15 +266,19 @@ class TestCrossFieldConsistency:
 
 
 class TestHelperMethods:
+    @pytest.fixture
+    def cfg(self) -> TenancyConfig:
+        """Fresh default config for each helper check in this class."""
+        return make_config()
+
     def test_get_schema_name(self) -> None:
         c = make_config(schema_prefix="tenant_")
         assert c.get_schema_name("acme-corp") == "tenant_acme_corp"
         assert c.get_schema_name("globex") == "tenant_globex"
 
-    def test_get_schema_name_invalid_identifier(self) -> None:
-        c = make_config()
+    def test_get_schema_name_invalid_identifier(self, cfg: TenancyConfig) -> None:
         with pytest.raises(ValueError, match="Invalid tenant identifier"):
-            c.get_schema_name("-invalid-")
+            cfg.get_schema_name("-invalid-")
 
     def test_get_database_url_for_tenant_with_template(self) -> None:
         c = TenancyConfig(
@@ -258,10 +289,9 @@ class TestHelperMethods:
         url = c.get_database_url_for_tenant("tenant-abc123")
         assert "tenant_abc123" in url
 
-    def test_get_database_url_for_tenant_no_template(self) -> None:
-        c = make_config()
+    def test_get_database_url_for_tenant_no_template(self, cfg: TenancyConfig) -> None:
         # Without template, falls back to the base database_url
-        url = c.get_database_url_for_tenant("t1")
+        url = cfg.get_database_url_for_tenant("t1")
         assert url == SQLITE_URL
 
     def test_is_premium_tenant(self) -> None:
@@ -275,9 +305,8 @@ class TestHelperMethods:
         assert c.is_premium_tenant("t-premium1") is True
         assert c.is_premium_tenant("t-standard") is False
 
-    def test_is_premium_tenant_empty_list(self) -> None:
-        c = make_config()
-        assert c.is_premium_tenant("any-tenant") is False
+    def test_is_premium_tenant_empty_list(self, cfg: TenancyConfig) -> None:
+        assert cfg.is_premium_tenant("any-tenant") is False
 
     def test_get_isolation_strategy_non_hybrid(self) -> None:
         c = make_config(isolation_strategy=IsolationStrategy.SCHEMA)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import UTC, datetime
+import functools
 from typing import TYPE_CHECKING, Any
 
 import pytest
@@ -16,19 +16,10 @@ from fastapi_tenancy.core.context import (
 )
 from fastapi_tenancy.core.exceptions import TenantNotFoundError
 from fastapi_tenancy.core.types import Tenant, TenantStatus
+from tests._helpers import NOW
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
-
-
-@pytest.fixture
-def tenant() -> Tenant:
-    return Tenant(id="ctx-t1", identifier="ctx-acme", name="Ctx Acme")
-
-
-@pytest.fixture
-def other_tenant() -> Tenant:
-    return Tenant(id="ctx-t2", identifier="ctx-globex", name="Ctx Globex")
+    from collections.abc import Callable, Generator
 
 
 def _make_tenant(
@@ -37,29 +28,66 @@ def _make_tenant(
     identifier: str = "fix-tenant",
     status: TenantStatus = TenantStatus.ACTIVE,
 ) -> Tenant:
-    now = datetime.now(UTC)
-    return Tenant(
+    return Tenant.model_construct(
         id=tenant_id,
         identifier=identifier,
         name=identifier.title(),
         status=status,
-        created_at=now,
-        updated_at=now,
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
+@pytest.fixture
+def tenant() -> Tenant:
+    return _make_tenant(tenant_id="ctx-t1", identifier="ctx-acme")
+
+
+@pytest.fixture
+def other_tenant() -> Tenant:
+    return _make_tenant(tenant_id="ctx-t2", identifier="ctx-globex")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _initial_clear() -> None:
+    """Discard any context leaked by earlier modules before this one starts."""
+    TenantContext.clear()
+
+
 @pytest.fixture(autouse=True)
 def clean_context() -> Generator[Any, Any, Any]:
-    """Always clear context before and after each test."""
-    TenantContext.clear()
+    """Clear context after each test.
+
+    Every test ends with a clear, and ``_initial_clear`` covers the first
+    one, so each test already starts from an empty context.
+    """
     yield
     TenantContext.clear()
 
 
+#: Read-only accessors and what each returns on an empty context.
+_UNSET_READS = (
+    pytest.param(TenantContext.get_optional, None, id="get_optional"),
+    pytest.param(functools.partial(TenantContext.get_metadata, "key"), None, id="get_metadata"),
+    pytest.param(TenantContext.get_all_metadata, {}, id="get_all_metadata"),
+)
+
+
 class TestTenantContextSet:
-    def test_set_and_get(self, tenant: Tenant) -> None:
+    @pytest.mark.parametrize(
+        "read",
+        [
+            pytest.param(TenantContext.get, id="get"),
+            pytest.param(TenantContext.get_optional, id="get_optional"),
+        ],
+    )
+    def test_set_then_read(self, tenant: Tenant, read: Callable[[], Tenant | None]) -> None:
         TenantContext.set(tenant)
-        assert TenantContext.get() == tenant
+        assert read() == tenant
+
+    @pytest.mark.parametrize(("read", "expected"), _UNSET_READS)
+    def test_reads_when_unset(self, read: Callable[[], Any], expected: Any) -> None:
+        assert read() == expected
 
     def test_set_returns_token(self, tenant: Tenant) -> None:
         token = TenantContext.set(tenant)
@@ -79,13 +107,6 @@ class TestTenantContextSet:
             TenantContext.get()
         assert exc_info.value.details.get("hint")
 
-    def test_get_optional_returns_none_when_unset(self) -> None:
-        assert TenantContext.get_optional() is None
-
-    def test_get_optional_returns_tenant_when_set(self, tenant: Tenant) -> None:
-        TenantContext.set(tenant)
-        assert TenantContext.get_optional() == tenant
-
     def test_clear_removes_tenant(self, tenant: Tenant) -> None:
         TenantContext.set(tenant)
         TenantContext.clear()
@@ -103,9 +124,6 @@ class TestTenantContextMetadata:
         assert TenantContext.get_metadata("missing") is None
         assert TenantContext.get_metadata("missing", default="fallback") == "fallback"
 
-    def test_get_metadata_when_no_metadata_set(self) -> None:
-        assert TenantContext.get_metadata("key") is None
-
     def test_get_all_metadata(self, tenant: Tenant) -> None:
         TenantContext.set(tenant)
         TenantContext.set_metadata("a", 1)
@@ -113,15 +131,14 @@ class TestTenantContextMetadata:
         meta = TenantContext.get_all_metadata()
         assert meta == {"a": 1, "b": 2}
 
-    def test_get_all_metadata_empty(self) -> None:
-        assert TenantContext.get_all_metadata() == {}
-
     def test_mutating_returned_metadata_does_not_affect_context(self, tenant: Tenant) -> None:
         TenantContext.set(tenant)
         TenantContext.set_metadata("x", 10)
         meta = TenantContext.get_all_metadata()
+        assert meta == {"x": 10}
         meta["y"] = 99  # mutate the copy
         assert TenantContext.get_metadata("y") is None
+        assert TenantContext.get_all_metadata() == {"x": 10}
 
     def test_clear_metadata(self, tenant: Tenant) -> None:
         TenantContext.set(tenant)
@@ -188,15 +205,18 @@ class TestTenantScope:
 
         async def task_a() -> None:
             async with tenant_scope(tenant):
-                await asyncio.sleep(0)  # yield to other task
+                # Suspend inside the scope so task_b sets its tenant before
+                # this read; one yield is enough to interleave the two.
+                await asyncio.sleep(0)
                 results["a"] = TenantContext.get().id
 
         async def task_b() -> None:
             async with tenant_scope(other_tenant):
-                await asyncio.sleep(0)
                 results["b"] = TenantContext.get().id
 
-        await asyncio.gather(task_a(), task_b())
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(task_a())
+            tg.create_task(task_b())
         assert results["a"] == tenant.id
         assert results["b"] == other_tenant.id
 
@@ -18,6 +18,19 @@ from fastapi_tenancy.core.exceptions import (
     TenantResolutionError,
 )
 
+_SUBCLASSES: tuple[type[TenancyError], ...] = (
+    TenantNotFoundError,
+    TenantResolutionError,
+    TenantInactiveError,
+    IsolationError,
+    ConfigurationError,
+    MigrationError,
+    RateLimitExceededError,
+    TenantDataLeakageError,
+    TenantQuotaExceededError,
+    DatabaseConnectionError,
+)
+
 
 class TestTenancyError:
     def test_basic(self) -> None:
@@ -40,21 +53,9 @@ class TestTenancyError:
         e = TenancyError("msg")
         assert isinstance(e, Exception)
 
-    def test_all_subclasses_inherit(self) -> None:
-        subclasses = [
-            TenantNotFoundError,
-            TenantResolutionError,
-            TenantInactiveError,
-            IsolationError,
-            ConfigurationError,
-            MigrationError,
-            RateLimitExceededError,
-            TenantDataLeakageError,
-            TenantQuotaExceededError,
-            DatabaseConnectionError,
-        ]
-        for cls in subclasses:
-            assert issubclass(cls, TenancyError)
+    @pytest.mark.parametrize("cls", _SUBCLASSES, ids=lambda cls: cls.__name__)
+    def test_all_subclasses_inherit(self, cls: type[TenancyError]) -> None:
+        assert issubclass(cls, TenancyError)
 
 
 class TestTenantNotFoundError:
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
-from datetime import UTC, datetime
+from contextlib import aclosing, asynccontextmanager
 from typing import TYPE_CHECKING, Any
 
 from fastapi import Depends, FastAPI
@@ -27,6 +26,7 @@ from fastapi_tenancy.dependencies import (
 )
 from fastapi_tenancy.manager import TenancyManager
 from fastapi_tenancy.storage.memory import InMemoryTenantStore
+from tests._helpers import NOW
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -50,15 +50,14 @@ def _tenant(
     metadata: dict[str, Any] | None = None,
     status: TenantStatus = TenantStatus.ACTIVE,
 ) -> Tenant:
-    now = datetime.now(UTC)
-    return Tenant(
+    return Tenant.model_construct(
         id=f"t-{identifier}",
         identifier=identifier,
         name=identifier.title(),
         status=status,
         metadata=metadata or {},
-        created_at=now,
-        updated_at=now,
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
@@ -84,6 +83,11 @@ def _make_app(manager: TenancyManager) -> FastAPI:
     return app
 
 
+def _client(app: FastAPI, base_url: str = "http://test", **kwargs: Any) -> aclosing[AsyncClient]:
+    """Return an ASGI-backed client that is closed via ``aclose()`` on exit."""
+    return aclosing(AsyncClient(transport=ASGITransport(app=app), base_url=base_url, **kwargs))
+
+
 class TestMakeTenantDbDependency:
     def test_returns_callable(self) -> None:
         """Factory returns a callable without raising."""
@@ -91,7 +95,6 @@ class TestMakeTenantDbDependency:
         dep = make_tenant_db_dependency(m)
         assert callable(dep)
 
-    @pytest.mark.asyncio
     async def test_dependency_yields_async_session_in_route(self) -> None:
         """Inside a route the dependency yields an AsyncSession."""
         tenant = _tenant()
@@ -106,13 +109,12 @@ class TestMakeTenantDbDependency:
             session_types.append(type(session))
             return {"type": type(session).__name__}
 
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        async with _client(app) as client:
             resp = await client.get("/db-type", headers={"X-Tenant-ID": "test-tenant"})
 
         assert resp.status_code == 200
         assert resp.json()["type"] == "AsyncSession"
 
-    @pytest.mark.asyncio
     async def test_session_can_execute_select(self) -> None:
         """The yielded session is fully operational."""
         tenant = _tenant()
@@ -127,13 +129,12 @@ class TestMakeTenantDbDependency:
             row = result.first()
             return {"val": row[0] if row else None}
 
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        async with _client(app) as client:
             resp = await client.get("/db-exec", headers={"X-Tenant-ID": "test-tenant"})
 
         assert resp.status_code == 200
         assert resp.json()["val"] == 1
 
-    @pytest.mark.asyncio
     async def test_multiple_requests_each_get_fresh_session(self) -> None:
         """Each request gets an independent session."""
         tenant = _tenant()
@@ -148,7 +149,7 @@ class TestMakeTenantDbDependency:
             sessions_seen.append(session)
             return {"id": id(session)}
 
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        async with _client(app) as client:
             r1 = await client.get("/session-id", headers={"X-Tenant-ID": "test-tenant"})
             r2 = await client.get("/session-id", headers={"X-Tenant-ID": "test-tenant"})
 
@@ -161,7 +162,6 @@ class TestMakeTenantDbDependency:
         # both objects are alive simultaneously.
         assert sessions_seen[0] is not sessions_seen[1]
 
-    @pytest.mark.asyncio
     async def test_context_cleared_after_each_request(self) -> None:
         """Tenant context is None between requests."""
         tenant = _tenant()
@@ -172,7 +172,7 @@ class TestMakeTenantDbDependency:
         async def ping() -> dict[str, str]:
             return {"ok": "yes"}
 
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        async with _client(app) as client:
             await client.get("/ping", headers={"X-Tenant-ID": "test-tenant"})
 
         # After the request lifecycle, context must be reset
@@ -185,7 +185,6 @@ class TestMakeTenantConfigDependency:
         dep = make_tenant_config_dependency(m)
         assert callable(dep)
 
-    @pytest.mark.asyncio
     async def test_returns_tenant_config_with_metadata(self) -> None:
         """Metadata fields are parsed into TenantConfig fields."""
         tenant = _tenant(metadata={"max_users": 50, "rate_limit_per_minute": 200})
@@ -198,7 +197,7 @@ class TestMakeTenantConfigDependency:
         async def get_config(cfg: Any = Depends(get_cfg)) -> dict[str, Any]:
             return {"max_users": cfg.max_users, "rate_limit_per_minute": cfg.rate_limit_per_minute}
 
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        async with _client(app) as client:
             resp = await client.get("/cfg", headers={"X-Tenant-ID": "test-tenant"})
 
         assert resp.status_code == 200
@@ -206,7 +205,6 @@ class TestMakeTenantConfigDependency:
         assert data["max_users"] == 50
         assert data["rate_limit_per_minute"] == 200
 
-    @pytest.mark.asyncio
     async def test_empty_metadata_returns_defaults(self) -> None:
         """Empty metadata → all TenantConfig defaults apply."""
         tenant = _tenant(metadata={})
@@ -223,7 +221,7 @@ class TestMakeTenantConfigDependency:
                 "rate_limit_per_minute": cfg.rate_limit_per_minute,
             }
 
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        async with _client(app) as client:
             resp = await client.get("/cfg-defaults", headers={"X-Tenant-ID": "test-tenant"})
 
         assert resp.status_code == 200
@@ -239,7 +237,6 @@ class TestMakeAuditLogDependency:
         dep = make_audit_log_dependency(m)
         assert callable(dep)
 
-    @pytest.mark.asyncio
     async def test_audit_log_callable_invokes_write(self) -> None:
         """log() inside a route calls manager.write_audit_log."""
 
@@ -261,7 +258,7 @@ class TestMakeAuditLogDependency:
             await audit(action="create", resource="order", resource_id="o-123")
             return {"ok": "yes"}
 
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        async with _client(app) as client:
             resp = await client.post("/resource", headers={"X-Tenant-ID": "test-tenant"})
 
         assert resp.status_code == 200
@@ -272,7 +269,6 @@ class TestMakeAuditLogDependency:
         assert entry.resource_id == "o-123"
         assert entry.tenant_id == "t-test-tenant"
 
-    @pytest.mark.asyncio
     async def test_audit_log_with_user_id_and_metadata(self) -> None:
         """log() passes user_id and metadata through."""
         tenant = _tenant()
@@ -299,7 +295,7 @@ class TestMakeAuditLogDependency:
             )
             return {"ok": "yes"}
 
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        async with _client(app) as client:
             resp = await client.delete("/resource/o-999", headers={"X-Tenant-ID": "test-tenant"})
 
         assert resp.status_code == 200
@@ -320,7 +316,6 @@ class TestTypeAliases:
 
 
 class TestContextDependencies:
-    @pytest.mark.asyncio
     async def test_get_current_tenant_raises_when_no_context(self) -> None:
         """get_current_tenant() must raise when no tenant is set."""
         from fastapi_tenancy.core.exceptions import TenantNotFoundError  # noqa: PLC0415
@@ -353,7 +348,6 @@ class TestContextDependencies:
         finally:
             TenantContext.reset(token)
 
-    @pytest.mark.asyncio
     async def test_route_returns_400_when_no_tenant_header(self) -> None:
         """Route using TenantDep returns error when middleware rejects request."""
         tenant = _tenant()
@@ -364,13 +358,12 @@ class TestContextDependencies:
         async def needs_tenant(t: TenantDep) -> dict[str, str]:
             return {"id": t.id}
 
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        async with _client(app) as client:
             resp = await client.get("/needs-tenant")  # no header
 
         # Middleware returns 400 before route is even called
         assert resp.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_route_with_optional_tenant_works_without_header(self) -> None:
         """Route using TenantOptionalDep is accessible even without a tenant header
         when it is on an excluded path."""
@@ -382,7 +375,7 @@ class TestContextDependencies:
             t = TenantContext.get_optional()
             return {"has_tenant": t is not None}
 
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        async with _client(app) as client:
             resp = await client.get("/health")
 
         # No middleware interference → route runs normally
@@ -432,8 +425,8 @@ class TestAuditLogIpAndUserAgent:
         captured: list[Any] = []
         app = self._app_with_audit(manager, captured)
 
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
+        async with _client(
+            app,
             base_url="http://testserver",
             headers={"X-Tenant-ID": "audit-ip"},
         ) as client:
@@ -458,8 +451,8 @@ class TestAuditLogIpAndUserAgent:
         captured: list[Any] = []
         app = self._app_with_audit(manager, captured)
 
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
+        async with _client(
+            app,
             base_url="http://testserver",
             headers={
                 "X-Tenant-ID": "audit-ua",
@@ -488,8 +481,8 @@ class TestAuditLogIpAndUserAgent:
         captured: list[Any] = []
         app = self._app_with_audit(manager, captured)
 
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
+        async with _client(
+            app,
             base_url="http://testserver",
             headers={"X-Tenant-ID": "audit-noua"},
         ) as client:
@@ -515,8 +508,8 @@ class TestAuditLogIpAndUserAgent:
         captured: list[Any] = []
         app = self._app_with_audit(manager, captured)
 
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
+        async with _client(
+            app,
             base_url="http://testserver",
             headers={"X-Tenant-ID": "audit-tid"},
         ) as client:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
-from datetime import UTC, datetime
+import importlib.util
 import logging
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -37,6 +37,7 @@ from fastapi_tenancy.manager import (
 from fastapi_tenancy.storage.database import SQLAlchemyTenantStore
 from fastapi_tenancy.storage.memory import InMemoryTenantStore
 from fastapi_tenancy.utils.encryption import TenancyEncryption
+from tests._helpers import NOW
 
 
 def _derive_key(raw: str) -> bytes:
@@ -50,6 +51,12 @@ def _derive_key(raw: str) -> bytes:
 _ENC_KEY = "test-encryption-key-exactly-32ch"
 _SQLITE = "sqlite+aiosqlite:///:memory:"
 
+# RLS providers build a PostgreSQL engine at construction time; skip at
+# collection when the driver is absent instead of failing inside the test.
+_requires_asyncpg = pytest.mark.skipif(
+    not importlib.util.find_spec("asyncpg"), reason="asyncpg not installed"
+)
+
 
 def _cfg(**kw: Any) -> TenancyConfig:
     defaults: dict[str, Any] = {
@@ -62,14 +69,13 @@ def _cfg(**kw: Any) -> TenancyConfig:
 
 
 def _tenant(identifier: str = "acme-corp", status: TenantStatus = TenantStatus.ACTIVE) -> Tenant:
-    now = datetime.now(UTC)
-    return Tenant(
+    return Tenant.model_construct(
         id=f"t-{identifier}",
         identifier=identifier,
         name=identifier.title(),
         status=status,
-        created_at=now,
-        updated_at=now,
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
@@ -79,21 +85,19 @@ def _make_tenant(
     identifier: str = "fix-tenant",
     status: TenantStatus = TenantStatus.ACTIVE,
 ) -> Tenant:
-    now = datetime.now(UTC)
-    return Tenant(
+    return Tenant.model_construct(
         id=tenant_id,
         identifier=identifier,
         name=identifier.title(),
         status=status,
-        created_at=now,
-        updated_at=now,
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
 async def _store_with(*tenants: Tenant) -> InMemoryTenantStore:
     store = InMemoryTenantStore()
-    for t in tenants:
-        await store.create(t)
+    await store.create_many(tenants)
     return store
 
 
@@ -181,6 +185,7 @@ class TestBuildProvider:
         provider = _build_provider(_cfg(isolation_strategy=IsolationStrategy.SCHEMA))
         assert isinstance(provider, SchemaIsolationProvider)
 
+    @_requires_asyncpg
     def test_rls_provider(self) -> None:
         from fastapi_tenancy.isolation.rls import RLSIsolationProvider  # noqa: PLC0415
 
@@ -203,6 +208,7 @@ class TestBuildProvider:
         provider = _build_provider(cfg)
         assert isinstance(provider, DatabaseIsolationProvider)
 
+    @_requires_asyncpg
     def test_hybrid_provider(self) -> None:
         from fastapi_tenancy.isolation.hybrid import HybridIsolationProvider  # noqa: PLC0415
 
@@ -244,7 +250,10 @@ class TestManagerInitialize:
         store.close = AsyncMock()
         m = TenancyManager(_cfg(), store)
         await m.initialize()
-        store.initialize.assert_awaited_once()
+        try:
+            store.initialize.assert_awaited_once()
+        finally:
+            await m.close()
 
     @pytest.mark.asyncio
     async def test_warms_cache_when_enabled(self) -> None:
@@ -259,7 +268,10 @@ class TestManagerInitialize:
         object.__setattr__(cfg, "cache_enabled", True)
         m = TenancyManager(cfg, store)
         await m.initialize()
-        store.warm_cache.assert_awaited_once()
+        try:
+            store.warm_cache.assert_awaited_once()
+        finally:
+            await m.close()
 
     @pytest.mark.asyncio
     async def test_does_not_warm_cache_when_disabled(self) -> None:
@@ -269,13 +281,17 @@ class TestManagerInitialize:
         store.close = AsyncMock()
         m = TenancyManager(_cfg(cache_enabled=False), store)
         await m.initialize()
-        store.warm_cache.assert_not_awaited()
+        try:
+            store.warm_cache.assert_not_awaited()
+        finally:
+            await m.close()
 
     @pytest.mark.asyncio
     async def test_skips_initialize_when_store_lacks_method(self) -> None:
         store = InMemoryTenantStore()
         m = TenancyManager(_cfg(), store)
         await m.initialize()  # InMemoryTenantStore has no initialize() — must not raise
+        await m.close()
 
     @pytest.mark.asyncio
     async def test_no_rate_limiter_init_when_disabled(self) -> None:
@@ -283,7 +299,10 @@ class TestManagerInitialize:
         m = TenancyManager(cfg, InMemoryTenantStore())
         m._init_rate_limiter = AsyncMock()  # type: ignore[method-assign]
         await m.initialize()
-        m._init_rate_limiter.assert_not_awaited()
+        try:
+            m._init_rate_limiter.assert_not_awaited()
+        finally:
+            await m.close()
 
     @pytest.mark.asyncio
     async def test_no_rate_limiter_init_when_no_redis_url(self) -> None:
@@ -295,7 +314,10 @@ class TestManagerInitialize:
         m = TenancyManager(cfg, InMemoryTenantStore())
         m._init_rate_limiter = AsyncMock()  # type: ignore[method-assign]
         await m.initialize()
-        m._init_rate_limiter.assert_not_awaited()
+        try:
+            m._init_rate_limiter.assert_not_awaited()
+        finally:
+            await m.close()
 
 
 class TestManagerClose:
@@ -358,11 +380,14 @@ class TestRegisterTenant:
         store = InMemoryTenantStore()
         m = TenancyManager(_cfg(), store)
         await m.initialize()
-        m.isolation_provider.initialize_tenant = AsyncMock()  # type: ignore[method-assign]
+        try:
+            m.isolation_provider.initialize_tenant = AsyncMock()  # type: ignore[method-assign]
 
-        tenant = await m.register_tenant("new-tenant", "New Tenant")
-        assert tenant.identifier == "new-tenant"
-        assert tenant.name == "New Tenant"
+            tenant = await m.register_tenant("new-tenant", "New Tenant")
+            assert tenant.identifier == "new-tenant"
+            assert tenant.name == "New Tenant"
+        finally:
+            await m.close()
 
     @pytest.mark.asyncio
     async def test_isolation_failure_rolls_back_store(self) -> None:
@@ -370,44 +395,53 @@ class TestRegisterTenant:
         store = InMemoryTenantStore()
         m = TenancyManager(_cfg(), store)
         await m.initialize()
-        m.isolation_provider.initialize_tenant = AsyncMock(  # type: ignore[method-assign]
-            side_effect=RuntimeError("DB unreachable")
-        )
+        try:
+            m.isolation_provider.initialize_tenant = AsyncMock(  # type: ignore[method-assign]
+                side_effect=RuntimeError("DB unreachable")
+            )
 
-        with pytest.raises(TenancyError, match="Failed to initialise"):
-            await m.register_tenant("rollback-tenant", "Rollback Me")
+            with pytest.raises(TenancyError, match="Failed to initialise"):
+                await m.register_tenant("rollback-tenant", "Rollback Me")
 
-        # Tenant should not be findable after rollback
-        with pytest.raises(TenantNotFoundError):
-            await store.get_by_identifier("rollback-tenant")
+            # Tenant should not be findable after rollback
+            with pytest.raises(TenantNotFoundError):
+                await store.get_by_identifier("rollback-tenant")
+        finally:
+            await m.close()
 
     @pytest.mark.asyncio
     async def test_with_explicit_isolation_strategy(self) -> None:
         store = InMemoryTenantStore()
         m = TenancyManager(_cfg(), store)
         await m.initialize()
-        m.isolation_provider.initialize_tenant = AsyncMock()  # type: ignore[method-assign]
+        try:
+            m.isolation_provider.initialize_tenant = AsyncMock()  # type: ignore[method-assign]
 
-        tenant = await m.register_tenant(
-            "explicit-strat",
-            "Explicit",
-            isolation_strategy=IsolationStrategy.SCHEMA,
-        )
-        assert tenant.isolation_strategy == IsolationStrategy.SCHEMA
+            tenant = await m.register_tenant(
+                "explicit-strat",
+                "Explicit",
+                isolation_strategy=IsolationStrategy.SCHEMA,
+            )
+            assert tenant.isolation_strategy == IsolationStrategy.SCHEMA
+        finally:
+            await m.close()
 
     @pytest.mark.asyncio
     async def test_with_metadata(self) -> None:
         store = InMemoryTenantStore()
         m = TenancyManager(_cfg(), store)
         await m.initialize()
-        m.isolation_provider.initialize_tenant = AsyncMock()  # type: ignore[method-assign]
+        try:
+            m.isolation_provider.initialize_tenant = AsyncMock()  # type: ignore[method-assign]
 
-        tenant = await m.register_tenant(
-            "meta-tenant",
-            "Meta",
-            metadata={"plan": "premium"},
-        )
-        assert tenant.metadata["plan"] == "premium"
+            tenant = await m.register_tenant(
+                "meta-tenant",
+                "Meta",
+                metadata={"plan": "premium"},
+            )
+            assert tenant.metadata["plan"] == "premium"
+        finally:
+            await m.close()
 
 
 class TestSuspendActivate:
@@ -1154,17 +1188,9 @@ class TestRateLimitFailClosed:
 
     async def test_rate_limit_exceeded_still_raises(self) -> None:
         """A proper RateLimitExceededError from Lua must still propagate."""
-        cfg = _manager_cfg(
-            enable_rate_limiting=True,
-            redis_url="redis://localhost:6379/0",
-            rate_limit_per_minute=5,
-            rate_limit_window_seconds=60,
-            rate_limit_fail_closed=False,
-        )
-        store = InMemoryTenantStore()
-        m = TenancyManager(cfg, store)
-        m._rate_limiting_enabled = True
-        m._rate_limiter = MagicMock()
+        m = self._make_limiter_manager(fail_closed=False)
+        # TenancyConfig is not frozen — plain assignment skips a validated copy.
+        m.config.rate_limit_per_minute = 5
         # Lua script returns count > limit → RateLimitExceededError raised inside check.
         m._rate_limiter.eval = AsyncMock(return_value=6)  # 6 > limit=5
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
 import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -22,6 +21,7 @@ from fastapi_tenancy.core.types import IsolationStrategy, ResolutionStrategy, Te
 from fastapi_tenancy.manager import TenancyManager
 from fastapi_tenancy.middleware.tenancy import TenancyMiddleware, _json_response, _ws_close
 from fastapi_tenancy.storage.memory import InMemoryTenantStore
+from tests._helpers import NOW
 
 
 def _cfg(**kw: Any) -> TenancyConfig:
@@ -39,14 +39,13 @@ def _tenant(
     identifier: str = "acme-corp",
     status: TenantStatus = TenantStatus.ACTIVE,
 ) -> Tenant:
-    now = datetime.now(UTC)
-    return Tenant(
+    return Tenant.model_construct(
         id=f"t-{identifier}",
         identifier=identifier,
         name=identifier.title(),
         status=status,
-        created_at=now,
-        updated_at=now,
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import UTC, datetime
 import logging
 from pathlib import Path
 from typing import Any
@@ -15,6 +14,7 @@ from fastapi_tenancy.core.exceptions import MigrationError
 from fastapi_tenancy.core.types import IsolationStrategy, Tenant, TenantStatus
 from fastapi_tenancy.migrations.manager import TenantMigrationManager
 from fastapi_tenancy.storage.memory import InMemoryTenantStore
+from tests._helpers import NOW
 
 
 def _make_tenant(
@@ -25,8 +25,7 @@ def _make_tenant(
     database_url: str | None = None,
     schema_name: str | None = None,
 ) -> Tenant:
-    now = datetime.now(UTC)
-    return Tenant(
+    return Tenant.model_construct(
         id=id,
         identifier=identifier,
         name=identifier.title(),
@@ -34,8 +33,8 @@ def _make_tenant(
         isolation_strategy=isolation_strategy,
         database_url=database_url,
         schema_name=schema_name,
-        created_at=now,
-        updated_at=now,
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
@@ -522,8 +521,7 @@ class TestFleetOperations:
     async def test_upgrade_all_migrates_all_active_tenants(self) -> None:
         store = InMemoryTenantStore()
         tenants = [_make_tenant(id=f"t-{i}", identifier=f"tenant-{i}") for i in range(5)]
-        for t in tenants:
-            await store.create(t)
+        await store.create_many(tenants)
         # Add an inactive tenant — must NOT be migrated.
         inactive = _make_tenant(
             id="t-inactive", identifier="inactive", status=TenantStatus.SUSPENDED
@@ -544,8 +542,7 @@ class TestFleetOperations:
         store = InMemoryTenantStore()
         good = _make_tenant(id="t-good", identifier="good")
         bad = _make_tenant(id="t-bad", identifier="bad")
-        await store.create(good)
-        await store.create(bad)
+        await store.create_many([good, bad])
 
         def _maybe_fail(tenant: Tenant, op: str, rev: str) -> None:
             if tenant.id == "t-bad":
@@ -565,8 +562,9 @@ class TestFleetOperations:
     async def test_upgrade_all_pagination(self) -> None:
         """upgrade_all must page through the store when tenant count > page_size."""
         store = InMemoryTenantStore()
-        for i in range(15):
-            await store.create(_make_tenant(id=f"t-{i:03d}", identifier=f"tenant-{i:03d}"))
+        await store.create_many(
+            _make_tenant(id=f"t-{i:03d}", identifier=f"tenant-{i:03d}") for i in range(15)
+        )
 
         mgr = _make_manager(store=store)
         self._attach_sync_noop(mgr)
@@ -578,8 +576,9 @@ class TestFleetOperations:
     async def test_upgrade_all_bounded_concurrency(self) -> None:
         """Semaphore should cap concurrent workers at ``concurrency``."""
         store = InMemoryTenantStore()
-        for i in range(10):
-            await store.create(_make_tenant(id=f"t-{i}", identifier=f"tenant-{i}"))
+        await store.create_many(
+            _make_tenant(id=f"t-{i}", identifier=f"tenant-{i}") for i in range(10)
+        )
 
         max_concurrent = 0
         active = 0
@@ -615,8 +614,9 @@ class TestFleetOperations:
     @pytest.mark.asyncio
     async def test_downgrade_all_returns_results(self) -> None:
         store = InMemoryTenantStore()
-        for i in range(3):
-            await store.create(_make_tenant(id=f"t-{i}", identifier=f"tenant-{i}"))
+        await store.create_many(
+            _make_tenant(id=f"t-{i}", identifier=f"tenant-{i}") for i in range(3)
+        )
 
         mgr = _make_manager(store=store)
         self._attach_sync_noop(mgr)
@@ -628,8 +628,9 @@ class TestFleetOperations:
     @pytest.mark.asyncio
     async def test_upgrade_all_concurrency_1_serialises(self) -> None:
         store = InMemoryTenantStore()
-        for i in range(4):
-            await store.create(_make_tenant(id=f"t-{i}", identifier=f"tenant-{i}"))
+        await store.create_many(
+            _make_tenant(id=f"t-{i}", identifier=f"tenant-{i}") for i in range(4)
+        )
 
         order: list[str] = []
         lock = asyncio.Lock()
@@ -730,8 +731,9 @@ class TestFleetLogging:
     async def test_upgrade_all_logs_success_summary(self, caplog: Any) -> None:
 
         store = InMemoryTenantStore()
-        for i in range(3):
-            await store.create(_make_tenant(id=f"t-{i}", identifier=f"tenant-{i}"))
+        await store.create_many(
+            _make_tenant(id=f"t-{i}", identifier=f"tenant-{i}") for i in range(3)
+        )
 
         mgr = _make_manager(store=store)
         mgr._run_migration_sync = lambda *_: None  # type: ignore[method-assign]
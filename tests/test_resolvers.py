@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import asyncio
-from datetime import UTC, datetime
-import time
-from typing import Any
+from datetime import timedelta
+import functools
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 
 import jwt as pyjwt
 import pytest
-from starlette.requests import Request
+from starlette.datastructures import Headers
 
 from fastapi_tenancy.core.exceptions import TenantNotFoundError, TenantResolutionError
 from fastapi_tenancy.core.types import Tenant, TenantStatus
@@ -19,127 +20,240 @@ from fastapi_tenancy.resolution.jwt import JWTTenantResolver
 from fastapi_tenancy.resolution.path import PathTenantResolver
 from fastapi_tenancy.resolution.subdomain import SubdomainTenantResolver
 from fastapi_tenancy.storage.memory import InMemoryTenantStore
+from tests._helpers import NOW
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-def _now() -> datetime:
-    return datetime.now(UTC)
+# Keep the module on one xdist worker (``--dist loadgroup``) so the
+# module-scoped ``store`` fixture is seeded once rather than once per worker.
+pytestmark = pytest.mark.xdist_group("resolution")
 
 
 def _make_tenant(identifier: str, status: TenantStatus = TenantStatus.ACTIVE) -> Tenant:
-    return Tenant(
+    # Inputs are fixed, well-formed literals — skip field validation.
+    return Tenant.model_construct(
         id=f"t-{identifier}",
         identifier=identifier,
         name=identifier.title(),
         status=status,
-        created_at=_now(),
-        updated_at=_now(),
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
-@pytest.fixture
-async def store() -> InMemoryTenantStore:
-    """Seeded store with three active tenants."""
+# Tenant is frozen, so the seed instances can be built once and shared.
+_SEED_TENANTS = tuple(_make_tenant(slug) for slug in ("acme-corp", "widgets-inc", "gadgets-co"))
+_AUD_TENANT = _make_tenant("aud-tenant")
+
+
+@pytest.fixture(scope="module")
+def store() -> InMemoryTenantStore:
+    """Seeded store with three active tenants, shared by the whole module.
+
+    Resolvers only read from the store, so one instance is safe to reuse.
+    """
     s = InMemoryTenantStore()
-    for slug in ("acme-corp", "widgets-inc", "gadgets-co"):
-        await s.create(_make_tenant(slug))
+    s.populate(_SEED_TENANTS)
     return s
 
 
 def _make_request(
     path: str = "/",
     headers: dict[str, str] | None = None,
-    host: str = "example.com",
-) -> Request:
-    """Build a minimal Starlette Request without an actual transport."""
-    raw_headers = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
-    # If host not already in headers, add it
-    if not any(k == b"host" for k, _ in raw_headers):
-        raw_headers.append((b"host", host.encode()))
+    host: str | None = "example.com",
+) -> Any:
+    """Build a lightweight request stand-in exposing what resolvers touch.
+
+    Resolvers only read ``headers`` and ``url.path`` and write to ``state``,
+    so a ``SimpleNamespace`` with Starlette's case-insensitive ``Headers``
+    replaces a full ``Request`` and its ASGI scope. Pass ``host=None`` to
+    omit the ``Host`` header entirely.
+    """
+    raw_headers = {k.lower(): v for k, v in (headers or {}).items()}
+    if host is not None:
+        raw_headers.setdefault("host", host)
+    return SimpleNamespace(
+        headers=Headers(headers=raw_headers),
+        url=SimpleNamespace(path=path),
+        state=SimpleNamespace(),
+    )
 
-    scope: dict[str, Any] = {
-        "type": "http",
-        "method": "GET",
-        "path": path,
-        "query_string": b"",
-        "headers": raw_headers,
-        "server": (host.split(":", maxsplit=1)[0], 443),
-    }
 
-    async def receive() -> dict[str, Any]:
-        return {"type": "http.request", "body": b""}
+_JWT_SECRET = "a-secret-that-is-at-least-32-chars!!"
 
-    return Request(scope, receive)
 
+@pytest.fixture(scope="module")
+def header_resolver(store: InMemoryTenantStore) -> HeaderTenantResolver:
+    return HeaderTenantResolver(store)
 
-_JWT_SECRET = "a-secret-that-is-at-least-32-chars!!"
 
+@pytest.fixture(scope="module")
+def subdomain_resolver(store: InMemoryTenantStore) -> SubdomainTenantResolver:
+    return SubdomainTenantResolver(store, domain_suffix=".example.com")
 
-class TestHeaderTenantResolver:
-    async def test_resolves_from_default_header(self, store: InMemoryTenantStore) -> None:
-        resolver = HeaderTenantResolver(store)
-        request = _make_request(headers={"X-Tenant-ID": "acme-corp"})
-        tenant = await resolver.resolve(request)
+
+@pytest.fixture(scope="module")
+def path_resolver(store: InMemoryTenantStore) -> PathTenantResolver:
+    return PathTenantResolver(store, path_prefix="/tenants")
+
+
+@pytest.fixture(scope="module")
+def jwt_resolver(store: InMemoryTenantStore) -> JWTTenantResolver:
+    return JWTTenantResolver(store, secret=_JWT_SECRET)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_token(secret: str, claims: tuple[tuple[str, Any], ...]) -> str:
+    return str(pyjwt.encode(dict(claims), secret, algorithm="HS256"))
+
+
+def _token(claims: dict[str, Any], secret: str = _JWT_SECRET) -> str:
+    """Return an HS256 token for *claims*, signing each distinct payload once.
+
+    Claims must be deterministic: an ``exp`` derived from the wall clock would
+    defeat the cache, so expiry tests anchor it to ``NOW`` instead.
+    """
+    return _cached_token(secret, tuple(sorted(claims.items())))
+
+
+def _header_request(identifier: str) -> Any:
+    return _make_request(headers={"X-Tenant-ID": identifier})
+
+
+def _subdomain_request(identifier: str) -> Any:
+    return _make_request(host=f"{identifier}.example.com")
+
+
+def _path_request(identifier: str) -> Any:
+    return _make_request(path=f"/tenants/{identifier}/orders")
+
+
+def _jwt_request(identifier: str) -> Any:
+    token = _token({"tenant_id": identifier})
+    return _make_request(headers={"Authorization": f"Bearer {token}"})
+
+
+# Resolver fixture name → builder turning an identifier into a request for it.
+_RESOLVER_MATRIX: dict[str, Callable[[str], Any]] = {
+    "header_resolver": _header_request,
+    "subdomain_resolver": _subdomain_request,
+    "path_resolver": _path_request,
+    "jwt_resolver": _jwt_request,
+}
+
+# Resolver fixture name → (malformed identifier, expected substring of the reason).
+_INVALID_IDENTIFIERS: dict[str, tuple[str, str]] = {
+    "header_resolver": ("INVALID!!!", "tenant not found"),
+    "subdomain_resolver": ("1a", "valid tenant identifier"),
+    "path_resolver": ("INVALID_SLUG", "valid tenant identifier"),
+    "jwt_resolver": ("UPPER-CASE!!", "invalid"),
+}
+
+# Resolver fixture name → error raised for a well-formed but unknown identifier.
+# The header resolver masks unknown tenants as resolution errors so that
+# callers cannot enumerate valid identifiers.
+_UNKNOWN_TENANT_ERRORS: dict[str, type[Exception]] = {
+    "header_resolver": TenantResolutionError,
+    "subdomain_resolver": TenantNotFoundError,
+    "path_resolver": TenantNotFoundError,
+    "jwt_resolver": TenantNotFoundError,
+}
+
+
+@pytest.fixture(params=list(_RESOLVER_MATRIX), ids=lambda name: name.removesuffix("_resolver"))
+def resolver_name(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+@pytest.fixture
+def any_resolver(request: pytest.FixtureRequest, resolver_name: str) -> BaseTenantResolver:
+    resolver: BaseTenantResolver = request.getfixturevalue(resolver_name)
+    return resolver
+
+
+class TestResolverMatrix:
+    """Behaviour shared by every built-in resolver, one parametrized case each."""
+
+    async def test_resolves_known_tenant(
+        self, any_resolver: BaseTenantResolver, resolver_name: str
+    ) -> None:
+        tenant = await any_resolver.resolve(_RESOLVER_MATRIX[resolver_name]("acme-corp"))
         assert tenant.identifier == "acme-corp"
 
+    async def test_invalid_identifier_raises_resolution_error(
+        self, any_resolver: BaseTenantResolver, resolver_name: str
+    ) -> None:
+        identifier, reason = _INVALID_IDENTIFIERS[resolver_name]
+        with pytest.raises(TenantResolutionError) as exc_info:
+            await any_resolver.resolve(_RESOLVER_MATRIX[resolver_name](identifier))
+        assert reason in exc_info.value.reason.lower()
+
+    async def test_unknown_tenant_raises(
+        self, any_resolver: BaseTenantResolver, resolver_name: str
+    ) -> None:
+        with pytest.raises(_UNKNOWN_TENANT_ERRORS[resolver_name]):
+            await any_resolver.resolve(_RESOLVER_MATRIX[resolver_name]("nonexistent-co"))
+
+
+class TestHeaderTenantResolver:
     async def test_resolves_from_custom_header(self, store: InMemoryTenantStore) -> None:
         resolver = HeaderTenantResolver(store, header_name="X-Organization-ID")
         request = _make_request(headers={"X-Organization-ID": "widgets-inc"})
         tenant = await resolver.resolve(request)
         assert tenant.identifier == "widgets-inc"
 
-    async def test_missing_header_raises_resolution_error(self, store: InMemoryTenantStore) -> None:
-        resolver = HeaderTenantResolver(store)
+    @pytest.mark.parametrize("identifier", ["INVALID!!!", "nonexistent-co"])
+    async def test_invalid_and_unknown_share_one_reason(
+        self, header_resolver: HeaderTenantResolver, identifier: str
+    ) -> None:
+        # Malformed and unknown identifiers must be indistinguishable, so
+        # callers cannot enumerate valid tenants.
+        with pytest.raises(TenantResolutionError) as exc_info:
+            await header_resolver.resolve(_header_request(identifier))
+        assert exc_info.value.reason == "Tenant not found"
+
+    async def test_missing_header_raises_resolution_error(
+        self, header_resolver: HeaderTenantResolver
+    ) -> None:
         request = _make_request(headers={})
         with pytest.raises(TenantResolutionError) as exc_info:
-            await resolver.resolve(request)
+            await header_resolver.resolve(request)
         assert exc_info.value.reason == "Tenant not found"
 
-    async def test_empty_header_raises_resolution_error(self, store: InMemoryTenantStore) -> None:
-        resolver = HeaderTenantResolver(store)
+    async def test_empty_header_raises_resolution_error(
+        self, header_resolver: HeaderTenantResolver
+    ) -> None:
         request = _make_request(headers={"X-Tenant-ID": ""})
         with pytest.raises(TenantResolutionError) as exc_info:
-            await resolver.resolve(request)
+            await header_resolver.resolve(request)
         assert exc_info.value.reason == "Tenant not found"
 
-    async def test_whitespace_only_header_raises(self, store: InMemoryTenantStore) -> None:
-        resolver = HeaderTenantResolver(store)
+    async def test_whitespace_only_header_raises(
+        self, header_resolver: HeaderTenantResolver
+    ) -> None:
         request = _make_request(headers={"X-Tenant-ID": "   "})
         with pytest.raises(TenantResolutionError):
-            await resolver.resolve(request)
+            await header_resolver.resolve(request)
 
-    async def test_invalid_identifier_raises_resolution_error(
-        self, store: InMemoryTenantStore
+    async def test_case_insensitive_header_name(
+        self, header_resolver: HeaderTenantResolver
     ) -> None:
-        resolver = HeaderTenantResolver(store)
-        # Contains uppercase → fails validate_tenant_identifier
-        request = _make_request(headers={"X-Tenant-ID": "INVALID!!!"})
-        with pytest.raises(TenantResolutionError) as exc_info:
-            await resolver.resolve(request)
-        assert exc_info.value.reason == "Tenant not found"
-
-    async def test_unknown_tenant_raises_resolution_error(self, store: InMemoryTenantStore) -> None:
-        resolver = HeaderTenantResolver(store)
-        request = _make_request(headers={"X-Tenant-ID": "nonexistent-co"})
-        with pytest.raises(TenantResolutionError) as exc_info:
-            await resolver.resolve(request)
-        assert exc_info.value.reason == "Tenant not found"
-
-    async def test_case_insensitive_header_name(self, store: InMemoryTenantStore) -> None:
-        resolver = HeaderTenantResolver(store)
         # HTTP headers are case-insensitive; Starlette normalises them
         request = _make_request(headers={"x-tenant-id": "acme-corp"})
-        tenant = await resolver.resolve(request)
+        tenant = await header_resolver.resolve(request)
         assert tenant.identifier == "acme-corp"
 
     def test_stores_store_reference(self, store: InMemoryTenantStore) -> None:
         resolver = HeaderTenantResolver(store)
         assert resolver.store is store
 
-    def test_strategy_attribute_on_resolution_error(self, store: InMemoryTenantStore) -> None:
-        resolver = HeaderTenantResolver(store)
+    async def test_strategy_attribute_on_resolution_error(
+        self, header_resolver: HeaderTenantResolver
+    ) -> None:
         request = _make_request(headers={})
         with pytest.raises(TenantResolutionError) as exc_info:
-            asyncio.get_event_loop().run_until_complete(resolver.resolve(request))
+            await header_resolver.resolve(request)
         assert exc_info.value.strategy == "header"
 
 
@@ -148,31 +262,26 @@ class TestSubdomainTenantResolver:
         resolver = SubdomainTenantResolver(store, domain_suffix="example.com")
         assert resolver._domain_suffix == ".example.com"
 
-    def test_init_preserves_suffix_with_leading_dot(self, store: InMemoryTenantStore) -> None:
-        resolver = SubdomainTenantResolver(store, domain_suffix=".example.com")
-        assert resolver._domain_suffix == ".example.com"
+    def test_init_preserves_suffix_with_leading_dot(
+        self, subdomain_resolver: SubdomainTenantResolver
+    ) -> None:
+        assert subdomain_resolver._domain_suffix == ".example.com"
 
     def test_init_empty_suffix_stays_empty(self, store: InMemoryTenantStore) -> None:
         resolver = SubdomainTenantResolver(store, domain_suffix="")
         assert resolver._domain_suffix == ""
 
-    async def test_resolves_from_subdomain(self, store: InMemoryTenantStore) -> None:
-        resolver = SubdomainTenantResolver(store, domain_suffix=".example.com")
-        request = _make_request(host="acme-corp.example.com")
-        tenant = await resolver.resolve(request)
-        assert tenant.identifier == "acme-corp"
-
-    async def test_strips_port_from_host(self, store: InMemoryTenantStore) -> None:
-        resolver = SubdomainTenantResolver(store, domain_suffix=".example.com")
+    async def test_strips_port_from_host(self, subdomain_resolver: SubdomainTenantResolver) -> None:
         request = _make_request(host="acme-corp.example.com:8443")
-        tenant = await resolver.resolve(request)
+        tenant = await subdomain_resolver.resolve(request)
         assert tenant.identifier == "acme-corp"
 
-    async def test_host_without_suffix_raises(self, store: InMemoryTenantStore) -> None:
-        resolver = SubdomainTenantResolver(store, domain_suffix=".example.com")
+    async def test_host_without_suffix_raises(
+        self, subdomain_resolver: SubdomainTenantResolver
+    ) -> None:
         request = _make_request(host="acme-corp.different.com")
         with pytest.raises(TenantResolutionError) as exc_info:
-            await resolver.resolve(request)
+            await subdomain_resolver.resolve(request)
         assert "does not end with" in exc_info.value.reason.lower()
 
     async def test_single_label_host_raises(self, store: InMemoryTenantStore) -> None:
@@ -183,20 +292,6 @@ class TestSubdomainTenantResolver:
             await resolver.resolve(request)
         assert "no subdomain" in exc_info.value.reason.lower()
 
-    async def test_invalid_subdomain_identifier_raises(self, store: InMemoryTenantStore) -> None:
-        resolver = SubdomainTenantResolver(store, domain_suffix=".example.com")
-        # Use "1a" which is too short (2 chars) and starts with a digit
-        # - invalid even after lowercasing
-        request = _make_request(host="1a.example.com")
-        with pytest.raises(TenantResolutionError):
-            await resolver.resolve(request)
-
-    async def test_no_matching_tenant_raises_not_found(self, store: InMemoryTenantStore) -> None:
-        resolver = SubdomainTenantResolver(store, domain_suffix=".example.com")
-        request = _make_request(host="no-such-tenant.example.com")
-        with pytest.raises(TenantNotFoundError):
-            await resolver.resolve(request)
-
     async def test_reads_x_forwarded_host_when_trusted(self, store: InMemoryTenantStore) -> None:
         resolver = SubdomainTenantResolver(
             store, domain_suffix=".example.com", trust_x_forwarded=True
@@ -224,22 +319,10 @@ class TestSubdomainTenantResolver:
         # Should use Host, not X-Forwarded-Host
         assert tenant.identifier == "widgets-inc"
 
-    async def test_no_host_header_raises(self, store: InMemoryTenantStore) -> None:
-        resolver = SubdomainTenantResolver(store, domain_suffix=".example.com")
-        scope: dict[str, Any] = {
-            "type": "http",
-            "method": "GET",
-            "path": "/",
-            "query_string": b"",
-            "headers": [],  # no Host, no X-Forwarded-Host
-        }
-
-        async def receive() -> dict[str, Any]:
-            return {"type": "http.request", "body": b""}
-
-        request = Request(scope, receive)
+    async def test_no_host_header_raises(self, subdomain_resolver: SubdomainTenantResolver) -> None:
+        request = _make_request(host=None)  # no Host, no X-Forwarded-Host
         with pytest.raises(TenantResolutionError) as exc_info:
-            await resolver.resolve(request)
+            await subdomain_resolver.resolve(request)
         assert "host" in exc_info.value.reason.lower()
 
     async def test_falls_back_to_host_when_forwarded_empty(
@@ -266,189 +349,135 @@ class TestPathTenantResolver:
         resolver = PathTenantResolver(store)
         assert resolver._prefix == "/tenants"
 
-    async def test_resolves_valid_path(self, store: InMemoryTenantStore) -> None:
-        resolver = PathTenantResolver(store, path_prefix="/tenants")
-        request = _make_request(path="/tenants/acme-corp/orders")
-        tenant = await resolver.resolve(request)
-        assert tenant.identifier == "acme-corp"
-
     async def test_custom_prefix(self, store: InMemoryTenantStore) -> None:
         resolver = PathTenantResolver(store, path_prefix="/orgs")
         request = _make_request(path="/orgs/widgets-inc/projects")
         tenant = await resolver.resolve(request)
         assert tenant.identifier == "widgets-inc"
 
-    async def test_path_not_matching_prefix_raises(self, store: InMemoryTenantStore) -> None:
-        resolver = PathTenantResolver(store, path_prefix="/tenants")
+    async def test_path_not_matching_prefix_raises(self, path_resolver: PathTenantResolver) -> None:
         request = _make_request(path="/api/users")
         with pytest.raises(TenantResolutionError) as exc_info:
-            await resolver.resolve(request)
+            await path_resolver.resolve(request)
         assert "does not start with" in exc_info.value.reason.lower()
 
-    async def test_empty_identifier_after_prefix_raises(self, store: InMemoryTenantStore) -> None:
-        resolver = PathTenantResolver(store, path_prefix="/tenants")
+    async def test_empty_identifier_after_prefix_raises(
+        self, path_resolver: PathTenantResolver
+    ) -> None:
         request = _make_request(path="/tenants/")
         with pytest.raises(TenantResolutionError) as exc_info:
-            await resolver.resolve(request)
+            await path_resolver.resolve(request)
         assert "identifier" in exc_info.value.reason.lower()
 
-    async def test_invalid_identifier_raises(self, store: InMemoryTenantStore) -> None:
-        resolver = PathTenantResolver(store, path_prefix="/tenants")
-        request = _make_request(path="/tenants/INVALID_SLUG/resource")
-        with pytest.raises(TenantResolutionError) as exc_info:
-            await resolver.resolve(request)
-        assert "valid tenant identifier" in exc_info.value.reason.lower()
-
-    async def test_unknown_tenant_raises_not_found(self, store: InMemoryTenantStore) -> None:
-        resolver = PathTenantResolver(store, path_prefix="/tenants")
-        request = _make_request(path="/tenants/nonexistent-co/resource")
-        with pytest.raises(TenantNotFoundError):
-            await resolver.resolve(request)
-
-    async def test_sets_path_remainder_on_state(self, store: InMemoryTenantStore) -> None:
-        resolver = PathTenantResolver(store, path_prefix="/tenants")
+    async def test_sets_path_remainder_on_state(self, path_resolver: PathTenantResolver) -> None:
         request = _make_request(path="/tenants/acme-corp/orders/123")
-        await resolver.resolve(request)
+        await path_resolver.resolve(request)
         assert request.state.tenant_path_remainder == "/orders/123"
 
     async def test_remainder_defaults_to_slash_when_no_suffix(
-        self, store: InMemoryTenantStore
+        self, path_resolver: PathTenantResolver
     ) -> None:
-        resolver = PathTenantResolver(store, path_prefix="/tenants")
         request = _make_request(path="/tenants/acme-corp")
-        await resolver.resolve(request)
+        await path_resolver.resolve(request)
         assert request.state.tenant_path_remainder == "/"
 
-    def test_strategy_on_resolution_error(self, store: InMemoryTenantStore) -> None:
+    async def test_strategy_on_resolution_error(self, store: InMemoryTenantStore) -> None:
         resolver = PathTenantResolver(store)
         request = _make_request(path="/wrong")
         with pytest.raises(TenantResolutionError) as exc_info:
-            asyncio.get_event_loop().run_until_complete(resolver.resolve(request))
+            await resolver.resolve(request)
         assert exc_info.value.strategy == "path"
 
 
 class TestJWTTenantResolver:
-    def test_init_stores_secret(self, store: InMemoryTenantStore) -> None:
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
-        assert resolver._secret == _JWT_SECRET
+    def test_init_stores_secret(self, jwt_resolver: JWTTenantResolver) -> None:
+        assert jwt_resolver._secret == _JWT_SECRET
 
-    def test_init_default_algorithm_hs256(self, store: InMemoryTenantStore) -> None:
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
-        assert resolver._algorithm == "HS256"
+    def test_init_default_algorithm_hs256(self, jwt_resolver: JWTTenantResolver) -> None:
+        assert jwt_resolver._algorithm == "HS256"
 
     def test_init_custom_algorithm(self, store: InMemoryTenantStore) -> None:
         resolver = JWTTenantResolver(store, secret=_JWT_SECRET, algorithm="HS512")
         assert resolver._algorithm == "HS512"
 
-    def test_init_default_claim_is_tenant_id(self, store: InMemoryTenantStore) -> None:
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
-        assert resolver._tenant_claim == "tenant_id"
+    def test_init_default_claim_is_tenant_id(self, jwt_resolver: JWTTenantResolver) -> None:
+        assert jwt_resolver._tenant_claim == "tenant_id"
 
     def test_init_custom_claim(self, store: InMemoryTenantStore) -> None:
         resolver = JWTTenantResolver(store, secret=_JWT_SECRET, tenant_claim="org")
         assert resolver._tenant_claim == "org"
 
-    def test_decode_token_valid(self, store: InMemoryTenantStore) -> None:
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
-        token = pyjwt.encode({"tenant_id": "acme-corp"}, _JWT_SECRET, algorithm="HS256")
-        payload = resolver._decode_token(token)
+    def test_import_error_when_pyjwt_missing(self, store: InMemoryTenantStore) -> None:
+        # PyJWT is imported lazily in __init__, so hiding it from sys.modules
+        # exercises the ImportError path without reloading the module.
+        with (
+            patch.dict("sys.modules", {"jwt": None}),
+            pytest.raises(ImportError, match="pip install 'fastapi-tenancy\\[jwt\\]'"),
+        ):
+            JWTTenantResolver(store, secret=_JWT_SECRET)
+
+    def test_decode_token_valid(self, jwt_resolver: JWTTenantResolver) -> None:
+        token = _token({"tenant_id": "acme-corp"})
+        payload = jwt_resolver._decode_token(token)
         assert payload["tenant_id"] == "acme-corp"
 
-    def test_decode_token_expired_raises(self, store: InMemoryTenantStore) -> None:
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
+    def test_decode_token_expired_raises(self, jwt_resolver: JWTTenantResolver) -> None:
         # Create token with exp in the past
-        token = pyjwt.encode(
-            {"tenant_id": "acme-corp", "exp": int(time.time()) - 3600},
-            _JWT_SECRET,
-            algorithm="HS256",
+        token = _token(
+            {"tenant_id": "acme-corp", "exp": int((NOW - timedelta(hours=1)).timestamp())}
         )
         with pytest.raises(TenantResolutionError) as exc_info:
-            resolver._decode_token(token)
+            jwt_resolver._decode_token(token)
         assert "expired" in exc_info.value.reason.lower()
 
-    def test_decode_token_invalid_signature_raises(self, store: InMemoryTenantStore) -> None:
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
+    def test_decode_token_invalid_signature_raises(self, jwt_resolver: JWTTenantResolver) -> None:
         with pytest.raises(TenantResolutionError) as exc_info:
-            resolver._decode_token("not.a.jwt")
+            jwt_resolver._decode_token("not.a.jwt")
         assert "invalid" in exc_info.value.reason.lower()
 
-    async def test_resolve_no_authorization_header(self, store: InMemoryTenantStore) -> None:
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
+    async def test_resolve_no_authorization_header(self, jwt_resolver: JWTTenantResolver) -> None:
         request = _make_request(headers={})
         with pytest.raises(TenantResolutionError) as exc_info:
-            await resolver.resolve(request)
+            await jwt_resolver.resolve(request)
         assert "authorization header is missing" in exc_info.value.reason.lower()
 
-    async def test_resolve_non_bearer_scheme(self, store: InMemoryTenantStore) -> None:
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
+    async def test_resolve_non_bearer_scheme(self, jwt_resolver: JWTTenantResolver) -> None:
         request = _make_request(headers={"Authorization": "Basic dXNlcjpwYXNz"})
         with pytest.raises(TenantResolutionError) as exc_info:
-            await resolver.resolve(request)
+            await jwt_resolver.resolve(request)
         assert "bearer" in exc_info.value.reason.lower()
 
-    async def test_resolve_empty_bearer_token(self, store: InMemoryTenantStore) -> None:
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
+    async def test_resolve_empty_bearer_token(self, jwt_resolver: JWTTenantResolver) -> None:
         request = _make_request(headers={"Authorization": "Bearer "})
         with pytest.raises(TenantResolutionError) as exc_info:
-            await resolver.resolve(request)
+            await jwt_resolver.resolve(request)
         assert "empty" in exc_info.value.reason.lower()
 
-    async def test_resolve_missing_tenant_claim(self, store: InMemoryTenantStore) -> None:
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
-        token = pyjwt.encode({"user_id": "u123"}, _JWT_SECRET, algorithm="HS256")
-        request = _make_request(headers={"Authorization": f"Bearer {token}"})  # type: ignore[str-bytes-safe]
+    async def test_resolve_missing_tenant_claim(self, jwt_resolver: JWTTenantResolver) -> None:
+        token = _token({"user_id": "u123"})
+        request = _make_request(headers={"Authorization": f"Bearer {token}"})
         with pytest.raises(TenantResolutionError) as exc_info:
-            await resolver.resolve(request)
+            await jwt_resolver.resolve(request)
         assert "tenant_id" in exc_info.value.reason
 
-    async def test_resolve_claim_not_string(self, store: InMemoryTenantStore) -> None:
+    async def test_resolve_claim_not_string(self, jwt_resolver: JWTTenantResolver) -> None:
         """If the claim is an integer rather than a string, resolution must fail."""
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
-        token = pyjwt.encode({"tenant_id": 42}, _JWT_SECRET, algorithm="HS256")
-        request = _make_request(headers={"Authorization": f"Bearer {token}"})  # type: ignore[str-bytes-safe]
+        token = _token({"tenant_id": 42})
+        request = _make_request(headers={"Authorization": f"Bearer {token}"})
         with pytest.raises(TenantResolutionError):
-            await resolver.resolve(request)
-
-    async def test_resolve_invalid_identifier_slug(self, store: InMemoryTenantStore) -> None:
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
-        token = pyjwt.encode({"tenant_id": "UPPER-CASE!!"}, _JWT_SECRET, algorithm="HS256")
-        request = _make_request(headers={"Authorization": f"Bearer {token}"})  # type: ignore[str-bytes-safe]
-        with pytest.raises(TenantResolutionError) as exc_info:
-            await resolver.resolve(request)
-        assert "invalid" in exc_info.value.reason.lower()
-
-    async def test_resolve_valid_jwt(self, store: InMemoryTenantStore) -> None:
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
-        token = pyjwt.encode(
-            {"tenant_id": "acme-corp", "user_id": "u123"},
-            _JWT_SECRET,
-            algorithm="HS256",
-        )
-        request = _make_request(headers={"Authorization": f"Bearer {token}"})  # type: ignore[str-bytes-safe]
-        tenant = await resolver.resolve(request)
-        assert tenant.identifier == "acme-corp"
-
-    async def test_resolve_unknown_tenant_raises_not_found(
-        self, store: InMemoryTenantStore
-    ) -> None:
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
-        token = pyjwt.encode({"tenant_id": "no-such-tenant"}, _JWT_SECRET, algorithm="HS256")
-        request = _make_request(headers={"Authorization": f"Bearer {token}"})  # type: ignore[str-bytes-safe]
-        with pytest.raises(TenantNotFoundError):
-            await resolver.resolve(request)
+            await jwt_resolver.resolve(request)
 
     async def test_resolve_custom_claim(self, store: InMemoryTenantStore) -> None:
         resolver = JWTTenantResolver(store, secret=_JWT_SECRET, tenant_claim="org")
-        token = pyjwt.encode({"org": "widgets-inc"}, _JWT_SECRET, algorithm="HS256")
-        request = _make_request(headers={"Authorization": f"Bearer {token}"})  # type: ignore[str-bytes-safe]
+        token = _token({"org": "widgets-inc"})
+        request = _make_request(headers={"Authorization": f"Bearer {token}"})
         tenant = await resolver.resolve(request)
         assert tenant.identifier == "widgets-inc"
 
-    def test_strategy_on_resolution_error(self, store: InMemoryTenantStore) -> None:
-        resolver = JWTTenantResolver(store, secret=_JWT_SECRET)
+    async def test_strategy_on_resolution_error(self, jwt_resolver: JWTTenantResolver) -> None:
         request = _make_request(headers={})
         with pytest.raises(TenantResolutionError) as exc_info:
-            asyncio.get_event_loop().run_until_complete(resolver.resolve(request))
+            await jwt_resolver.resolve(request)
         assert exc_info.value.strategy == "jwt"
 
 
@@ -470,18 +499,6 @@ class TestBaseTenantResolver:
 class TestHeaderResolverEnumeration:
     """FIX: Missing header, invalid format, and unknown tenant all return the same reason."""
 
-    def _make_request(self, headers: dict[str, str]) -> Any:
-        from starlette.requests import Request  # noqa: PLC0415
-
-        scope = {
-            "type": "http",
-            "method": "GET",
-            "path": "/",
-            "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
-            "query_string": b"",
-        }
-        return Request(scope)
-
     async def test_missing_header_raises_resolution_error(self) -> None:
         store = InMemoryTenantStore()
         resolver = HeaderTenantResolver(store)
@@ -540,9 +557,9 @@ class TestJWTAudienceValidation:
     audience= is configured, preventing cross-service token replay."""
 
     @pytest.fixture
-    async def seeded_store(self) -> InMemoryTenantStore:
+    def seeded_store(self) -> InMemoryTenantStore:
         s = InMemoryTenantStore()
-        await s.create(_make_tenant("aud-tenant"))
+        s.populate([_AUD_TENANT])
         return s
 
     def _token(
@@ -554,7 +571,7 @@ class TestJWTAudienceValidation:
         payload: dict[str, str] = {"tenant_id": identifier}
         if audience is not None:
             payload["aud"] = audience
-        return str(pyjwt.encode(payload, secret, algorithm="HS256"))
+        return _token(payload, secret)
 
     async def test_valid_audience_resolves_tenant(self, seeded_store: InMemoryTenantStore) -> None:
         """Token with matching aud claim must resolve successfully."""